@@ -1,8 +1,11 @@
 from django.contrib import admin
-from django.db.models import Count
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import Count, Exists, OuterRef
 from django.utils.html import format_html
 
-from .models import Author, AuthorReview
+from films.models import Film
+
+from .models import Author, AuthorReview, full_name_expression
 
 
 class AuthorReviewInline(admin.TabularInline):
@@ -12,8 +15,6 @@ class AuthorReviewInline(admin.TabularInline):
 
 
 class FilmInline(admin.TabularInline):
-    from films.models import Film
-
     model = Film.authors.through
     extra = 0
     verbose_name = "Film"
@@ -36,10 +37,12 @@ class HasFilmFilter(admin.SimpleListFilter):
         )
 
     def queryset(self, request, queryset):
+        # EXISTS subquery: no GROUP BY, and the changelist COUNT(*) stays a plain count
+        has_films = Exists(Film.objects.filter(authors=OuterRef("pk")))
         if self.value() == "yes":
-            return queryset.annotate(num_films=Count("films")).filter(num_films__gt=0)
+            return queryset.filter(has_films)
         if self.value() == "no":
-            return queryset.annotate(num_films=Count("films")).filter(num_films=0)
+            return queryset.filter(~has_films)
         return queryset
 
 
@@ -69,8 +72,10 @@ class AuthorAdmin(admin.ModelAdmin):
         if db_field.name == "user":
             from users.models import CustomUser
 
-            kwargs["queryset"] = CustomUser.objects.filter(role__in=["admin", "author"]).exclude(
-                author_profile__isnull=False
+            # NOT EXISTS on the unique author.user_id index rather than a LEFT JOIN ... IS NULL
+            kwargs["queryset"] = CustomUser.objects.filter(
+                ~Exists(Author.objects.filter(user=OuterRef("pk"))),
+                role__in=["admin", "author"],
             )
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
@@ -94,21 +99,31 @@ class AuthorAdmin(admin.ModelAdmin):
             )
         return "No photo"
 
+    def get_queryset(self, request):
+        # Names, film counts and film titles are computed in the same query (no per-row queries)
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(
+                full_name_db=full_name_expression(),
+                _films_count=Count("films"),
+                _films_titles=StringAgg("films__title", delimiter=", ", ordering="-films__release_date"),
+            )
+        )
+
     @admin.display(description="Full name", ordering="user__last_name")
     def full_name(self, obj):
         """Display the full name (first name + last name) instead of the username."""
-        first = obj.user.first_name or ""
-        last = obj.user.last_name or ""
-        full = f"{first} {last}".strip()
-        return full if full else obj.user.username
+        return obj.full_name
 
     @admin.display(description="Username")
     def username(self, obj):
         return obj.user.username
 
-    @admin.display(description="Number of films")
+    @admin.display(description="Number of films", ordering="_films_count")
     def count_films(self, obj):
-        return obj.films.count()
+        return obj._films_count
 
     # To display the list of films in the detail view (read-only or via a custom inline if needed)
     # Here we use a method to display the titles in the form
@@ -116,7 +131,10 @@ class AuthorAdmin(admin.ModelAdmin):
 
     @admin.display(description="Associated films")
     def display_films(self, obj):
-        return ", ".join([film.title for film in obj.films.all()])
+        if hasattr(obj, "_films_titles"):
+            return obj._films_titles or ""
+        # Same order as the StringAgg annotation, without building Film instances
+        return ", ".join(obj.films.order_by("-release_date").values_list("title", flat=True))
 
 
 @admin.register(AuthorReview)
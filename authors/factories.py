@@ -1,3 +1,5 @@
+from datetime import date, timedelta
+
 import factory
 
 from authors.models import Author
@@ -10,5 +12,5 @@ class AuthorFactory(factory.django.DjangoModelFactory):
         model = Author
 
     user = factory.SubFactory(UserFactory, role=Role.AUTHOR)
-    bio = factory.Faker("text")
-    date_of_birth = factory.Faker("date_object")
+    bio = factory.Sequence(lambda n: f"Biography of author {n}.")
+    date_of_birth = factory.Sequence(lambda n: date(1950, 1, 1) + timedelta(days=n))
@@ -0,0 +1,14 @@
+import django_filters
+
+from .models import Author
+
+
+class AuthorFilter(django_filters.FilterSet):
+    """
+    Exact-match `?source=` filter.
+    Declared once here: with `filterset_fields`, DjangoFilterBackend builds a new FilterSet class on every request.
+    """
+
+    class Meta:
+        model = Author
+        fields = ["source"]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:27
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authors", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="authorreview",
+            name="rating",
+            field=models.PositiveSmallIntegerField(
+                validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)]
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="authorreview",
+            constraint=models.CheckConstraint(
+                check=models.Q(("rating__gte", 1), ("rating__lte", 5)), name="author_review_rating_range"
+            ),
+        ),
+    ]
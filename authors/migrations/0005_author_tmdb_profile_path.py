@@ -0,0 +1,18 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authors", "0004_authorreview_rating_smallint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="tmdb_profile_path",
+            field=models.CharField(blank=True, default="", editable=False, max_length=255),
+        ),
+    ]
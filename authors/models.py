@@ -1,10 +1,29 @@
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import CharField, Q, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 
 from core.models import TimestampedModelMixin
 
 
+def full_name_expression(prefix: str = ""):
+    """
+    SQL equivalent of Author.full_name, to annotate as `full_name_db`.
+    `prefix` is the lookup path to the author (e.g. "author__" from AuthorReview).
+    """
+    return Coalesce(
+        NullIf(
+            Trim(Concat(f"{prefix}user__first_name", Value(" "), f"{prefix}user__last_name")),
+            Value(""),
+        ),
+        f"{prefix}user__username",
+        output_field=CharField(),
+    )
+
+
 class Author(TimestampedModelMixin):
 
     SOURCE_CHOICES = [
@@ -24,6 +43,8 @@ class Author(TimestampedModelMixin):
     tmdb_id = models.IntegerField(unique=True, null=True, blank=True)
     source = models.CharField(max_length=10, choices=SOURCE_CHOICES, default="ADMIN")
     photo = models.ImageField(upload_to="author_photos/", null=True, blank=True)
+    # TMDb path the stored photo was downloaded from, to skip unchanged photos on re-import
+    tmdb_profile_path = models.CharField(max_length=255, blank=True, default="", editable=False)
 
     class Meta:
         verbose_name = "Auteur"
@@ -32,6 +53,10 @@ class Author(TimestampedModelMixin):
 
     @property
     def full_name(self):
+        # Prefer the value computed in SQL when the queryset was annotated with full_name_expression()
+        annotated = getattr(self, "full_name_db", None)
+        if annotated is not None:
+            return annotated
         return self.user.get_full_name() or self.user.username
 
     def __str__(self):
@@ -40,7 +65,7 @@ class Author(TimestampedModelMixin):
     def clean(self):
         """Ensure that only admins and authors can have an Author profile."""
         super().clean()
-        if self.user and self.user.role == "spectator":
+        if self._user_is_spectator():
             raise ValidationError(
                 {
                     "user": "A spectator cannot have an Author profile. "
@@ -48,16 +73,30 @@ class Author(TimestampedModelMixin):
                 }
             )
 
-    def save(self, *args, **kwargs):
-        """Override save to call clean() before saving."""
-        self.clean()
+    def _user_is_spectator(self) -> bool:
+        if not self.user_id:
+            return False
+        # Use the loaded user when available, otherwise an indexed PK lookup instead of fetching the whole row
+        if Author.user.is_cached(self):
+            return self.user.role == "spectator"
+        return get_user_model().objects.filter(pk=self.user_id, role="spectator").exists()
+
+    def save(self, *args, skip_clean=False, **kwargs):
+        """
+        Override save to call clean() before saving.
+        Bulk/ETL callers that already guarantee the user's role may pass skip_clean=True.
+        Serializer writes still go through this validation.
+        """
+        if not skip_clean:
+            self.clean()
         super().save(*args, **kwargs)
 
 
 class AuthorReview(TimestampedModelMixin):
     author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="reviews")
     user = models.ForeignKey("spectators.Spectator", on_delete=models.CASCADE, related_name="author_reviews")
-    rating = models.IntegerField(choices=[(i, i) for i in range(1, 6)])
+    # smallint like FilmReview.rating; range enforced by the database (see Meta.constraints)
+    rating = models.PositiveSmallIntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
     comment = models.TextField(blank=True)
 
     class Meta:
@@ -68,6 +107,9 @@ class AuthorReview(TimestampedModelMixin):
             # For listing reviews of an author sorted by date
             models.Index(fields=["author", "-created_at"], name="author_review_date_idx"),
         ]
+        constraints = [
+            models.CheckConstraint(check=Q(rating__gte=1, rating__lte=5), name="author_review_rating_range"),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.author} ({self.rating}/5)"
@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import serializers
 
 from films.models import Film
@@ -21,14 +22,16 @@ class AuthorSerializer(serializers.ModelSerializer):
     # Flattened user fields for a cleaner structure (read-only)
     user_id = serializers.IntegerField(source="user.id", read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
-    # Modifiable User fields (not linked to source to avoid conflicts)
-    first_name = serializers.CharField(required=False, allow_blank=True)
-    last_name = serializers.CharField(required=False, allow_blank=True)
-    email = serializers.EmailField(required=False)
-    # User field for writing (creation only)
-    user = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all(), write_only=True, required=False)
-    # Films by this author
-    films = FilmNestedSerializer(many=True, read_only=True)
+    # Modifiable User fields, read from and written to the related user
+    first_name = serializers.CharField(source="user.first_name", required=False, allow_blank=True)
+    last_name = serializers.CharField(source="user.last_name", required=False, allow_blank=True)
+    email = serializers.EmailField(source="user.email", required=False)
+    # User field for writing (creation only); kept under its own key, "user" holds the user fields above
+    user = serializers.PrimaryKeyRelatedField(
+        queryset=CustomUser.objects.all(), source="user_pk", write_only=True, required=False
+    )
+    # Films by this author (pre-aggregated as JSON by the viewset queryset)
+    films = serializers.SerializerMethodField()
 
     class Meta:
         model = Author
@@ -59,41 +62,52 @@ class AuthorSerializer(serializers.ModelSerializer):
             "username",
         ]
 
-    def to_representation(self, instance):
-        """Customize output to show user fields."""
-        data = super().to_representation(instance)
-        # Override with actual user data
-        data["first_name"] = instance.user.first_name
-        data["last_name"] = instance.user.last_name
-        data["email"] = instance.user.email
-        return data
+    def get_films(self, obj) -> list[dict]:
+        """Return the films aggregated in SQL, falling back to a query for non-annotated instances."""
+        films_data = getattr(obj, "films_data", None)
+        if films_data is not None:
+            return films_data
+        return list(FilmNestedSerializer(obj.films.all(), many=True).data)
+
+    def validate(self, attrs):
+        if self.instance is None and "user_pk" not in attrs:
+            raise serializers.ValidationError({"user": "This field is required."})
+        return attrs
+
+    def create(self, validated_data):
+        """Create the author for the given user, applying the user fields to that user."""
+        user = validated_data.pop("user_pk")
+        with transaction.atomic():
+            self._update_user(user, validated_data.pop("user", {}))
+            return super().create({**validated_data, "user": user})
 
     def update(self, instance, validated_data):
         """Override update to handle user fields."""
-        # Remove user from validated_data (it's the PK reference for create)
-        validated_data.pop("user", None)
-
-        # Extract user fields
-        user_fields = {}
-        for field in ["first_name", "last_name", "email"]:
-            if field in validated_data:
-                user_fields[field] = validated_data.pop(field)
-
-        # Update user fields if provided
-        if user_fields:
-            for key, value in user_fields.items():
-                setattr(instance.user, key, value)
-            instance.user.save()
-
-        # Update author fields
-        return super().update(instance, validated_data)
+        # A user PK is only meaningful for creation and is ignored here
+        validated_data.pop("user_pk", None)
+        with transaction.atomic():
+            self._update_user(instance.user, validated_data.pop("user", {}))
+            return super().update(instance, validated_data)
+
+    @staticmethod
+    def _update_user(user, user_fields: dict) -> None:
+        """Write the nested user fields (first_name, last_name, email) to the related user."""
+        if not user_fields:
+            return
+        for key, value in user_fields.items():
+            setattr(user, key, value)
+        user.save()
 
 
 class AuthorReviewSerializer(serializers.ModelSerializer):
     user: serializers.StringRelatedField = serializers.StringRelatedField(read_only=True)  # type: ignore[assignment]
-    author_name = serializers.CharField(source="author.full_name", read_only=True)
+    author_name = serializers.SerializerMethodField()
 
     class Meta:
         model = AuthorReview
         fields = ["id", "author", "author_name", "user", "rating", "comment", "created_at"]
         read_only_fields = ["user", "created_at", "author_name"]
+
+    def get_author_name(self, obj) -> str:
+        """Use the name annotated by the viewset queryset, falling back to the author property."""
+        return getattr(obj, "author_full_name", None) or obj.author.full_name
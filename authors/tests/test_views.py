@@ -10,22 +10,106 @@ from films.factories import FilmFactory
 from spectators.factories import SpectatorFactory
 from users.factories import AdminUserFactory, AuthorUserFactory, UserFactory
 
+# Resolved once at import rather than in every test
+AUTHOR_LIST_URL = reverse("author-list")
+AUTHOR_LITE_URL = reverse("author-lite")
+AUTHOR_REVIEW_LIST_URL = reverse("authorreview-list")
+
 
 @pytest.mark.django_db
 class TestAuthorViewSet:
 
     def test_list_authors(self, api_client):
         AuthorFactory.create_batch(3)
-        url = reverse("author-list")
+        url = AUTHOR_LIST_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
+    def test_list_authors_served_from_cache(self, api_client, django_assert_num_queries):
+        AuthorFactory.create_batch(2)
+        url = AUTHOR_LIST_URL
+        first = api_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+        assert second.status_code == status.HTTP_200_OK
+        assert second["Content-Type"] == "application/json"
+        assert second.json() == first.json()
+
+    def test_list_authors_review_aggregates(self, api_client):
+        reviewed = AuthorFactory()
+        unreviewed = AuthorFactory()
+        AuthorReview.objects.bulk_create(
+            [
+                AuthorReview(author=reviewed, user=spectator, rating=rating)
+                for spectator, rating in zip(SpectatorFactory.create_batch_bulk(2), [5, 2], strict=True)
+            ]
+        )
+
+        url = AUTHOR_LIST_URL
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        results = {item["id"]: item for item in response.data["results"]}
+        assert results[reviewed.id]["average_rating"] == 3.5
+        assert results[reviewed.id]["reviews_count"] == 2
+        assert results[unreviewed.id]["average_rating"] is None
+        assert results[unreviewed.id]["reviews_count"] == 0
+
+    def test_list_authors_includes_films(self, api_client):
+        author = AuthorFactory()
+        film = FilmFactory(title="Nested Film", release_date="2020-05-17", authors=[author])
+        AuthorFactory()
+
+        url = AUTHOR_LIST_URL
+        response = api_client.get(url, {"search": author.user.username})
+        assert response.status_code == status.HTTP_200_OK
+        films = response.data["results"][0]["films"]
+        assert films == [
+            {
+                "id": film.id,
+                "title": "Nested Film",
+                "release_date": "2020-05-17",
+                "status": film.status,
+                "tmdb_id": None,
+            }
+        ]
+
+    def test_list_authors_lite(self, api_client):
+        first = AuthorFactory(user__last_name="Alpha")
+        AuthorFactory(user__last_name="Zulu")
+        film = FilmFactory(title="Lite Film", authors=[first])
+
+        url = AUTHOR_LITE_URL
+        response = api_client.get(url, {"limit": 1})
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        assert response.json() == [
+            {
+                "id": first.id,
+                "username": first.user.username,
+                "first_name": first.user.first_name,
+                "last_name": "Alpha",
+                "bio": first.bio,
+                "films": [{"id": film.id, "title": "Lite Film"}],
+            }
+        ]
+
+        response = api_client.get(url, {"offset": 1})
+        assert [author["last_name"] for author in response.json()] == ["Zulu"]
+        assert response.json()[0]["films"] == []
+
+    def test_list_authors_lite_invalid_limit(self, api_client):
+        url = AUTHOR_LITE_URL
+        response = api_client.get(url, {"limit": "abc"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_list_authors_filter_source(self, api_client):
         AuthorFactory(tmdb_id=123, source="TMDB")
         AuthorFactory(tmdb_id=None, source="ADMIN")
 
-        url = reverse("author-list")
+        url = AUTHOR_LIST_URL
 
         # Test tmdb source
         response = api_client.get(url, {"source": "TMDB"})
@@ -45,19 +129,18 @@ class TestAuthorViewSet:
         author_user = AuthorUserFactory()
         api_client.force_authenticate(user=admin)
 
-        url = reverse("author-list")
+        url = AUTHOR_LIST_URL
         data = {"user": author_user.id, "bio": "A great author", "source": "ADMIN"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert Author.objects.count() == 1
-        assert Author.objects.first().bio == "A great author"
+        assert list(Author.objects.values_list("bio", flat=True)) == ["A great author"]
 
     def test_create_author_non_admin_forbidden(self, api_client):
         """Test that non-admin users cannot create authors."""
         user = UserFactory()
         api_client.force_authenticate(user=user)
 
-        url = reverse("author-list")
+        url = AUTHOR_LIST_URL
         data = {"bio": "A great author"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -74,17 +157,57 @@ class TestAuthorViewSet:
         author.refresh_from_db()
         assert author.bio == "New bio"
 
+    def test_update_author_user_fields(self, admin_api_client):
+        """Test that user fields are written to the related user."""
+        author = AuthorFactory()
+
+        url = reverse("author-detail", args=[author.id])
+        response = admin_api_client.patch(url, {"first_name": "Agnes", "email": "agnes@example.com"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["first_name"] == "Agnes"
+        author.user.refresh_from_db()
+        assert author.user.first_name == "Agnes"
+        assert author.user.email == "agnes@example.com"
+
+    def test_update_author_user_fields_with_user_pk(self, admin_api_client):
+        """Test that a user PK sent alongside the user fields does not swallow them."""
+        author = AuthorFactory()
+        user_id = author.user_id
+
+        url = reverse("author-detail", args=[author.id])
+        response = admin_api_client.patch(url, {"user": AuthorUserFactory().id, "first_name": "Agnes"})
+        assert response.status_code == status.HTTP_200_OK
+        author.refresh_from_db()
+        assert author.user_id == user_id
+        assert author.user.first_name == "Agnes"
+
+    def test_create_author_with_user_fields(self, admin_api_client):
+        """Test that user fields sent on creation are written to the chosen user."""
+        author_user = AuthorUserFactory()
+
+        response = admin_api_client.post(AUTHOR_LIST_URL, {"user": author_user.id, "first_name": "Agnes"})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["first_name"] == "Agnes"
+        author_user.refresh_from_db()
+        assert author_user.first_name == "Agnes"
+
+    def test_create_author_user_fields_without_user(self, admin_api_client):
+        """Test that creating an author without a user is a validation error, not a server error."""
+        response = admin_api_client.post(AUTHOR_LIST_URL, {"first_name": "Agnes", "bio": "A great author"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Author.objects.exists()
+
     def test_create_author_review(self, api_client):
         author = AuthorFactory()
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
 
-        url = reverse("authorreview-list")
+        url = AUTHOR_REVIEW_LIST_URL
         data = {"author": author.id, "rating": 5, "comment": "Great author!"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert AuthorReview.objects.count() == 1
-        assert AuthorReview.objects.first().user == spectator
+        assert list(AuthorReview.objects.values_list("user_id", flat=True)) == [spectator.id]
+        assert response.data["user"] == spectator.user.username
 
     def test_create_author_review_non_spectator_forbidden(self, api_client):
         """Test that non-spectator users cannot create author reviews."""
@@ -92,13 +215,23 @@ class TestAuthorViewSet:
         user = UserFactory()  # User without spectator profile
         api_client.force_authenticate(user=user)
 
-        url = reverse("authorreview-list")
+        url = AUTHOR_REVIEW_LIST_URL
         data = {"author": author.id, "rating": 5, "comment": "Great author!"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert response.data["success"] is False
         assert "SPECTATOR_REQUIRED" in response.data["error"]["code"]
 
+    def test_create_author_review_rating_out_of_range(self, api_client):
+        """Test that ratings outside 1-5 are rejected with a validation error."""
+        spectator = SpectatorFactory()
+        api_client.force_authenticate(user=spectator.user)
+
+        url = AUTHOR_REVIEW_LIST_URL
+        response = api_client.post(url, {"author": AuthorFactory().id, "rating": 0})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not AuthorReview.objects.exists()
+
     def test_update_author_review(self, api_client):
         """Test updating an author review."""
         spectator = SpectatorFactory()
@@ -113,6 +246,18 @@ class TestAuthorViewSet:
         assert review.rating == 5
         assert review.comment == "Excellent!"
 
+    def test_update_author_review_author_name(self, api_client):
+        """Test the returned author name follows a change of author."""
+        spectator = SpectatorFactory()
+        review = AuthorReview.objects.create(author=AuthorFactory(), user=spectator, rating=3)
+        other = AuthorFactory()
+        api_client.force_authenticate(user=spectator.user)
+
+        url = reverse("authorreview-detail", args=[review.id])
+        response = api_client.patch(url, {"author": other.id})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["author_name"] == other.full_name
+
     def test_delete_author_review(self, api_client):
         """Test deleting an author review."""
         spectator = SpectatorFactory()
@@ -125,28 +270,24 @@ class TestAuthorViewSet:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not AuthorReview.objects.filter(id=review.id).exists()
 
-    def test_delete_author_with_films(self, api_client):
+    def test_delete_author_with_films(self, admin_api_client):
         author = AuthorFactory()
         film = FilmFactory()
         film.authors.add(author)
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
 
         url = reverse("author-detail", args=[author.id])
-        response = api_client.delete(url)
+        response = admin_api_client.delete(url)
 
         assert response.status_code == status.HTTP_409_CONFLICT
         assert response.data["success"] is False
         assert response.data["error"]["code"] == "AUTHOR_HAS_FILMS"
         assert Author.objects.filter(id=author.id).exists()
 
-    def test_delete_author_without_films(self, api_client):
+    def test_delete_author_without_films(self, admin_api_client):
         author = AuthorFactory()
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
 
         url = reverse("author-detail", args=[author.id])
-        response = api_client.delete(url)
+        response = admin_api_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Author.objects.filter(id=author.id).exists()
@@ -156,46 +297,52 @@ class TestAuthorViewSet:
 class TestAuthorCacheInvalidation:
     """Tests for versioned cache invalidation."""
 
-    @patch("authors.views.increment_version")
-    def test_create_author_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when creating an author."""
-        admin = AdminUserFactory()
+    @patch("core.cache_utils.increment_version")
+    def test_create_author_invalidates_cache(
+        self, mock_increment, admin_api_client, django_capture_on_commit_callbacks
+    ):
+        """Test increment_version is called once the author creation commits."""
         author_user = AuthorUserFactory()
-        api_client.force_authenticate(user=admin)
-        url = reverse("author-list")
-        response = api_client.post(url, {"user": author_user.id, "bio": "Test", "source": "ADMIN"})
+        url = AUTHOR_LIST_URL
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(url, {"user": author_user.id, "bio": "Test", "source": "ADMIN"})
         assert response.status_code == status.HTTP_201_CREATED
         mock_increment.assert_called_once_with("authors:list")
 
-    @patch("authors.views.increment_version")
-    def test_update_author_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when updating an author."""
+    @patch("core.cache_utils.increment_version")
+    def test_update_author_invalidates_cache(
+        self, mock_increment, admin_api_client, django_capture_on_commit_callbacks
+    ):
+        """Test increment_version is called once the author update commits."""
         author = AuthorFactory(bio="Old bio")
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
         url = reverse("author-detail", args=[author.id])
-        response = api_client.patch(url, {"bio": "New bio"})
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.patch(url, {"bio": "New bio"})
         assert response.status_code == status.HTTP_200_OK
         mock_increment.assert_called_once_with("authors:list")
 
-    @patch("authors.views.increment_version")
-    def test_delete_author_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when deleting an author."""
+    @patch("core.cache_utils.increment_version")
+    def test_delete_author_invalidates_cache(
+        self, mock_increment, admin_api_client, django_capture_on_commit_callbacks
+    ):
+        """Test increment_version is called once the author deletion commits."""
         author = AuthorFactory()
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
         url = reverse("author-detail", args=[author.id])
-        response = api_client.delete(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.delete(url)
         assert response.status_code == status.HTTP_204_NO_CONTENT
         mock_increment.assert_called_once_with("authors:list")
 
-    @patch("authors.views.increment_version")
-    def test_create_author_review_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when creating an author review."""
+    @patch("core.cache_utils.increment_version")
+    def test_create_author_review_invalidates_cache(
+        self, mock_increment, api_client, django_capture_on_commit_callbacks
+    ):
+        """Test increment_version is called once the author review creation commits."""
         spectator = SpectatorFactory()
         author = AuthorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("authorreview-list")
-        response = api_client.post(url, {"author": author.id, "rating": 5, "comment": "Great!"})
+        url = AUTHOR_REVIEW_LIST_URL
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(url, {"author": author.id, "rating": 5, "comment": "Great!"})
         assert response.status_code == status.HTTP_201_CREATED
         mock_increment.assert_called_once_with("author_reviews:list")
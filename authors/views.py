@@ -1,34 +1,134 @@
-from django.core.cache import cache
-from django.db.models import Avg, Count
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import connection
+from django.db.models import Avg, Count, FloatField, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, JSONObject
+from django.http import HttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, viewsets
-from rest_framework.response import Response
+from rest_framework.decorators import action
+from rest_framework.settings import api_settings
 
-from core.cache_utils import build_list_cache_key, increment_version
-from core.exceptions import ConflictError
+from core.cache_utils import cached_list, invalidate_on_commit
+from core.exceptions import ConflictError, ValidationError
 from core.exceptions import PermissionError as APIPermissionError
 from core.permissions import IsAdminOrReadOnly
+from films.models import Film
+from spectators.models import Spectator
 
-from .models import Author, AuthorReview
+from .filters import AuthorFilter
+from .models import Author, AuthorReview, full_name_expression
 from .serializers import AuthorReviewSerializer, AuthorSerializer
 
 AUTHOR_CACHE_PREFIX = "authors:list"
 AUTHOR_REVIEW_CACHE_PREFIX = "author_reviews:list"
 CACHE_TIMEOUT = 60 * 15  # 15 minutes
+# Query parameters the list views actually read; anything else shares the cache entry
+AUTHOR_CACHE_PARAMS = frozenset({"source", "search", "ordering", "page", "page_size"})
+AUTHOR_REVIEW_CACHE_PARAMS = frozenset({"search", "page", "page_size"})
+LITE_MAX_LIMIT = 100
+
+# Authors with their films composed as JSON by Postgres, for the "lite" list (no model or serializer per row).
+# Table names are taken from model metadata; limit and offset are bound parameters.
+AUTHORS_LITE_SQL = f"""
+    SELECT COALESCE(json_agg(page.author ORDER BY page.last_name, page.first_name, page.id), '[]')::text
+    FROM (
+        SELECT
+            a.id,
+            u.last_name,
+            u.first_name,
+            json_build_object(
+                'id', a.id,
+                'username', u.username,
+                'first_name', u.first_name,
+                'last_name', u.last_name,
+                'bio', a.bio,
+                'films', COALESCE(
+                    (
+                        SELECT json_agg(json_build_object('id', f.id, 'title', f.title) ORDER BY f.id)
+                        FROM {Film._meta.db_table} f
+                        JOIN {Film.authors.through._meta.db_table} fa ON fa.film_id = f.id
+                        WHERE fa.author_id = a.id
+                    ),
+                    '[]'
+                )
+            ) AS author
+        FROM {Author._meta.db_table} a
+        JOIN {get_user_model()._meta.db_table} u ON u.id = a.user_id
+        ORDER BY u.last_name, u.first_name, a.id
+        LIMIT %s OFFSET %s
+    ) page
+"""
+
+
+def _query_int(request, name: str, default: int, maximum: int | None = None) -> int:
+    """Read a non-negative integer query parameter, capped at `maximum`."""
+    raw = request.query_params.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValidationError(detail=f"'{name}' must be an integer.") from None
+    if value < 0:
+        raise ValidationError(detail=f"'{name}' must be positive.")
+    return min(value, maximum) if maximum is not None else value
+
+
+# Films of an author aggregated as a JSON array directly in SQL (one ARRAY(SELECT ...) per row),
+# so the list endpoint neither runs a prefetch query nor hydrates Film instances.
+AUTHOR_FILMS_JSON = ArraySubquery(
+    Film.objects.filter(authors=OuterRef("pk")).values(
+        json=JSONObject(
+            id="id",
+            title="title",
+            release_date="release_date",
+            status="status",
+            tmdb_id="tmdb_id",
+        )
+    )
+)
+
+# Review aggregates as correlated scalar subqueries: the outer query stays flat (no JOIN + GROUP BY
+# over every author column), which also keeps the paginator's COUNT(*) cheap.
+_author_reviews = AuthorReview.objects.filter(author=OuterRef("pk")).order_by().values("author")
+AUTHOR_AVERAGE_RATING = Subquery(_author_reviews.annotate(avg=Avg("rating")).values("avg"), output_field=FloatField())
+AUTHOR_REVIEWS_COUNT = Coalesce(
+    Subquery(_author_reviews.annotate(count=Count("id")).values("count"), output_field=IntegerField()),
+    Value(0),
+)
 
 
 class AuthorViewSet(viewsets.ModelViewSet):
     # Optimization: select_related for the User (OneToOne)
     # Annotation for average and count calculations
-    # Prefetch films to avoid N+1
+    # Films aggregated in SQL to avoid N+1 and per-film serialization
     queryset = (
-        Author.objects.select_related("user")
-        .prefetch_related("films")
-        .annotate(
-            average_rating=Avg("reviews__rating"),
-            reviews_count=Count("reviews"),
+        Author.objects.select_related("user").annotate(
+            average_rating=AUTHOR_AVERAGE_RATING,
+            reviews_count=AUTHOR_REVIEWS_COUNT,
+            films_data=AUTHOR_FILMS_JSON,
+            full_name_db=full_name_expression(),
+        )
+        # Only the columns rendered by AuthorSerializer (+ user role, read by Author.clean() on save)
+        .only(
+            "id",
+            "date_of_birth",
+            "bio",
+            "tmdb_id",
+            "source",
+            "photo",
+            "created_at",
+            "updated_at",
+            "user__id",
+            "user__username",
+            "user__first_name",
+            "user__last_name",
+            "user__email",
+            "user__role",
         )
-        .all()
     )
     serializer_class = AuthorSerializer
     permission_classes = [IsAdminOrReadOnly]
@@ -37,24 +137,37 @@ class AuthorViewSet(viewsets.ModelViewSet):
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["source"]
+    filterset_class = AuthorFilter
     search_fields = ["user__username", "user__email", "bio"]
     ordering_fields = ["date_of_birth", "created_at"]
 
     def list(self, request, *args, **kwargs):
         """List authors with versioned caching."""
-        cache_key = build_list_cache_key(AUTHOR_CACHE_PREFIX, request)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return Response(cached)
+        return cached_list(
+            AUTHOR_CACHE_PREFIX,
+            request,
+            partial(super().list, request, *args, **kwargs),
+            self.get_renderer_context(),
+            CACHE_TIMEOUT,
+            AUTHOR_CACHE_PARAMS,
+        )
 
-        response = super().list(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=CACHE_TIMEOUT)
-        return response
+    @action(detail=False, methods=["get"], url_path="lite")
+    def lite(self, request):
+        """
+        Lightweight author list (id, names, bio and film titles) built entirely in SQL.
+        Paginated with `limit`/`offset`; the JSON array comes straight from Postgres.
+        """
+        limit = _query_int(request, "limit", api_settings.PAGE_SIZE, LITE_MAX_LIMIT)
+        offset = _query_int(request, "offset", 0)
+        with connection.cursor() as cursor:
+            cursor.execute(AUTHORS_LITE_SQL, [limit, offset])
+            payload = cursor.fetchone()[0]
+        return HttpResponse(payload, content_type="application/json")
 
     def _invalidate_author_cache(self):
-        """Invalidate the author list cache by incrementing version."""
-        increment_version(AUTHOR_CACHE_PREFIX)
+        """Invalidate the author list cache by incrementing version once the write commits."""
+        invalidate_on_commit(AUTHOR_CACHE_PREFIX)
 
     def perform_create(self, serializer):
         """Invalidate cache after creating an author."""
@@ -67,8 +180,11 @@ class AuthorViewSet(viewsets.ModelViewSet):
         self._invalidate_author_cache()
 
     def perform_destroy(self, instance):
-        # Allow deleting an authors only if they have no films (books) associated
-        if instance.films.exists():
+        # Allow deleting an authors only if they have no films (books) associated.
+        # get_object() goes through the annotated queryset, so reuse films_data instead of another query.
+        films_data = getattr(instance, "films_data", None)
+        has_films = bool(films_data) if films_data is not None else instance.films.exists()
+        if has_films:
             raise ConflictError(
                 detail="Impossible to delete an author who has associated films.",
                 code="AUTHOR_HAS_FILMS",
@@ -78,36 +194,58 @@ class AuthorViewSet(viewsets.ModelViewSet):
 
 
 class AuthorReviewViewSet(viewsets.ModelViewSet):
-    queryset = AuthorReview.objects.select_related("author", "user__user").all()
+    queryset = (
+        # The author's name comes from the annotation, so the author row itself is never selected:
+        # only its FK id plus the spectator's username are read from the joined tables
+        AuthorReview.objects.select_related("user__user")
+        .annotate(author_full_name=full_name_expression("author__"))
+        .only(
+            "id",
+            "rating",
+            "comment",
+            "created_at",
+            "updated_at",
+            "author",
+            "user__id",
+            "user__user__id",
+            "user__user__username",
+        )
+    )
     serializer_class = AuthorReviewSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def list(self, request, *args, **kwargs):
         """List author reviews with versioned caching."""
-        cache_key = build_list_cache_key(AUTHOR_REVIEW_CACHE_PREFIX, request)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return Response(cached)
-
-        response = super().list(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=CACHE_TIMEOUT)
-        return response
+        return cached_list(
+            AUTHOR_REVIEW_CACHE_PREFIX,
+            request,
+            partial(super().list, request, *args, **kwargs),
+            self.get_renderer_context(),
+            CACHE_TIMEOUT,
+            AUTHOR_REVIEW_CACHE_PARAMS,
+        )
 
     def _invalidate_author_review_cache(self):
-        """Invalidate the author reviews cache by incrementing version."""
-        increment_version(AUTHOR_REVIEW_CACHE_PREFIX)
+        """Invalidate the author reviews cache by incrementing version once the write commits."""
+        invalidate_on_commit(AUTHOR_REVIEW_CACHE_PREFIX)
 
     def perform_create(self, serializer):
-        if not hasattr(self.request.user, "spectator_profile"):
+        user = self.request.user
+        # Only the spectator id is needed to write the review, not the whole profile row
+        spectator_id = Spectator.objects.filter(user_id=user.id).values_list("pk", flat=True).first()
+        if spectator_id is None:
             raise APIPermissionError(
                 detail="Only spectators can leave a review.",
                 code="SPECTATOR_REQUIRED",
             )
-        serializer.save(user=self.request.user.spectator_profile)
+        serializer.save(user=Spectator(pk=spectator_id, user=user))
         self._invalidate_author_review_cache()
 
     def perform_update(self, serializer):
-        serializer.save()
+        review = serializer.save()
+        if "author" in serializer.validated_data:
+            # The annotated name belongs to the previous author
+            review.__dict__.pop("author_full_name", None)
         self._invalidate_author_review_cache()
 
     def perform_destroy(self, instance):
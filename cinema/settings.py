@@ -111,10 +111,14 @@ PERF_DISABLE_THROTTLE = config("PERF_DISABLE_THROTTLE", default=False, cast=bool
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("core.authentication.JWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": [
@@ -152,6 +156,14 @@ DATABASES = {
         "PASSWORD": config("POSTGRES_PASSWORD", default="cinema_password"),
         "HOST": config("POSTGRES_HOST", default="localhost"),
         "PORT": config("POSTGRES_PORT", default="5432"),
+        # Persistent connections: reuse the connection across requests instead of reconnecting each time,
+        # and validate it before reuse so a dropped socket is replaced transparently
+        "CONN_MAX_AGE": config("POSTGRES_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # Fail fast instead of hanging requests (and health checks) on an unreachable server
+            "connect_timeout": config("POSTGRES_CONNECT_TIMEOUT", default=5, cast=int),
+        },
     }
 }
 
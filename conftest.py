@@ -1,6 +1,30 @@
+import copy
+import os
+
 import pytest
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.test.utils import override_settings
 from rest_framework.test import APIClient
 
+from core.cache_utils import clear_local_cache
+from users.factories import AdminUserFactory
+
+# Set by pytest-xdist in each worker process ("gw0", "gw1", ...)
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolate_worker_cache():
+    # pytest-django already gives each xdist worker its own test database; Redis is shared, so prefix the keys
+    if not XDIST_WORKER:
+        yield
+        return
+    caches = copy.deepcopy(django_settings.CACHES)
+    caches["default"]["KEY_PREFIX"] = f"{caches['default'].get('KEY_PREFIX', '')}-{XDIST_WORKER}"
+    with override_settings(CACHES=caches):
+        yield
+
 
 @pytest.fixture(autouse=True)
 def disable_throttling(settings):
@@ -13,6 +37,37 @@ def disable_throttling(settings):
     settings.REST_FRAMEWORK = rest_framework_settings
 
 
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    # PBKDF2 is deliberately slow; tests only need passwords that round-trip
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+def _clear_cache():
+    # Versions restart at 1 after a clear, so the per-process copies would otherwise match the new keys
+    clear_local_cache()
+    if XDIST_WORKER:
+        # FLUSHDB would wipe the other workers' keys; only delete this worker's prefix
+        cache.delete_pattern("*")
+    else:
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # List endpoints cache rendered bodies; start every test from an empty cache
+    _clear_cache()
+    yield
+    _clear_cache()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
+
+
+@pytest.fixture
+def admin_api_client(db, api_client):
+    """API client authenticated as a new admin, for tests that never look at the admin itself."""
+    api_client.force_authenticate(user=AdminUserFactory())
+    return api_client
@@ -0,0 +1,31 @@
+import csv
+from itertools import chain
+
+from django.contrib import admin
+from django.http import StreamingHttpResponse
+
+# Rows fetched per round trip of the server-side cursor while streaming an export
+EXPORT_CHUNK_SIZE = 500
+
+
+class _Echo:
+    """File-like object for csv.writer that hands each formatted line back instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+@admin.action(description="Export selected as CSV")
+def export_as_csv(modeladmin, request, queryset):
+    """
+    Stream the selected rows as CSV, one line per row, with the columns listed in `modeladmin.csv_export_fields`.
+    Rows are read through a server-side cursor and written as they arrive, so memory does not grow with the export.
+    """
+    fields = modeladmin.csv_export_fields
+    writer = csv.writer(_Echo())
+    rows = queryset.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    response = StreamingHttpResponse(
+        chain([writer.writerow(fields)], (writer.writerow(row) for row in rows)), content_type="text/csv"
+    )
+    response["Content-Disposition"] = f'attachment; filename="{queryset.model._meta.model_name}_export.csv"'
+    return response
@@ -0,0 +1,40 @@
+"""Authentification JWT du projet."""
+
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication as BaseJWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+class JWTAuthentication(BaseJWTAuthentication):
+    """
+    simplejwt authentication that loads the user's spectator profile in the same query.
+
+    Views check `hasattr(request.user, "spectator_profile")` and then use the profile; with the reverse
+    one-to-one joined up front (and cached as missing for non-spectators) neither costs a query.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from None
+
+        try:
+            user = self.user_model.objects.select_related("spectator_profile").get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from None
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+
+class JWTAuthenticationScheme(SimpleJWTScheme):
+    """Keep the `jwtAuth` bearer scheme in the OpenAPI schema for the subclass."""
+
+    target_class = "core.authentication.JWTAuthentication"
@@ -1,13 +1,49 @@
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any
+from urllib.parse import urlencode
 
 from django.core.cache import cache
-from django.utils.encoding import force_str
+from django.db import connection, transaction
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from rest_framework.request import Request
+from rest_framework.response import Response
 
+# Only JSON output is cached as rendered bytes: the browsable API embeds per-session data (CSRF token, forms).
+CACHEABLE_RENDER_FORMATS = frozenset({"json"})
 
-def get_version(prefix: str) -> int:
-    """Get the current version for a cache prefix."""
-    return cache.get_or_set(f"{prefix}:version", 1)  # type: ignore[return-value]
+EMPTY_QUERY_HASH = hashlib.blake2b(b"", digest_size=8).hexdigest()
+
+# Single-flight settings: the lock outlives a slow regeneration, waiters give up well before a request timeout.
+LOCK_TIMEOUT = 30
+LOCK_WAIT_TIMEOUT = 2.0
+LOCK_POLL_INTERVAL = 0.05
+
+# Per-process copy of recently served bodies (L1) in front of the shared cache (L2).
+# Entries are keyed by the versioned cache key, so a version bump in any process makes them unreachable;
+# the TTL only bounds how long a version reset (cache flush) can serve an old body.
+LOCAL_CACHE_MAXSIZE = 512
+LOCAL_CACHE_TTL = 30
+
+
+def get_version(prefix: str, request: Request | None = None) -> int:
+    """
+    Get the current version for a cache prefix.
+    When a request is given the version is memoized on it, so a request pays at most one round trip per prefix.
+    """
+    if request is None:
+        return cache.get_or_set(f"{prefix}:version", 1)  # type: ignore[return-value]
+
+    versions = request.__dict__.setdefault("_cache_versions", {})
+    if prefix not in versions:
+        versions[prefix] = cache.get_or_set(f"{prefix}:version", 1)
+    return versions[prefix]
 
 
 def increment_version(prefix: str) -> None:
@@ -18,22 +54,250 @@ def increment_version(prefix: str) -> None:
         cache.set(f"{prefix}:version", 1)
 
 
-def build_list_cache_key(prefix: str, request: Request) -> str:
+_invalidation_state = threading.local()
+
+
+def _suspended_prefixes() -> dict[str, bool]:
+    """Prefixes whose invalidation is suspended in this thread, mapped to whether a write happened."""
+    if not hasattr(_invalidation_state, "suspended"):
+        _invalidation_state.suspended = {}
+    return _invalidation_state.suspended
+
+
+def invalidate_on_commit(prefix: str) -> None:
+    """
+    Increment the version for a cache prefix once the current transaction commits.
+    Calls for the same prefix within one transaction are coalesced into a single INCR;
+    outside a transaction the version is incremented immediately.
+    """
+    suspended = _suspended_prefixes()
+    if prefix in suspended:
+        suspended[prefix] = True
+        return
+
+    if not connection.in_atomic_block:
+        increment_version(prefix)
+        return
+
+    if prefix not in _pending_invalidations():
+        transaction.on_commit(partial(increment_version, prefix))
+
+
+def _pending_invalidations() -> set[str]:
+    """
+    Prefixes already scheduled by invalidate_on_commit in the current transaction.
+    Read from Django's pending on_commit callbacks (connection.run_on_commit, not a public API): Django drops
+    them on rollback, savepoints included, which a registry of our own could not follow without a rollback hook.
+    """
+    return {
+        entry[1].args[0]
+        for entry in connection.run_on_commit
+        if isinstance(entry[1], partial) and entry[1].func is increment_version
+    }
+
+
+@contextmanager
+def suspend_cache_invalidation(*prefixes: str) -> Iterator[None]:
+    """
+    Defer invalidation of the given prefixes until the block exits, then invalidate each written one once.
+    Meant for batch writes (imports, data commands) that would otherwise bump the version per row.
+    """
+    suspended = _suspended_prefixes()
+    owned = [prefix for prefix in prefixes if prefix not in suspended]
+    for prefix in owned:
+        suspended[prefix] = False
+    try:
+        yield
+    finally:
+        for prefix in owned:
+            if suspended.pop(prefix):
+                invalidate_on_commit(prefix)
+
+
+def _canonical_query(request: Request, allowed_params: Collection[str] | None) -> str:
+    """Query string with sorted keys, so parameter order does not split the cache."""
+    # Most list requests carry no parameters: skip parsing the QueryDict entirely
+    if not request.META.get("QUERY_STRING"):
+        return ""
+    params = sorted(
+        (key, values) for key, values in request.query_params.lists() if allowed_params is None or key in allowed_params
+    )
+    return urlencode(params, doseq=True)
+
+
+def build_list_cache_key(prefix: str, request: Request, allowed_params: Collection[str] | None = None) -> str:
     """
     Build a versioned cache key for a list view.
     Includes:
     - Prefix (resource name)
     - Current version
     - User ID (or 'anon') for permission/data segregation
-    - Hash of query parameters (filtering, pagination, sorting)
+    - Negotiated render format (json, api, ...)
+    - Hash of the canonicalized query parameters (filtering, pagination, sorting),
+      restricted to `allowed_params` when given so unknown parameters share the entry
     """
-    version = get_version(prefix)
+    version = get_version(prefix, request)
 
-    # Create a hash of query parameters
-    query_string = force_str(request.META.get("QUERY_STRING", ""))
-    query_hash = hashlib.md5(query_string.encode("utf-8"), usedforsecurity=False).hexdigest()
+    canonical_query = _canonical_query(request, allowed_params)
+    query_hash = (
+        hashlib.blake2b(canonical_query.encode(), digest_size=8).hexdigest() if canonical_query else EMPTY_QUERY_HASH
+    )
 
     # Include user ID to handle vary_on_cookie / permissions
     user_part = f"u{request.user.id}" if request.user.is_authenticated else "anon"
 
-    return f"{prefix}:v{version}:{user_part}:q{query_hash}"
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    format_part = accepted_renderer.format if accepted_renderer is not None else "json"
+
+    return f"{prefix}:v{version}:{user_part}:{format_part}:q{query_hash}"
+
+
+def content_etag(content: bytes) -> str:
+    """Strong ETag for a rendered body: a client holding the same bytes gets a 304."""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+class _LocalTTLCache:
+    """Thread-safe LRU of at most `maxsize` entries, each expiring `ttl` seconds after it was stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_local_responses = _LocalTTLCache(LOCAL_CACHE_MAXSIZE, LOCAL_CACHE_TTL)
+
+
+def clear_local_cache() -> None:
+    """Forget the bodies held in this process (used by tests, alongside cache.clear())."""
+    _local_responses.clear()
+
+
+def get_cached_response(cache_key: str) -> HttpResponse | None:
+    """
+    Return the cached rendered body as an HttpResponse, bypassing DRF rendering on a hit.
+    Looks in this process first, then in the shared cache.
+    """
+    cached = _local_responses.get(cache_key)
+    if cached is None:
+        cached = cache.get(cache_key)
+        if cached is None:
+            return None
+        _local_responses.set(cache_key, cached)
+    content, content_type = cached
+    response = HttpResponse(content, content_type=content_type)
+    response["ETag"] = content_etag(content)
+    return response
+
+
+def cache_rendered_response(
+    cache_key: str, request: Request, response: Response, renderer_context: dict[str, Any], timeout: int
+) -> None:
+    """
+    Render a DRF response now and cache its bytes and content type.
+    The response is left rendered, so Django does not render it a second time.
+    """
+    if request.accepted_renderer.format not in CACHEABLE_RENDER_FORMATS:
+        return
+
+    response.accepted_renderer = request.accepted_renderer
+    response.accepted_media_type = request.accepted_media_type
+    # Set the same way APIView.finalize_response does; the stubs do not declare the attribute
+    response.renderer_context = renderer_context  # type: ignore[attr-defined]
+    response.render()
+    response["ETag"] = content_etag(response.content)
+    cached = (response.content, response["Content-Type"])
+    cache.set(cache_key, cached, timeout=timeout)
+    _local_responses.set(cache_key, cached)
+
+
+def conditional_response(request: Request, response: HttpResponse | Response) -> HttpResponseBase:
+    """
+    Answer If-None-Match with 304 Not Modified when the client already holds the cached body.
+    Clients and proxies must revalidate every time: versioned invalidation is not visible to them otherwise.
+    Only anonymous responses may be stored by shared caches, since list keys are per user.
+    """
+    etag = response.get("ETag")
+    if etag is None:
+        return response
+    if request.user.is_authenticated:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    patch_vary_headers(response, ("Accept", "Authorization"))
+    # None only when no response is passed in
+    return get_conditional_response(request, etag=etag, response=response) or response
+
+
+def _wait_for_cached_response(cache_key: str) -> HttpResponse | None:
+    """Poll the cache while another worker regenerates the entry."""
+    deadline = time.monotonic() + LOCK_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+    return None
+
+
+def cached_list(
+    prefix: str,
+    request: Request,
+    producer: Callable[[], Response],
+    renderer_context: dict[str, Any],
+    timeout: int,
+    allowed_params: Collection[str] | None = None,
+) -> HttpResponseBase:
+    """
+    Serve a list view from the versioned cache, regenerating it at most once on a miss.
+    The first worker to take the lock (cache.add) runs `producer` and caches the rendered response;
+    concurrent workers wait for that entry and only run `producer` themselves if it never shows up.
+    Cached responses carry an ETag, and a matching If-None-Match is answered with 304.
+    """
+    cache_key = build_list_cache_key(prefix, request, allowed_params)
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return conditional_response(request, cached)
+
+    # Formats that are never cached cannot be waited for
+    if request.accepted_renderer.format not in CACHEABLE_RENDER_FORMATS:
+        return producer()
+
+    lock_key = f"{cache_key}:lock"
+    if not cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        cached = _wait_for_cached_response(cache_key)
+        if cached is not None:
+            return conditional_response(request, cached)
+        return producer()
+
+    try:
+        response = producer()
+        if response.status_code == 200:
+            cache_rendered_response(cache_key, request, response, renderer_context, timeout)
+        return conditional_response(request, response)
+    finally:
+        cache.delete(lock_key)
@@ -0,0 +1,18 @@
+from django.db import connection
+from django.db.models import Model
+
+
+def truncate_models(*models: type[Model]) -> bool:
+    """
+    Empty the tables of the given models with a single TRUNCATE ... RESTART IDENTITY CASCADE.
+    Skips the ORM collector entirely (no PK loading, no signals), so rows in tables referencing
+    these ones are removed as well, even for SET_NULL relations.
+    Returns False without doing anything when the database is not PostgreSQL, so callers can fall back to delete().
+    """
+    if connection.vendor != "postgresql":
+        return False
+
+    tables = ", ".join(connection.ops.quote_name(model._meta.db_table) for model in models)
+    with connection.cursor() as cursor:
+        cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+    return True
@@ -13,7 +13,11 @@ All API errors follow this format:
 """
 
 import logging
-from typing import Any
+import re
+from collections.abc import Mapping
+from functools import lru_cache, singledispatch
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from django.core.exceptions import PermissionDenied
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -24,9 +28,14 @@ from rest_framework.exceptions import APIException, AuthenticationFailed, NotAut
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
+from core.renderers import ORJSONRenderer
+
 logger = logging.getLogger(__name__)
 
 
+_EMPTY_EXTRA: Mapping[str, Any] = MappingProxyType({})
+
+
 # =============================================================================
 # Custom Exception Classes
 # =============================================================================
@@ -38,6 +47,8 @@ class BaseAPIException(APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_code = "error"
     default_detail = "An error has occurred."
+    # Lets the exception handler recognize our exceptions with one attribute lookup
+    _is_custom_api_exc: ClassVar[bool] = True
 
     def __init__(
         self,
@@ -45,11 +56,15 @@ class BaseAPIException(APIException):
         code: str | None = None,
         extra: dict[str, Any] | None = None,
     ):
-        detail_str: str = detail or self.default_detail
-        self.detail = detail_str  # type: ignore[assignment]
+        # APIException.__init__ sets self.detail (as an ErrorDetail carrying the code)
         self.code = code or self.default_code
-        self.extra = extra or {}
-        super().__init__(detail=detail_str, code=self.code)
+        self._extra = extra
+        super().__init__(detail=detail or self.default_detail, code=self.code)
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        """Additional error details; a shared read-only empty mapping when none were given."""
+        return self._extra or _EMPTY_EXTRA
 
 
 class NotFoundError(BaseAPIException):
@@ -121,6 +136,38 @@ class ExternalAPIError(BaseAPIException):
 # =============================================================================
 
 
+@lru_cache(maxsize=256)
+def _render_error_body(code: str, message: str) -> bytes:
+    """JSON bytes of a body without details or field errors; there are few distinct (code, message) pairs."""
+    return ORJSONRenderer().render({"success": False, "error": {"code": code, "message": message}})
+
+
+class ErrorResponse(Response):
+    """
+    Error response that can serve a pre-rendered JSON body.
+    Used only when the negotiated renderer is the compact ORJSONRenderer,
+    which is exactly what produced the cached bytes; any other renderer renders `data` as usual.
+    """
+
+    def __init__(self, data: dict[str, Any], status: int, rendered_json: bytes | None = None):
+        super().__init__(data, status=status)
+        self.rendered_json = rendered_json
+
+    @property
+    def rendered_content(self):
+        renderer = getattr(self, "accepted_renderer", None)
+        if (
+            self.rendered_json is None
+            or type(renderer) is not ORJSONRenderer
+            or "indent" in (getattr(self, "accepted_media_type", None) or "")
+        ):
+            return super().rendered_content
+
+        self.renderer_context["response"] = self
+        self["Content-Type"] = self.content_type or renderer.media_type
+        return self.rendered_json
+
+
 def build_error_response(
     code: str,
     message: str,
@@ -141,23 +188,14 @@ def build_error_response(
     Returns:
         DRF Response with standardized error format
     """
-    error_data: dict[str, Any] = {
-        "code": code,
-        "message": message,
-    }
-
+    error: dict[str, Any] = {"code": code, "message": message}
+    if not details and not field_errors:
+        return ErrorResponse({"success": False, "error": error}, status_code, _render_error_body(code, message))
     if details:
-        error_data["details"] = details
-
+        error["details"] = details
     if field_errors:
-        error_data["field_errors"] = field_errors
-
-    response_data = {
-        "success": False,
-        "error": error_data,
-    }
-
-    return Response(response_data, status=status_code)
+        error["field_errors"] = field_errors
+    return ErrorResponse({"success": False, "error": error}, status_code)
 
 
 # =============================================================================
@@ -165,90 +203,69 @@ def build_error_response(
 # =============================================================================
 
 
-def custom_exception_handler(exc: Exception, context: dict[str, Any]) -> Response | None:
-    """
-    Custom exception handler for DRF that provides consistent error responses.
+def _handle_base_api_exception(exc: BaseAPIException) -> Response:
+    """Our custom exceptions carry their own code and extra details."""
+    return build_error_response(
+        code=exc.code,
+        message=str(exc.detail),
+        status_code=exc.status_code,
+        details=exc._extra or None,
+    )
 
-    This handler catches all exceptions and formats them in a standardized way.
-    """
-    # Log the exception
-    request = context.get("request")
-    logger.error(
-        f"API Exception: {type(exc).__name__}: {exc}",
-        exc_info=True,
-        extra={
-            "view": context.get("view").__class__.__name__ if context.get("view") else None,
-            "request_path": request.path if request else None,
-        },
+
+def _handle_http404(exc: Http404) -> Response:
+    return build_error_response(
+        code="NOT_FOUND",
+        message=str(exc) or "Resource not found.",
+        status_code=status.HTTP_404_NOT_FOUND,
     )
 
-    # Handle our custom exceptions
-    if isinstance(exc, BaseAPIException):
-        return build_error_response(
-            code=exc.code,
-            message=str(exc.detail),
-            status_code=exc.status_code,
-            details=exc.extra if exc.extra else None,
-        )
 
-    # Handle Django's Http404
-    if isinstance(exc, Http404):
-        return build_error_response(
-            code="NOT_FOUND",
-            message=str(exc) if str(exc) != "" else "Resource not found.",
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
+def _handle_permission_denied(exc: PermissionDenied) -> Response:
+    return build_error_response(
+        code="PERMISSION_DENIED",
+        message=str(exc) or "You do not have the necessary permissions.",
+        status_code=status.HTTP_403_FORBIDDEN,
+    )
 
-    # Handle Django's PermissionDenied
-    if isinstance(exc, PermissionDenied):
-        return build_error_response(
-            code="PERMISSION_DENIED",
-            message=str(exc) if str(exc) else "You do not have the necessary permissions.",
-            status_code=status.HTTP_403_FORBIDDEN,
-        )
 
-    # Handle Django's ValidationError
-    if isinstance(exc, DjangoValidationError):
-        if hasattr(exc, "message_dict"):
-            field_errors = {field: [str(e) for e in errors] for field, errors in exc.message_dict.items()}
-            return build_error_response(
-                code="VALIDATION_ERROR",
-                message="Invalid data.",
-                status_code=status.HTTP_400_BAD_REQUEST,
-                field_errors=field_errors,
-            )
+def _handle_django_validation_error(exc: DjangoValidationError) -> Response:
+    if hasattr(exc, "message_dict"):
+        # message_dict is freshly built and its messages are already rendered to str
         return build_error_response(
             code="VALIDATION_ERROR",
-            message=str(exc.message) if hasattr(exc, "message") else str(exc),
+            message="Invalid data.",
             status_code=status.HTTP_400_BAD_REQUEST,
+            field_errors=exc.message_dict,
         )
+    return build_error_response(
+        code="VALIDATION_ERROR",
+        message=str(exc.message) if hasattr(exc, "message") else str(exc),
+        status_code=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+# One case-insensitive scan of the database message (the first occurrence wins)
+_INTEGRITY_RE = re.compile(r"duplicate key|foreign key|null value", re.IGNORECASE)
+_USER_ID_RE = re.compile(r"user_id", re.IGNORECASE)
 
-    # Handle Django's IntegrityError (duplicate key, foreign key violations, etc.)
-    if isinstance(exc, IntegrityError):
-        error_message = str(exc)
-        # Parse common integrity errors
-        if "duplicate key" in error_message.lower():
-            if "user_id" in error_message:
-                message = "This user already has an author profile."
-            else:
-                message = "This resource already exists."
-            return build_error_response(
-                code="DUPLICATE_RESOURCE",
-                message=message,
-                status_code=status.HTTP_409_CONFLICT,
-            )
-        elif "foreign key" in error_message.lower():
-            return build_error_response(
-                code="INVALID_REFERENCE",
-                message="The reference to a related resource is invalid.",
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-        elif "null value" in error_message.lower():
-            return build_error_response(
-                code="MISSING_REQUIRED_FIELD",
-                message="A required field is missing.",
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
+# Matched pattern (lowercased) -> (error code, message, status)
+_INTEGRITY_ERRORS: dict[str, tuple[str, str, int]] = {
+    "duplicate key": ("DUPLICATE_RESOURCE", "This resource already exists.", status.HTTP_409_CONFLICT),
+    "foreign key": (
+        "INVALID_REFERENCE",
+        "The reference to a related resource is invalid.",
+        status.HTTP_400_BAD_REQUEST,
+    ),
+    "null value": ("MISSING_REQUIRED_FIELD", "A required field is missing.", status.HTTP_400_BAD_REQUEST),
+}
+
+
+def _handle_integrity_error(exc: IntegrityError) -> Response:
+    """Handle Django's IntegrityError (duplicate key, foreign key violations, etc.)."""
+    error_message = str(exc)
+    match = _INTEGRITY_RE.search(error_message)
+    if match is None:
         # Generic integrity error
         return build_error_response(
             code="INTEGRITY_ERROR",
@@ -256,12 +273,64 @@ def custom_exception_handler(exc: Exception, context: dict[str, Any]) -> Respons
             status_code=status.HTTP_409_CONFLICT,
         )
 
-    # Get standard DRF response first
-    response = exception_handler(exc, context)
+    code, message, status_code = _INTEGRITY_ERRORS[match.group().lower()]
+    if code == "DUPLICATE_RESOURCE" and _USER_ID_RE.search(error_message):
+        message = "This user already has an author profile."
+    return build_error_response(code=code, message=message, status_code=status_code)
+
 
+@singledispatch
+def _format_exception(exc: Exception) -> Response | None:
+    """
+    Format the exceptions we handle ourselves; None lets DRF or the generic 500 take over.
+    singledispatch resolves subclasses through the MRO once per exception type and caches the result.
+    """
+    return None
+
+
+_format_exception.register(BaseAPIException, _handle_base_api_exception)
+_format_exception.register(Http404, _handle_http404)
+_format_exception.register(PermissionDenied, _handle_permission_denied)
+_format_exception.register(DjangoValidationError, _handle_django_validation_error)
+_format_exception.register(IntegrityError, _handle_integrity_error)
+
+
+def custom_exception_handler(exc: Exception, context: dict[str, Any]) -> Response | None:
+    """
+    Custom exception handler for DRF that provides consistent error responses.
+
+    This handler catches all exceptions and formats them in a standardized way.
+    """
+    # Log the exception (formatting is left to the logging backend, and skipped when ERROR is filtered out)
+    if logger.isEnabledFor(logging.ERROR):
+        request = context.get("request")
+        view = context.get("view")
+        logger.error(
+            "API Exception: %s: %s",
+            type(exc).__name__,
+            exc,
+            exc_info=True,
+            extra={
+                "view": view.__class__.__name__ if view else None,
+                "request_path": request.path if request else None,
+            },
+        )
+
+    # Fast path for the exceptions raised by our own views
+    if getattr(exc, "_is_custom_api_exc", False):
+        return _handle_base_api_exception(exc)  # type: ignore[arg-type]
+
+    # Other exceptions we format ourselves
+    response = _format_exception(exc)
     if response is not None:
-        # Handle DRF's built-in exceptions
-        return _handle_drf_exception(exc, response)
+        return response
+
+    # DRF's handler only produces a response for APIException (Http404/PermissionDenied are handled above)
+    if isinstance(exc, APIException):
+        response = exception_handler(exc, context)
+        if response is not None:
+            # Handle DRF's built-in exceptions
+            return _handle_drf_exception(exc, response)
 
     # Unhandled exception - return generic 500 error
     # In production, don't expose internal error details
@@ -290,29 +359,47 @@ def _handle_drf_exception(exc: Exception, response: Response) -> Response:
     )
 
 
+_AUTH_ERROR_CODES: dict[type[Exception], str] = {
+    NotAuthenticated: "NOT_AUTHENTICATED",
+    AuthenticationFailed: "AUTHENTICATION_FAILED",
+}
+
+_STATUS_CODE_MAP: dict[int, str] = {
+    400: "VALIDATION_ERROR",
+    401: "AUTHENTICATION_ERROR",
+    403: "PERMISSION_DENIED",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    406: "NOT_ACCEPTABLE",
+    409: "CONFLICT",
+    415: "UNSUPPORTED_MEDIA_TYPE",
+    429: "RATE_LIMIT_EXCEEDED",
+    500: "INTERNAL_ERROR",
+    502: "BAD_GATEWAY",
+    503: "SERVICE_UNAVAILABLE",
+}
+
+
 def _get_error_code_from_status(status_code: int, exc: Exception) -> str:
     """Get error code based on HTTP status and exception type."""
-    if isinstance(exc, NotAuthenticated):
-        return "NOT_AUTHENTICATED"
-    if isinstance(exc, AuthenticationFailed):
-        return "AUTHENTICATION_FAILED"
-
-    status_code_map = {
-        400: "VALIDATION_ERROR",
-        401: "AUTHENTICATION_ERROR",
-        403: "PERMISSION_DENIED",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        406: "NOT_ACCEPTABLE",
-        409: "CONFLICT",
-        415: "UNSUPPORTED_MEDIA_TYPE",
-        429: "RATE_LIMIT_EXCEEDED",
-        500: "INTERNAL_ERROR",
-        502: "BAD_GATEWAY",
-        503: "SERVICE_UNAVAILABLE",
-    }
+    # Authentication exceptions (and subclasses such as simplejwt's InvalidToken) only surface as 401/403
+    if status_code in (401, 403):
+        for cls in type(exc).__mro__:
+            auth_code = _AUTH_ERROR_CODES.get(cls)
+            if auth_code is not None:
+                return auth_code
+    return _STATUS_CODE_MAP.get(status_code, "ERROR")
 
-    return status_code_map.get(status_code, "ERROR")
+
+def _as_str_list(value: Any) -> list[str]:
+    """
+    Normalize an error value to a list of strings.
+    DRF's ErrorDetail already subclasses str, so lists of them are returned as-is instead of being copied.
+    """
+    items = value if isinstance(value, list) else [value]
+    if all(isinstance(item, str) for item in items):
+        return items
+    return [item if isinstance(item, str) else str(item) for item in items]
 
 
 def _extract_error_details(data: Any) -> tuple[str, dict[str, list[str]] | None]:
@@ -327,7 +414,7 @@ def _extract_error_details(data: Any) -> tuple[str, dict[str, list[str]] | None]
 
     if isinstance(data, list):
         # List of error messages
-        return "; ".join(str(item) for item in data), None
+        return "; ".join(_as_str_list(data)), None
 
     if isinstance(data, dict):
         # Check for 'detail' key (standard DRF error)
@@ -336,34 +423,21 @@ def _extract_error_details(data: Any) -> tuple[str, dict[str, list[str]] | None]
             if isinstance(detail, str):
                 return detail, None
             if isinstance(detail, list):
-                return "; ".join(str(item) for item in detail), None
+                return "; ".join(_as_str_list(detail)), None
             if isinstance(detail, dict):
                 return str(detail), None
 
         # Check for 'non_field_errors'
         if "non_field_errors" in data:
             non_field = data["non_field_errors"]
-            message = "; ".join(str(item) for item in non_field) if isinstance(non_field, list) else str(non_field)
+            message = "; ".join(_as_str_list(non_field))
 
             # Get remaining field errors
-            field_errors = {
-                k: [str(e) for e in (v if isinstance(v, list) else [v])]
-                for k, v in data.items()
-                if k != "non_field_errors"
-            }
+            field_errors = {k: _as_str_list(v) for k, v in data.items() if k != "non_field_errors"}
             return message, field_errors if field_errors else None
 
         # Field-level validation errors
-        field_errors = {}
-        messages: list[str] = []
-        for key, value in data.items():
-            if isinstance(value, list):
-                field_errors[key] = [str(v) for v in value]
-                messages.extend(str(v) for v in value)
-            else:
-                field_errors[key] = [str(value)]
-                messages.append(str(value))
-
+        field_errors = {key: _as_str_list(value) for key, value in data.items()}
         message = "Validation errors." if field_errors else "Invalid data."
         return message, field_errors if field_errors else None
 
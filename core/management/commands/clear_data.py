@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from core.db_utils import truncate_models
+
 
 class Command(BaseCommand):
     help = "Clear development data (reviews, favorites, films, authors, spectators). Use --yes to execute."
@@ -28,27 +30,28 @@ class Command(BaseCommand):
             "users": User.objects.count(),
         }
 
-        self.stdout.write("Current object counts:")
-        for k, v in counts.items():
-            self.stdout.write(f" - {k}: {v}")
+        self.stdout.write("\n".join(["Current object counts:", *(f" - {k}: {v}" for k, v in counts.items())]))
 
         if not yes:
             self.stdout.write(self.style.WARNING("Dry run. No data will be deleted. Rerun with --yes to delete."))
             return
 
-        with transaction.atomic():
-            self.stdout.write("Deleting film reviews...")
-            FilmReview.objects.all().delete()
-            self.stdout.write("Deleting author reviews...")
-            AuthorReview.objects.all().delete()
-            self.stdout.write("Deleting favorite links (M2M)...")
-            Spectator.favorite_films.through.objects.all().delete()
-            self.stdout.write("Deleting films...")
-            Film.objects.all().delete()
-            self.stdout.write("Deleting authors...")
-            Author.objects.all().delete()
-            self.stdout.write("Deleting spectators...")
-            Spectator.objects.all().delete()
-            # Do NOT delete users by default to avoid removing superusers; if needed, user can run custom queries
+        # Children first so the ORM fallback never cascades through unrelated rows.
+        # Users are NOT deleted by default to avoid removing superusers; if needed, user can run custom queries
+        delete_steps = (
+            ("film reviews", FilmReview),
+            ("author reviews", AuthorReview),
+            ("favorite links (M2M)", Spectator.favorite_films.through),
+            ("films", Film),
+            ("authors", Author),
+            ("spectators", Spectator),
+        )
+        if truncate_models(*(model for _, model in delete_steps)):
+            self.stdout.write("Truncated " + ", ".join(label for label, _ in delete_steps) + ".")
+        else:
+            with transaction.atomic():
+                for label, model in delete_steps:
+                    self.stdout.write(f"Deleting {label}...")
+                    model.objects.all().delete()
 
         self.stdout.write(self.style.SUCCESS("Selected data cleared."))
@@ -3,11 +3,14 @@ Commande pour créer des données par défaut pour le développement et les test
 Usage: python manage.py create_default_data
 """
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from authors.models import Author
+from core.db_utils import truncate_models
 from films.models import Film, FilmReview
+from films.signals import update_average_ratings
 from spectators.models import Spectator
 from users.models import CustomUser
 
@@ -26,11 +29,12 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         if options["clear"]:
             self.stdout.write(self.style.WARNING("Deleting existing data..."))
-            FilmReview.objects.all().delete()
-            Film.objects.all().delete()
-            Author.objects.all().delete()
-            Spectator.objects.all().delete()
-            CustomUser.objects.all().delete()
+            if not truncate_models(FilmReview, Film, Author, Spectator, CustomUser):
+                FilmReview.objects.all().delete()
+                Film.objects.all().delete()
+                Author.objects.all().delete()
+                Spectator.objects.all().delete()
+                CustomUser.objects.all().delete()
             self.stdout.write(self.style.SUCCESS("✓ Data deleted"))
 
         self.stdout.write(self.style.MIGRATE_HEADING("Creating data..."))
@@ -70,6 +74,38 @@ class Command(BaseCommand):
             )
         )
 
+    def _get_or_create_users(self, users_data, role):
+        """Fetch existing users by username in one query and bulk-create the missing ones."""
+        usernames = [data["username"] for data in users_data]
+        existing = CustomUser.objects.in_bulk(usernames, field_name="username")
+        # Hash the shared development password once instead of once per user
+        password = make_password("pass123")
+        missing = [
+            CustomUser(
+                username=data["username"],
+                email=data["email"],
+                first_name=data["first_name"],
+                last_name=data["last_name"],
+                role=role,
+                password=password,
+            )
+            for data in users_data
+            if data["username"] not in existing
+        ]
+        created = {user.username: user for user in CustomUser.objects.bulk_create(missing)}
+        return [existing.get(username) or created[username] for username in usernames]
+
+    def _get_or_create_profiles(self, model, users, defaults_list):
+        """Fetch existing profiles (Author/Spectator) by user in one query and bulk-create the missing ones."""
+        existing = {profile.user_id: profile for profile in model.objects.filter(user__in=users)}
+        missing = [
+            model(user=user, **defaults)
+            for user, defaults in zip(users, defaults_list, strict=True)
+            if user.pk not in existing
+        ]
+        created = {profile.user_id: profile for profile in model.objects.bulk_create(missing)}
+        return [existing.get(user.pk) or created[user.pk] for user in users]
+
     def _create_admin(self):
         """Create an admin account"""
         admin, created = CustomUser.objects.get_or_create(
@@ -126,30 +162,12 @@ class Command(BaseCommand):
             },
         ]
 
-        authors = []
-        for data in authors_data:
-            user, created = CustomUser.objects.get_or_create(
-                username=data["username"],
-                defaults={
-                    "email": data["email"],
-                    "first_name": data["first_name"],
-                    "last_name": data["last_name"],
-                    "role": "author",
-                },
-            )
-            if created:
-                user.set_password("pass123")
-                user.save()
-
-            author, created = Author.objects.get_or_create(
-                user=user,
-                defaults={
-                    "bio": data["bio"],
-                    "date_of_birth": data["date_of_birth"],
-                    "source": "ADMIN",
-                },
-            )
-            authors.append(author)
+        users = self._get_or_create_users(authors_data, role="author")
+        authors = self._get_or_create_profiles(
+            Author,
+            users,
+            [{"bio": data["bio"], "date_of_birth": data["date_of_birth"], "source": "ADMIN"} for data in authors_data],
+        )
 
         self.stdout.write(self.style.SUCCESS(f"✓ {len(authors)} auteurs créés"))
         return authors
@@ -223,21 +241,29 @@ class Command(BaseCommand):
             },
         ]
 
-        films = []
-        for data in films_data:
-            film, created = Film.objects.get_or_create(
-                title=data["title"],
-                defaults={
-                    "description": data["description"],
-                    "release_date": data["release_date"],
-                    "evaluation": data["evaluation"],
-                    "status": data["status"],
-                    "source": "ADMIN",
-                },
+        # Titles are not unique in the schema; the seed titles are, so key on them directly
+        existing = {film.title: film for film in Film.objects.filter(title__in=[data["title"] for data in films_data])}
+        missing = [
+            (
+                Film(
+                    title=data["title"],
+                    description=data["description"],
+                    release_date=data["release_date"],
+                    evaluation=data["evaluation"],
+                    status=data["status"],
+                    source="ADMIN",
+                ),
+                authors[data["author_idx"]],
             )
-            if created:
-                film.authors.add(authors[data["author_idx"]])
-            films.append(film)
+            for data in films_data
+            if data["title"] not in existing
+        ]
+        created = {film.title: film for film in Film.objects.bulk_create([film for film, _ in missing])}
+        # Only newly created films get their author, as with get_or_create previously
+        Film.authors.through.objects.bulk_create(
+            [Film.authors.through(film_id=film.pk, author_id=author.pk) for film, author in missing]
+        )
+        films = [existing.get(data["title"]) or created[data["title"]] for data in films_data]
 
         self.stdout.write(self.style.SUCCESS(f"✓ {len(films)} films créés"))
         return films
@@ -268,28 +294,10 @@ class Command(BaseCommand):
             },
         ]
 
-        spectators = []
-        for data in spectators_data:
-            user, created = CustomUser.objects.get_or_create(
-                username=data["username"],
-                defaults={
-                    "email": data["email"],
-                    "first_name": data["first_name"],
-                    "last_name": data["last_name"],
-                    "role": "spectator",
-                },
-            )
-            if created:
-                user.set_password("pass123")
-                user.save()
-
-            spectator, created = Spectator.objects.get_or_create(
-                user=user,
-                defaults={
-                    "favorite_genre": data["favorite_genre"],
-                },
-            )
-            spectators.append(spectator)
+        users = self._get_or_create_users(spectators_data, role="spectator")
+        spectators = self._get_or_create_profiles(
+            Spectator, users, [{"favorite_genre": data["favorite_genre"]} for data in spectators_data]
+        )
 
         self.stdout.write(self.style.SUCCESS(f"✓ {len(spectators)} spectateurs créés"))
         return spectators
@@ -356,18 +364,21 @@ class Command(BaseCommand):
             },
         ]
 
-        reviews = []
-        for data in reviews_data:
-            review, created = FilmReview.objects.get_or_create(
-                user=spectators[data["spectator_idx"]],
-                film=films[data["film_idx"]],
-                defaults={
-                    "rating": data["rating"],
-                    "comment": data["comment"],
-                },
-            )
-            if created:
-                reviews.append(review)
+        existing = set(FilmReview.objects.filter(user__in=spectators, film__in=films).values_list("user_id", "film_id"))
+        reviews = FilmReview.objects.bulk_create(
+            [
+                FilmReview(
+                    user=spectators[data["spectator_idx"]],
+                    film=films[data["film_idx"]],
+                    rating=data["rating"],
+                    comment=data["comment"],
+                )
+                for data in reviews_data
+                if (spectators[data["spectator_idx"]].pk, films[data["film_idx"]].pk) not in existing
+            ]
+        )
+        # bulk_create ne déclenche pas post_save : recalcul des moyennes en un seul UPDATE
+        update_average_ratings({review.film_id for review in reviews})
 
         self.stdout.write(self.style.SUCCESS(f"✓ {len(reviews)} reviews created"))
         return reviews
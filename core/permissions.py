@@ -2,6 +2,8 @@
 
 from rest_framework import permissions
 
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
@@ -12,6 +14,8 @@ class IsAdminOrReadOnly(permissions.BasePermission):
     """
 
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in SAFE_METHODS:
             return True
-        return request.user and request.user.is_staff
+        # Read request.user once: it is a property that runs authentication on first access
+        user = request.user
+        return bool(user and user.is_staff)
@@ -0,0 +1,25 @@
+from collections.abc import Mapping
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Types orjson does not know (lazy translations, Decimal, querysets...) go through DRF's encoder
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes compact output with orjson.
+    Indented output (?indent, browsable API) is left to the stdlib encoder, orjson only indents by two spaces.
+    """
+
+    def render(
+        self, data: Any, accepted_media_type: str | None = None, renderer_context: Mapping[str, Any] | None = None
+    ) -> bytes:
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=_drf_default, option=orjson.OPT_NON_STR_KEYS)
@@ -2,18 +2,52 @@
 Tests for core module views and utilities.
 """
 
+import csv
+import itertools
+import json
+import time
+from decimal import Decimal
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.management import call_command
+from django.db import IntegrityError, OperationalError
+from django.db.models import Avg
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.translation import gettext_lazy
 from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
 
+from core import cache_utils
+from core.admin import export_as_csv
+from core.authentication import JWTAuthentication
 from core.exceptions import (
     ConflictError,
     NotFoundError,
     ValidationError,
     build_error_response,
     build_success_response,
+    custom_exception_handler,
 )
+from core.renderers import ORJSONRenderer
+from core.views import HEALTHY_BODY, HealthCheckView, reset_health_check_cache
+from films.factories import FilmFactory
+from films.models import Film
+from spectators.admin import SpectatorAdmin
+from spectators.factories import SpectatorFactory
+from spectators.models import Spectator
+from users.factories import AuthorUserFactory
 
 
 class TestExceptionHandler:
@@ -45,6 +79,20 @@ class TestExceptionHandler:
         data = response.data
         assert data["error"]["field_errors"]["email"] == ["Invalid email format"]
 
+    def test_build_error_response_prerendered_json(self) -> None:
+        """Test a plain error body is served from the cached JSON bytes."""
+        response = build_error_response(code="NOT_FOUND", message="Resource not found.", status_code=404)
+        response.accepted_renderer = ORJSONRenderer()
+        response.accepted_media_type = "application/json"
+        response.renderer_context = {}  # type: ignore[attr-defined]
+
+        with patch.object(ORJSONRenderer, "render") as render:
+            response.render()
+
+        render.assert_not_called()
+        assert response["Content-Type"] == "application/json"
+        assert json.loads(response.content) == response.data
+
     def test_build_success_response(self) -> None:
         """Test building a standardized success response."""
         response = build_success_response(
@@ -75,11 +123,54 @@ class TestExceptionHandler:
         assert exc.status_code == 409
         assert exc.extra["field"] == "email"
 
+    def test_exception_without_extra(self) -> None:
+        """Test exceptions without extra share an empty, read-only mapping."""
+        exc = NotFoundError()
+        assert exc.extra == {}
+        with pytest.raises(TypeError):
+            exc.extra["field"] = "email"  # type: ignore[index]
+
+    @pytest.mark.parametrize(
+        ("exc", "expected_status", "expected_code"),
+        [
+            (ConflictError(detail="Taken"), 409, "CONFLICT"),
+            (Http404(), 404, "NOT_FOUND"),
+            (PermissionDenied(), 403, "PERMISSION_DENIED"),
+            (DjangoValidationError({"email": ["Invalid."]}), 400, "VALIDATION_ERROR"),
+            (IntegrityError('duplicate key value violates unique constraint "x"'), 409, "DUPLICATE_RESOURCE"),
+            (IntegrityError("insert violates foreign key constraint"), 400, "INVALID_REFERENCE"),
+            (IntegrityError('null value in column "title"'), 400, "MISSING_REQUIRED_FIELD"),
+            (IntegrityError("check constraint"), 409, "INTEGRITY_ERROR"),
+            (NotAuthenticated(), 401, "NOT_AUTHENTICATED"),
+            (InvalidToken(), 401, "AUTHENTICATION_FAILED"),
+            (RuntimeError("boom"), 500, "INTERNAL_ERROR"),
+        ],
+    )
+    def test_custom_exception_handler(self, exc, expected_status, expected_code) -> None:
+        """Test each exception family is mapped to its status and error code."""
+        response = custom_exception_handler(exc, {})
+        assert response is not None
+        assert response.status_code == expected_status
+        assert response.data["success"] is False
+        assert response.data["error"]["code"] == expected_code
+
+    def test_duplicate_author_profile_message(self) -> None:
+        """Test a duplicate user_id is reported as an existing author profile."""
+        response = custom_exception_handler(IntegrityError("Duplicate key: Key (user_id)=(1) already exists."), {})
+        assert response is not None
+        assert response.data["error"]["message"] == "This user already has an author profile."
+
 
 @pytest.mark.django_db
 class TestHealthCheckView:
     """Tests for HealthCheckView."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_health_check(self):
+        reset_health_check_cache()
+        yield
+        reset_health_check_cache()
+
     def test_health_check_returns_healthy(self, api_client) -> None:
         """Test health check returns healthy status with all services up."""
         response = api_client.get("/health/")
@@ -91,6 +182,12 @@ class TestHealthCheckView:
         assert data["checks"]["database"]["status"] == "up"
         assert data["checks"]["cache"]["status"] == "up"
 
+    def test_health_check_prerendered_body_matches_checks(self) -> None:
+        """Test the pre-serialized healthy body matches what the checks report when everything is up."""
+        health_status, status_code = HealthCheckView._run_checks()
+        assert status_code == status.HTTP_200_OK
+        assert json.loads(HEALTHY_BODY) == health_status
+
     @patch("core.views.connection")
     def test_health_check_database_failure(self, mock_connection: MagicMock, api_client) -> None:
         """Test health check returns unhealthy when database is down."""
@@ -105,10 +202,30 @@ class TestHealthCheckView:
         assert data["checks"]["database"]["status"] == "down"
         assert "error" in data["checks"]["database"]
 
-    @patch("django.core.cache.cache")
-    def test_health_check_cache_failure(self, mock_cache: MagicMock, api_client) -> None:
+    @patch("core.views._ping_database")
+    def test_health_check_result_reused_within_window(self, mock_ping: MagicMock, api_client) -> None:
+        """Test probes within the cache window reuse the last result instead of re-checking."""
+        first = api_client.get("/health/")
+        second = api_client.get("/health/")
+        assert first.json() == second.json()
+        mock_ping.assert_called_once()
+
+    @patch("core.views._ping_database")
+    def test_health_check_database_timeout(self, mock_ping: MagicMock, api_client) -> None:
+        """Test a statement timeout is reported as such."""
+        error = OperationalError("canceling statement due to statement timeout")
+        error.__cause__ = Exception("QueryCanceled")
+        error.__cause__.pgcode = "57014"  # type: ignore[attr-defined]
+        mock_ping.side_effect = error
+
+        response = api_client.get("/health/")
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["checks"]["database"] == {"status": "down", "error": "timeout"}
+
+    @patch("core.views.get_redis_connection")
+    def test_health_check_cache_failure(self, mock_redis: MagicMock, api_client) -> None:
         """Test health check returns unhealthy when cache is down."""
-        mock_cache.set.side_effect = Exception("Cache connection failed")
+        mock_redis.return_value.ping.side_effect = Exception("Cache connection failed")
 
         response = api_client.get("/health/")
         assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
@@ -116,9 +233,17 @@ class TestHealthCheckView:
         assert data["status"] == "unhealthy"
         assert data["checks"]["cache"]["status"] == "down"
 
+    def test_health_check_cache_is_pinged_not_written(self, api_client) -> None:
+        """Test the Redis probe is a PING that leaves no key behind."""
+        cache.delete("health_check")
+        response = api_client.get("/health/")
+        assert response.json()["checks"]["cache"]["status"] == "up"
+        assert cache.get("health_check") is None
+
+    @patch("core.views.get_redis_connection", side_effect=NotImplementedError)
     @patch("django.core.cache.cache")
-    def test_health_check_cache_get_failure(self, mock_cache: MagicMock, api_client) -> None:
-        """Test health check when cache get returns wrong value."""
+    def test_health_check_cache_get_failure(self, mock_cache: MagicMock, mock_redis: MagicMock, api_client) -> None:
+        """Test health check on a non-Redis backend when cache get returns wrong value."""
         mock_cache.set.return_value = True
         mock_cache.get.return_value = "wrong_value"
 
@@ -151,3 +276,224 @@ class TestLivenessCheckView:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["status"] == "alive"
+
+
+class TestCachedList:
+    """Tests for the single-flight list cache helper."""
+
+    @staticmethod
+    def _request() -> Request:
+        request = Request(APIRequestFactory().get("/api/things/", {"page": 1}))
+        request.accepted_renderer = ORJSONRenderer()
+        request.accepted_media_type = "application/json"
+        return request
+
+    def test_cached_list_produces_once(self) -> None:
+        """Test a miss runs the producer and the next call is served from cache."""
+        producer = MagicMock(return_value=Response({"results": []}))
+
+        first = cache_utils.cached_list("things", self._request(), producer, {}, 60)
+        second = cache_utils.cached_list("things", self._request(), producer, {}, 60)
+
+        producer.assert_called_once()
+        assert isinstance(first, HttpResponse) and isinstance(second, HttpResponse)
+        assert second.content == first.content
+
+    def test_cached_list_hit_served_from_process_memory(self) -> None:
+        """Test a body cached by this process is served without a round trip to the shared cache."""
+        producer = MagicMock(return_value=Response({"results": []}))
+        first = cache_utils.cached_list("things", self._request(), producer, {}, 60)
+        cache_key = cache_utils.build_list_cache_key("things", self._request())
+
+        with patch.object(cache_utils.cache, "get", wraps=cache_utils.cache.get) as shared_get:
+            second = cache_utils.cached_list("things", self._request(), producer, {}, 60)
+
+        assert cache_key not in [call.args[0] for call in shared_get.call_args_list]
+        assert isinstance(first, HttpResponse) and isinstance(second, HttpResponse)
+        assert second.content == first.content
+
+    def test_cached_list_version_bump_skips_process_memory(self) -> None:
+        """Test invalidation from any process is seen, since local entries are keyed by version."""
+        calls = itertools.count(1)
+        producer = MagicMock(side_effect=lambda: Response({"results": [next(calls)]}))
+        cache_utils.cached_list("things", self._request(), producer, {}, 60)
+
+        cache_utils.increment_version("things")
+        response = cache_utils.cached_list("things", self._request(), producer, {}, 60)
+
+        assert producer.call_count == 2
+        assert isinstance(response, HttpResponse)
+        assert json.loads(response.content) == {"results": [2]}
+
+    def test_local_cache_evicts_least_recent_and_expired(self) -> None:
+        """Test the per-process cache stays bounded in size and age."""
+        local = cache_utils._LocalTTLCache(maxsize=2, ttl=30)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        assert (local.get("a"), local.get("b"), local.get("c")) == (1, None, 3)
+        with patch.object(cache_utils.time, "monotonic", return_value=time.monotonic() + 31):
+            assert local.get("a") is None
+
+    def test_cached_list_falls_through_when_locked(self) -> None:
+        """Test a waiter runs the producer itself if the lock holder never fills the cache."""
+        request = self._request()
+        cache.add(f"{cache_utils.build_list_cache_key('things', request)}:lock", 1)
+        producer = MagicMock(return_value=Response({"results": []}))
+
+        with patch.object(cache_utils, "LOCK_WAIT_TIMEOUT", 0):
+            response = cache_utils.cached_list("things", request, producer, {}, 60)
+
+        producer.assert_called_once()
+        assert response.status_code == status.HTTP_200_OK
+        assert cache_utils.get_cached_response(cache_utils.build_list_cache_key("things", request)) is None
+
+    def test_cached_list_etag_is_private_for_authenticated_users(self) -> None:
+        """Test shared caches may only store anonymous list responses."""
+        request = self._request()
+
+        def producer() -> Response:
+            return Response({"results": []})
+
+        anonymous = cache_utils.cached_list("things", request, producer, {}, 60)
+        assert isinstance(anonymous, HttpResponse)
+        assert anonymous["ETag"] == cache_utils.content_etag(anonymous.content)
+        assert "public" in anonymous["Cache-Control"]
+
+        request.user = MagicMock(is_authenticated=True, id=7)
+        authenticated = cache_utils.cached_list("things", request, producer, {}, 60)
+        assert "private" in authenticated["Cache-Control"]
+
+    def test_cache_key_ignores_param_order_and_unknown_params(self) -> None:
+        """Test equivalent query strings map to the same cache key."""
+        factory = APIRequestFactory()
+        allowed = {"search", "page"}
+        first = Request(factory.get("/api/things/?search=a&page=2"))
+        second = Request(factory.get("/api/things/?page=2&utm_source=x&search=a"))
+        other = Request(factory.get("/api/things/?page=3&search=a"))
+
+        key = cache_utils.build_list_cache_key("things", first, allowed)
+        assert cache_utils.build_list_cache_key("things", second, allowed) == key
+        assert cache_utils.build_list_cache_key("things", other, allowed) != key
+
+    def test_version_memoized_per_request(self) -> None:
+        """Test the cache version is fetched once per request and prefix."""
+        request = self._request()
+        with patch.object(cache_utils.cache, "get_or_set", return_value=1) as get_or_set:
+            first = cache_utils.build_list_cache_key("things", request)
+            second = cache_utils.build_list_cache_key("things", request)
+
+        get_or_set.assert_called_once_with("things:version", 1)
+        assert first == second
+
+
+@pytest.mark.django_db
+class TestCacheInvalidation:
+    """Tests for transaction-aware cache invalidation."""
+
+    @patch.object(cache_utils, "increment_version")
+    def test_invalidations_coalesce_per_transaction(self, mock_increment, django_capture_on_commit_callbacks) -> None:
+        """Test several invalidations in one transaction bump the version once, after commit."""
+        with django_capture_on_commit_callbacks(execute=True):
+            cache_utils.invalidate_on_commit("things")
+            cache_utils.invalidate_on_commit("things")
+            cache_utils.invalidate_on_commit("others")
+            mock_increment.assert_not_called()
+
+        assert mock_increment.call_count == 2
+        mock_increment.assert_any_call("things")
+        mock_increment.assert_any_call("others")
+
+    @patch.object(cache_utils, "increment_version")
+    def test_suspend_cache_invalidation(self, mock_increment, django_capture_on_commit_callbacks) -> None:
+        """Test invalidations inside a suspended block collapse into one on exit."""
+        with (
+            django_capture_on_commit_callbacks(execute=True),
+            cache_utils.suspend_cache_invalidation("things", "others"),
+        ):
+            for _ in range(3):
+                cache_utils.invalidate_on_commit("things")
+
+        mock_increment.assert_called_once_with("things")
+
+
+@pytest.mark.django_db
+class TestJWTAuthentication:
+    """Tests for the project JWT authentication class."""
+
+    def test_spectator_profile_loaded_with_user(self, django_assert_num_queries) -> None:
+        """Test the spectator profile, or its absence, is known without an extra query."""
+        spectator: Spectator = SpectatorFactory.create()
+        author_user = AuthorUserFactory()
+        authentication = JWTAuthentication()
+
+        with django_assert_num_queries(2):
+            spectator_user = authentication.get_user(AccessToken.for_user(spectator.user))
+            other_user = authentication.get_user(AccessToken.for_user(author_user))
+
+        with django_assert_num_queries(0):
+            assert spectator_user.spectator_profile.pk == spectator.pk
+            assert not hasattr(other_user, "spectator_profile")
+
+    def test_inactive_user_rejected(self) -> None:
+        """Test inactive users are still refused."""
+        user = AuthorUserFactory(is_active=False)
+        with pytest.raises(AuthenticationFailed):
+            JWTAuthentication().get_user(AccessToken.for_user(user))
+
+
+class TestORJSONRenderer:
+    """Tests for the orjson-backed JSON renderer."""
+
+    def test_render_matches_stdlib_renderer(self) -> None:
+        """Test compact output is the same JSON the stdlib renderer produces, lazy strings and decimals included."""
+        data = {"message": gettext_lazy("Not found."), "rating": Decimal("4.50"), 1: ["é", None]}
+
+        rendered = ORJSONRenderer().render(data, "application/json")
+
+        assert rendered == JSONRenderer().render(data, "application/json")
+
+    def test_render_indented_falls_back_to_stdlib(self) -> None:
+        """Test indented output keeps the requested indentation."""
+        rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+
+        assert rendered == b'{\n    "a": 1\n}'
+
+
+@pytest.mark.django_db
+class TestExportAsCSV:
+    """Tests for the streaming CSV admin action."""
+
+    def test_export_streams_annotated_rows(self) -> None:
+        """Test the export has a header and one line per selected row, including admin annotations."""
+        spectators = SpectatorFactory.create_batch(2)
+        spectators[0].favorite_films.add(FilmFactory())
+        model_admin = SpectatorAdmin(Spectator, admin.site)
+        request = APIRequestFactory().post("/admin/spectators/spectator/")
+        queryset = model_admin.get_queryset(request).order_by("id")
+
+        response = export_as_csv(model_admin, request, queryset)
+
+        assert isinstance(response, StreamingHttpResponse)
+        rows = list(csv.reader(response.getvalue().decode().splitlines()))
+        assert rows[0] == list(SpectatorAdmin.csv_export_fields)
+        assert [(row[1], row[4]) for row in rows[1:]] == [
+            (spectators[0].user.username, "1"),
+            (spectators[1].user.username, "0"),
+        ]
+
+
+@pytest.mark.django_db
+class TestCreateDefaultDataCommand:
+    """Tests for the create_default_data management command."""
+
+    def test_seeded_reviews_update_average_rating(self) -> None:
+        """Test bulk-inserted reviews still leave each film with its stored average rating."""
+        call_command("create_default_data", stdout=StringIO())
+
+        films = Film.objects.annotate(expected=Avg("reviews__rating")).filter(expected__isnull=False)
+        assert films.exists()
+        for film in films:
+            assert film.average_rating == pytest.approx(film.expected)
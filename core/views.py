@@ -2,12 +2,17 @@
 Health check views for monitoring and load balancer health probes.
 """
 
+import json
 import logging
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
-from django.db import connection
-from django.http import JsonResponse
+from django.db import OperationalError, connection, transaction
+from django.http import HttpResponse
 from django.views import View
+from django_redis import get_redis_connection
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -15,6 +20,80 @@ from rest_framework.views import APIView
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for the database probe, so a stalled backend cannot hang the health check
+DB_HEALTH_CHECK_TIMEOUT_MS = 500
+# SQLSTATE raised by PostgreSQL when statement_timeout cancels a query
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+def _ping_database() -> None:
+    """Run SELECT 1, bounded by a transaction-scoped statement_timeout on PostgreSQL."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            # SET LOCAL only lasts until the end of this transaction, so it never leaks to other queries
+            cursor.execute("SET LOCAL statement_timeout = %s", [DB_HEALTH_CHECK_TIMEOUT_MS])
+        cursor.execute("SELECT 1")
+
+
+def _ping_cache() -> bool:
+    """
+    One PING round-trip to Redis, without writing to the cache.
+    Non-Redis backends fall back to a short-lived set/get of a single key.
+    """
+    try:
+        redis_client = get_redis_connection("default")
+    except NotImplementedError:
+        from django.core.cache import cache
+
+        cache.set("health_check", "ok", timeout=1)
+        return cache.get("health_check") == "ok"
+    return bool(redis_client.ping())
+
+
+# Probes arrive every few seconds from several sources: run the real checks at most once per window per process
+HEALTH_CHECK_CACHE_SECONDS = 5
+_health_check_lock = threading.Lock()
+_last_health_check: tuple[float, dict[str, Any], int] | None = None
+
+
+def _cached_health_check(run_checks: Callable[[], tuple[dict[str, Any], int]]) -> tuple[dict[str, Any], int]:
+    """
+    Return the last health check result if it is recent enough, otherwise run the checks.
+    Kept in process memory rather than in the cache, since the cache is one of the things being checked.
+    """
+    global _last_health_check
+    with _health_check_lock:
+        now = time.monotonic()
+        if _last_health_check is not None and now - _last_health_check[0] < HEALTH_CHECK_CACHE_SECONDS:
+            return _last_health_check[1], _last_health_check[2]
+        health_status, status_code = run_checks()
+        _last_health_check = (now, health_status, status_code)
+        return health_status, status_code
+
+
+def reset_health_check_cache() -> None:
+    """Forget the memoized health check result (used by tests)."""
+    global _last_health_check
+    with _health_check_lock:
+        _last_health_check = None
+
+
+# Body of the only healthy outcome (every check up), serialized once at import
+HEALTHY_BODY = json.dumps(
+    {"status": "healthy", "version": "1.0.0", "checks": {"database": {"status": "up"}, "cache": {"status": "up"}}},
+    separators=(",", ":"),
+).encode()
+
+
+# Constant probe bodies. A fresh response is still built per request: middleware mutates response
+# headers, so a shared HttpResponse instance would leak them between requests.
+READY_BODY = b'{"status":"ready"}'
+ALIVE_BODY = b'{"status":"alive"}'
+
+
+def _is_statement_timeout(exc: OperationalError) -> bool:
+    return getattr(exc.__cause__, "pgcode", None) == QUERY_CANCELED_SQLSTATE
+
 
 class HealthCheckView(APIView):
     """
@@ -33,7 +112,16 @@ class HealthCheckView(APIView):
     permission_classes = [AllowAny]
     authentication_classes: list = []
 
-    def get(self, request) -> Response:
+    def get(self, request) -> HttpResponse:
+        health_status, status_code = _cached_health_check(self._run_checks)
+        if status_code == status.HTTP_200_OK:
+            # Common case: skip the renderer and return the pre-serialized body
+            return HttpResponse(HEALTHY_BODY, content_type="application/json")
+        return Response(health_status, status=status_code)
+
+    @staticmethod
+    def _run_checks() -> tuple[dict[str, Any], int]:
+        """Check the database and the cache; returns the payload and its HTTP status."""
         health_status: dict[str, Any] = {
             "status": "healthy",
             "version": "1.0.0",
@@ -42,26 +130,30 @@ class HealthCheckView(APIView):
 
         # Check database
         try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
+            _ping_database()
             health_status["checks"]["database"] = {"status": "up"}
+        except OperationalError as e:
+            if _is_statement_timeout(e):
+                logger.error("Database health check timed out after %sms", DB_HEALTH_CHECK_TIMEOUT_MS)
+                health_status["checks"]["database"] = {"status": "down", "error": "timeout"}
+            else:
+                logger.error("Database health check failed: %s", e)
+                health_status["checks"]["database"] = {"status": "down", "error": str(e)}
+            health_status["status"] = "unhealthy"
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
             health_status["checks"]["database"] = {"status": "down", "error": str(e)}
             health_status["status"] = "unhealthy"
 
         # Check cache (Redis)
         try:
-            from django.core.cache import cache
-
-            cache.set("health_check", "ok", timeout=10)
-            if cache.get("health_check") == "ok":
+            if _ping_cache():
                 health_status["checks"]["cache"] = {"status": "up"}
             else:
                 health_status["checks"]["cache"] = {"status": "down"}
                 health_status["status"] = "unhealthy"
         except Exception as e:
-            logger.error(f"Cache health check failed: {e}")
+            logger.error("Cache health check failed: %s", e)
             health_status["checks"]["cache"] = {"status": "down", "error": str(e)}
             health_status["status"] = "unhealthy"
 
@@ -69,7 +161,7 @@ class HealthCheckView(APIView):
             status.HTTP_200_OK if health_status["status"] == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
         )
 
-        return Response(health_status, status=status_code)
+        return health_status, status_code
 
 
 class ReadinessCheckView(View):
@@ -78,8 +170,8 @@ class ReadinessCheckView(View):
     Simple check that returns 200 if the app can handle requests.
     """
 
-    def get(self, request) -> JsonResponse:
-        return JsonResponse({"status": "ready"})
+    def get(self, request) -> HttpResponse:
+        return HttpResponse(READY_BODY, content_type="application/json")
 
 
 class LivenessCheckView(View):
@@ -88,5 +180,5 @@ class LivenessCheckView(View):
     Simple check that returns 200 if the app process is alive.
     """
 
-    def get(self, request) -> JsonResponse:
-        return JsonResponse({"status": "alive"})
+    def get(self, request) -> HttpResponse:
+        return HttpResponse(ALIVE_BODY, content_type="application/json")
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
+from core.admin import export_as_csv
+
 from .models import Film, FilmReview
 
 
@@ -26,6 +28,10 @@ class FilmAdmin(admin.ModelAdmin):
     autocomplete_fields = ("authors",)
     inlines = [FilmReviewInline]
     readonly_fields = ("created_at", "updated_at", "poster_preview")
+    # Skip the unfiltered SELECT COUNT(*) the changelist runs on top of the filtered count
+    show_full_result_count = False
+    actions = [export_as_csv]
+    csv_export_fields = ("id", "title", "release_date", "status", "source", "tmdb_id", "average_rating", "created_at")
 
     @admin.display(description="Poster")
     def poster_thumbnail(self, obj):
@@ -47,13 +53,10 @@ class FilmAdmin(admin.ModelAdmin):
             )
         return "No poster"
 
-    @admin.display(description="Average rating")
+    @admin.display(description="Average rating", ordering="average_rating")
     def average_rating_display(self, obj):
-        # Calculate the average rating
-        reviews = obj.reviews.all()
-        if reviews:
-            return sum(r.rating for r in reviews) / reviews.count()
-        return "-"
+        # Stored column kept up to date by films.signals, no per-row aggregate
+        return round(obj.average_rating, 2) if obj.average_rating is not None else "-"
 
 
 @admin.register(FilmReview)
@@ -61,3 +64,8 @@ class FilmReviewAdmin(admin.ModelAdmin):
     list_display = ("film", "user", "rating", "created_at")
     list_filter = ("rating", "created_at")
     search_fields = ("film__title", "user__user__username")
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Film title and spectator username for each row come from the same query (no per-row queries)
+        return super().get_queryset(request).select_related("film", "user__user")
@@ -1,3 +1,5 @@
+from datetime import date, timedelta
+
 import factory
 
 from films.models import Film, FilmReview
@@ -8,9 +10,10 @@ class FilmFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Film
 
-    title = factory.Faker("sentence", nb_words=3)
-    description = factory.Faker("paragraph")
-    release_date = factory.Faker("date_object")
+    # Sequences instead of Faker: tests only need distinct values, not realistic text
+    title = factory.Sequence(lambda n: f"Film {n}")
+    description = factory.Sequence(lambda n: f"Description of film {n}.")
+    release_date = factory.Sequence(lambda n: date(2000, 1, 1) + timedelta(days=n))
     evaluation = "G"
     status = "published"
 
@@ -37,5 +40,5 @@ class FilmReviewFactory(factory.django.DjangoModelFactory):
 
     film = factory.SubFactory(FilmFactory)
     user = factory.SubFactory(SpectatorFactory)
-    rating = factory.Faker("random_int", min=1, max=5)
-    comment = factory.Faker("sentence")
+    rating = factory.Sequence(lambda n: n % 5 + 1)
+    comment = factory.Sequence(lambda n: f"Review {n}.")
@@ -0,0 +1,30 @@
+import django_filters
+from django.contrib.postgres.search import SearchQuery
+from rest_framework import filters
+
+from .models import SEARCH_CONFIG, Film
+
+
+class FilmFilter(django_filters.FilterSet):
+    """
+    Exact-match `?status=`, `?evaluation=` and `?source=` filters.
+    Declared once here: with `filterset_fields`, DjangoFilterBackend builds a new FilterSet class on every request.
+    """
+
+    class Meta:
+        model = Film
+        fields = ["status", "evaluation", "source"]
+
+
+class FilmSearchFilter(filters.SearchFilter):
+    """
+    `?search=` backed by the indexed Film.search_vector instead of ILIKE '%term%' on each search field.
+    Terms are matched as French lexemes (stemmed, accent- and case-insensitive) with web search syntax:
+    words are ANDed, "quoted phrases", `or` and `-excluded` are supported.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, "").replace("\x00", "").strip()
+        if not term:
+            return queryset
+        return queryset.filter(search_vector=SearchQuery(term, config=SEARCH_CONFIG, search_type="websearch"))
@@ -2,15 +2,28 @@ from django.core.management.base import BaseCommand
 
 from films.services import TMDBService
 
+# Movies written per transaction
+DEFAULT_BATCH_SIZE = 20
+# Concurrent TMDb requests while prefetching a batch
+DEFAULT_WORKERS = 8
+
 
 class Command(BaseCommand):
     help = "Import movies and authors from TMDb API"
 
     def add_arguments(self, parser):
         parser.add_argument("--limit", type=int, default=10, help="Number of movies to import")
+        parser.add_argument(
+            "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Number of movies committed per transaction"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=DEFAULT_WORKERS, help="Number of concurrent TMDb requests per batch"
+        )
 
     def handle(self, *args, **options):
         limit = options["limit"]
+        batch_size = max(options["batch_size"], 1)
+        workers = max(options["workers"], 1)
         service = TMDBService()
 
         self.stdout.write(f"Fetching top {limit} popular movies...")
@@ -21,13 +34,17 @@ class Command(BaseCommand):
             return
 
         count = 0
-        for movie_data in movies:
-            self.stdout.write(f"Processing {movie_data.get('title')}...")
-            film = service.import_movie(movie_data)
-            if film:
-                count += 1
-                self.stdout.write(self.style.SUCCESS(f"Successfully imported {film.title}"))
-            else:
-                self.stdout.write(self.style.WARNING(f"Failed to import {movie_data.get('title')}"))
+        for start in range(0, len(movies), batch_size):
+            batch = movies[start : start + batch_size]
+            self.stdout.write(f"Processing {len(batch)} movies...")
+            # One transaction and one upsert per model for the whole batch
+            films = service.import_movies(batch, max_workers=workers)
+            for movie_data in batch:
+                film = films.get(movie_data.get("id"))
+                if film:
+                    count += 1
+                    self.stdout.write(self.style.SUCCESS(f"Successfully imported {film.title}"))
+                else:
+                    self.stdout.write(self.style.WARNING(f"Failed to import {movie_data.get('title')}"))
 
         self.stdout.write(self.style.SUCCESS(f"Finished! Imported {count} movies."))
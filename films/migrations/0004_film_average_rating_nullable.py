@@ -0,0 +1,27 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:26
+
+from django.db import migrations, models
+from django.db.models import Avg, OuterRef, Subquery
+
+
+def backfill_average_rating(apps, schema_editor):
+    Film = apps.get_model("films", "Film")
+    FilmReview = apps.get_model("films", "FilmReview")
+    average = FilmReview.objects.filter(film=OuterRef("pk")).values("film").annotate(avg=Avg("rating")).values("avg")
+    Film.objects.update(average_rating=Subquery(average))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("films", "0003_remove_film_film_author_status_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="film",
+            name="average_rating",
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_average_rating, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:27
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("films", "0004_film_average_rating_nullable"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="filmreview",
+            name="rating",
+            field=models.PositiveSmallIntegerField(
+                validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)]
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="filmreview",
+            constraint=models.CheckConstraint(
+                check=models.Q(("rating__gte", 1), ("rating__lte", 5)), name="film_review_rating_range"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("films", "0005_filmreview_rating_constraint"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="film",
+            name="release_date",
+            field=models.DateField(),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("films", "0006_remove_film_release_date_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="film",
+            name="tmdb_poster_path",
+            field=models.CharField(blank=True, default="", editable=False, max_length=255),
+        ),
+    ]
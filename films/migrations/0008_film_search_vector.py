@@ -0,0 +1,49 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Keeps films_film.search_vector in sync on every INSERT and on UPDATEs touching title or description,
+# including bulk_create() and QuerySet.update() which bypass model signals. Must match films.models.SEARCH_CONFIG.
+CREATE_TRIGGER = """
+CREATE FUNCTION films_film_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('french', coalesce(NEW.title, '')), 'A')
+        || setweight(to_tsvector('french', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER films_film_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON films_film
+    FOR EACH ROW EXECUTE FUNCTION films_film_search_vector_update();
+
+UPDATE films_film SET title = title;
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS films_film_search_vector_trigger ON films_film;
+DROP FUNCTION IF EXISTS films_film_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("films", "0007_film_tmdb_poster_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="film",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="film",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="film_search_vector_idx"),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
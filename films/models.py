@@ -1,7 +1,14 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Q
 
 from core.models import TimestampedModelMixin
 
+# Text search configuration of Film.search_vector (see migration 0008); queries must use the same one
+SEARCH_CONFIG = "french"
+
 
 class Film(TimestampedModelMixin):
     STATUS_CHOICES = [
@@ -25,7 +32,7 @@ class Film(TimestampedModelMixin):
 
     title = models.CharField(max_length=255, db_index=True)
     description = models.TextField()
-    release_date = models.DateField(db_index=True)
+    release_date = models.DateField()
     evaluation = models.CharField(max_length=10, choices=EVALUATION_CHOICES, default="G")
     authors = models.ManyToManyField("authors.Author", related_name="films")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="draft", db_index=True)
@@ -34,7 +41,12 @@ class Film(TimestampedModelMixin):
     tmdb_id = models.IntegerField(unique=True, null=True, blank=True)
     source = models.CharField(max_length=10, choices=SOURCE_CHOICES, default="ADMIN")
     poster = models.ImageField(upload_to="film_posters/", null=True, blank=True)
-    average_rating = models.FloatField(default=0.0, db_index=True)
+    # TMDb path the stored poster was downloaded from, to skip unchanged posters on re-import
+    tmdb_poster_path = models.CharField(max_length=255, blank=True, default="", editable=False)
+    # Maintained by films.signals whenever a review is saved or deleted; NULL until the first review
+    average_rating = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    # Weighted title (A) + description (B) tsvector, filled by a database trigger on every write (migration 0008)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = "Film"
@@ -43,6 +55,7 @@ class Film(TimestampedModelMixin):
         indexes = [
             # Composite indexes for common query patterns
             models.Index(fields=["status", "release_date"], name="film_status_date_idx"),
+            GinIndex(fields=["search_vector"], name="film_search_vector_idx"),
         ]
 
     def __str__(self):
@@ -52,7 +65,8 @@ class Film(TimestampedModelMixin):
 class FilmReview(TimestampedModelMixin):
     film = models.ForeignKey(Film, on_delete=models.CASCADE, related_name="reviews")
     user = models.ForeignKey("spectators.Spectator", on_delete=models.CASCADE, related_name="film_reviews")
-    rating = models.IntegerField(choices=[(i, i) for i in range(1, 6)])
+    # Range enforced by the database (see Meta.constraints); the validators only give API/form errors
+    rating = models.PositiveSmallIntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
     comment = models.TextField(blank=True)
 
     class Meta:
@@ -63,6 +77,9 @@ class FilmReview(TimestampedModelMixin):
             # For listing reviews of a film sorted by date (unique_together covers film lookup)
             models.Index(fields=["film", "-created_at"], name="review_film_date_idx"),
         ]
+        constraints = [
+            models.CheckConstraint(check=Q(rating__gte=1, rating__lte=5), name="film_review_rating_range"),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.film} ({self.rating}/5)"
@@ -1,7 +1,21 @@
+from django.db.models import Prefetch, QuerySet
 from rest_framework import serializers
 
+from authors.models import Author
+
 from .models import Film, FilmReview
 
+# Shared formatter; kept at module level so it is not collected as a serializer field
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+def _file_url(file, context):
+    """Same output as a read-only ImageField: absolute URL when there is a request, None when empty."""
+    if not file:
+        return None
+    request = context.get("request")
+    return request.build_absolute_uri(file.url) if request is not None else file.url
+
 
 class FilmReviewSerializer(serializers.ModelSerializer):
     user: serializers.StringRelatedField = serializers.StringRelatedField(read_only=True)  # type: ignore[assignment]
@@ -16,7 +30,13 @@ class FilmReviewSerializer(serializers.ModelSerializer):
 
 
 class AuthorNestedSerializer(serializers.Serializer):
-    """Minimal serializer for the author nested in a film (avoids circular reference)."""
+    """
+    Minimal serializer for the author nested in a film (avoids circular reference).
+
+    The declared fields describe the output (and the OpenAPI schema), but to_representation builds
+    the dict directly: this runs for every author of every film in list responses, where walking
+    11 fields through get_attribute dominates the serialization time. Expects select_related("user").
+    """
 
     id = serializers.IntegerField(read_only=True)
     user_id = serializers.IntegerField(source="user.id", read_only=True)
@@ -31,6 +51,24 @@ class AuthorNestedSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
 
+    def to_representation(self, instance):
+        user = instance.user
+        return {
+            "id": instance.id,
+            "user_id": user.id,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+            "date_of_birth": instance.date_of_birth.isoformat() if instance.date_of_birth else None,
+            "bio": instance.bio,
+            "tmdb_id": instance.tmdb_id,
+            "photo": _file_url(instance.photo, self.context),
+            # Same formatting as the declared fields (current timezone, ISO 8601 with "Z")
+            "created_at": _DATETIME_FIELD.to_representation(instance.created_at),
+            "updated_at": _DATETIME_FIELD.to_representation(instance.updated_at),
+        }
+
 
 class FilmSerializer(serializers.ModelSerializer):
     authors = AuthorNestedSerializer(many=True, read_only=True)
@@ -44,7 +82,18 @@ class FilmSerializer(serializers.ModelSerializer):
     )
 
     reviews = FilmReviewSerializer(many=True, read_only=True)
-    average_rating = serializers.FloatField(source="avg_rating", read_only=True)
+    average_rating = serializers.FloatField(read_only=True)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet[Film]) -> QuerySet[Film]:
+        """
+        Load everything this serializer reads in a constant number of queries:
+        authors with their user and reviews with the spectator's user.
+        """
+        return queryset.prefetch_related(
+            Prefetch("authors", queryset=Author.objects.select_related("user")),
+            Prefetch("reviews", queryset=FilmReview.objects.select_related("user__user")),
+        )
 
     class Meta:
         model = Film
@@ -65,3 +114,42 @@ class FilmSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["created_at", "updated_at", "average_rating"]
+
+
+class FilmListSerializer(FilmSerializer):
+    """
+    FilmSerializer for the list action, with the same output built as plain dicts.
+
+    Like AuthorNestedSerializer, this skips the per-field dispatch that dominates list serialization
+    (every film with its authors and reviews). Writes and detail views keep FilmSerializer.
+    Expects FilmSerializer.setup_eager_loading.
+    """
+
+    def to_representation(self, instance):
+        author_serializer = self.fields["authors"].child
+        return {
+            "id": instance.id,
+            "title": instance.title,
+            "description": instance.description,
+            "release_date": instance.release_date.isoformat() if instance.release_date else None,
+            "evaluation": instance.evaluation,
+            "status": instance.status,
+            "authors": [author_serializer.to_representation(author) for author in instance.authors.all()],
+            "tmdb_id": instance.tmdb_id,
+            "poster": _file_url(instance.poster, self.context),
+            "reviews": [
+                {
+                    "id": review.id,
+                    "user": str(review.user),
+                    "film": review.film_id,
+                    "film_title": instance.title,
+                    "rating": review.rating,
+                    "comment": review.comment,
+                    "created_at": _DATETIME_FIELD.to_representation(review.created_at),
+                }
+                for review in instance.reviews.all()
+            ],
+            "average_rating": float(instance.average_rating) if instance.average_rating is not None else None,
+            "created_at": _DATETIME_FIELD.to_representation(instance.created_at),
+            "updated_at": _DATETIME_FIELD.to_representation(instance.updated_at),
+        }
@@ -1,11 +1,19 @@
 import logging
-from typing import Any
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, cast
 
 import requests
 from decouple import config
 from django.contrib.auth import get_user_model
-from django.core.files.base import ContentFile
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import File
 from django.db import transaction
+from django.utils.text import slugify
+from requests.adapters import HTTPAdapter
 
 from authors.models import Author
 from films.models import Film
@@ -17,12 +25,26 @@ User = get_user_model()
 class TMDBService:
     BASE_URL = "https://api.themoviedb.org/3"
     IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+    # (connect, read) timeouts in seconds
+    REQUEST_TIMEOUT = (3, 10)
+    HTTP_POOL_SIZE = 20
+    IMAGE_CHUNK_SIZE = 64 * 1024
 
     def __init__(self):
         self.api_key = config("TMDB_API_KEY", default="")
         if not self.api_key:
             logger.warning("TMDB_API_KEY is not set.")
 
+        # One keep-alive session for the whole run so TCP/TLS setup is paid once per host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE, pool_maxsize=self.HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        # Per-run memos of TMDb lookups (a director usually appears in several movies), shared by the
+        # prefetch worker threads: director data keyed by movie tmdb_id, person details by person id
+        self._lookup_lock = threading.Lock()
+        self._director_data: dict[int, tuple[dict[str, Any], dict[str, Any] | None] | None] = {}
+        self._person_details: dict[int, dict[str, Any]] = {}
+
     def get_popular_movies(self, limit: int = 10) -> list[dict[str, Any]]:
         """
         Fetch popular movies from TMDb.
@@ -31,10 +53,10 @@ class TMDBService:
             return []
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/movie/popular",
                 params={"api_key": self.api_key, "language": "fr-FR"},
-                timeout=10,
+                timeout=self.REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             return response.json().get("results", [])[:limit]
@@ -42,184 +64,252 @@ class TMDBService:
             logger.error(f"Error fetching popular movies: {e}")
             return []
 
-    @transaction.atomic
+    def prefetch_directors(self, tmdb_ids: Iterable[int], max_workers: int = 8) -> None:
+        """
+        Fetch director credits and person details for several movies concurrently.
+        Only network I/O runs in the worker threads; import_movies picks up the results
+        and does the database writes on the calling thread.
+        """
+        missing = {tmdb_id for tmdb_id in tmdb_ids if tmdb_id and tmdb_id not in self._director_data}
+        if not missing:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the iterator so worker exceptions are raised here
+            list(executor.map(self._get_director_data, missing))
+
     def import_movie(self, movie_data: dict[str, Any]) -> Film | None:
         """
         Import a single movie and its director.
         """
         tmdb_id = movie_data.get("id")
-        title = movie_data.get("title")
-        release_date = movie_data.get("release_date")
-
-        if not all([tmdb_id, title, release_date]):
-            logger.warning(f"Skipping movie {title}: missing required data.")
+        if not isinstance(tmdb_id, int):
             return None
+        return self.import_movies([movie_data]).get(tmdb_id)
 
-        logger.info(f"Importing movie: {title} ({tmdb_id})")
+    def import_movies(self, movies: Iterable[dict[str, Any]], max_workers: int = 8) -> dict[int, Film]:
+        """
+        Import several movies and their directors, returning the imported films keyed by tmdb_id.
 
-        # Import Director first
-        if tmdb_id is None:
-            logger.warning(f"Missing tmdb_id for movie {title}, skipping.")
-            return None
-        director = self._fetch_and_import_director(tmdb_id)
-        if not director:
-            logger.warning(f"No director found for movie {title}, skipping.")
-            return None
+        Director data is fetched first (concurrently), then users, authors and films are each written
+        with a single INSERT ... ON CONFLICT in one transaction, and images are downloaded last.
+        """
+        valid_movies: dict[int, dict[str, Any]] = {}
+        for movie_data in movies:
+            tmdb_id = movie_data.get("id")
+            title = movie_data.get("title")
+            if not isinstance(tmdb_id, int) or not all([tmdb_id, title, movie_data.get("release_date")]):
+                logger.warning(f"Skipping movie {title}: missing required data.")
+                continue
+            valid_movies[tmdb_id] = movie_data
+        if not valid_movies:
+            return {}
+
+        self.prefetch_directors(valid_movies, max_workers=max_workers)
+        directors: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+        for tmdb_id, movie_data in valid_movies.items():
+            director_data = self._director_data.get(tmdb_id)
+            if director_data is None:
+                logger.warning(f"No director found for movie {movie_data['title']}, skipping.")
+                continue
+            person_data, person_details = director_data
+            directors[tmdb_id] = (person_data, person_details or {})
+
+        with transaction.atomic():
+            authors = self._save_authors(directors.values())
+            movies_to_save = [
+                movie_data
+                for tmdb_id, movie_data in valid_movies.items()
+                if tmdb_id in directors and directors[tmdb_id][0].get("id") in authors
+            ]
+            films = self._save_films(movies_to_save)
+            Film.authors.through.objects.bulk_create(
+                [
+                    Film.authors.through(film_id=films[tmdb_id].pk, author_id=authors[directors[tmdb_id][0]["id"]].pk)
+                    for tmdb_id in films
+                ],
+                ignore_conflicts=True,
+            )
 
-        # Create or Update Film
-        film, created = Film.objects.update_or_create(
-            tmdb_id=tmdb_id,
-            defaults={
-                "title": title,
-                "description": movie_data.get("overview", ""),
-                "release_date": release_date,
-                "status": "published",
-                "evaluation": "G",  # Default
-                "source": "TMDB",
-            },
+        # File I/O stays out of the transaction: a failed download must not roll back the rows
+        for person_data, person_details in directors.values():
+            person_id = person_data.get("id")
+            if not isinstance(person_id, int) or person_id not in authors:
+                continue
+            profile_path = person_details.get("profile_path") or person_data.get("profile_path")
+            if profile_path:
+                self._download_and_save_author_photo(authors[person_id], profile_path, person_id)
+        for tmdb_id, film in films.items():
+            poster_path = valid_movies[tmdb_id].get("poster_path")
+            if poster_path:
+                self._download_and_save_poster(film, poster_path, tmdb_id)
+
+        return films
+
+    def _save_films(self, movies: list[dict[str, Any]]) -> dict[int, Film]:
+        """
+        Create or update films from TMDb movie data, keyed by tmdb_id.
+        """
+        if not movies:
+            return {}
+        Film.objects.bulk_create(
+            [
+                Film(
+                    tmdb_id=movie_data["id"],
+                    title=movie_data["title"],
+                    description=movie_data.get("overview", ""),
+                    release_date=movie_data["release_date"],
+                    status="published",
+                    evaluation="G",  # Default
+                    source="TMDB",
+                )
+                for movie_data in movies
+            ],
+            update_conflicts=True,
+            unique_fields=["tmdb_id"],
+            update_fields=["title", "description", "release_date", "status", "evaluation", "source", "updated_at"],
         )
+        # Primary keys are not returned for upserted rows, so read the films back in one query
+        return Film.objects.in_bulk([movie_data["id"] for movie_data in movies], field_name="tmdb_id")
 
-        # Add director to authors
-        film.authors.add(director)
-
-        # Handle Poster - always update if poster_path exists
-        poster_path = movie_data.get("poster_path")
-        if poster_path:
-            self._download_and_save_poster(film, poster_path, tmdb_id)
+    def _save_authors(self, directors: Iterable[tuple[dict[str, Any], dict[str, Any] | None]]) -> dict[int, Author]:
+        """
+        Create or update authors (and their users) from TMDb person data, keyed by person tmdb_id.
+        Existing users are left untouched, new ones get an unusable password.
+        """
+        people: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+        for person_data, person_details in directors:
+            if person_data.get("id") and person_data.get("name"):
+                people[person_data["id"]] = (person_data, person_details or {})
+        if not people:
+            return {}
+
+        new_users = []
+        for tmdb_id, (person_data, _) in people.items():
+            # Split name into first_name and last_name
+            name_parts = person_data["name"].split(maxsplit=1)
+            username = f"tmdb_{tmdb_id}"
+            new_users.append(
+                User(
+                    username=username,
+                    email=f"{username}@example.com",
+                    first_name=name_parts[0] if name_parts else "",
+                    last_name=name_parts[1] if len(name_parts) > 1 else "",
+                    role="author",
+                    password=make_password(None),
+                )
+            )
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+        users = User.objects.in_bulk([user.username for user in new_users], field_name="username")
+
+        author_rows = []
+        for tmdb_id, (_, person_details) in people.items():
+            user = users[f"tmdb_{tmdb_id}"]
+            if user.role == "spectator":
+                logger.warning(f"User {user.username} is a spectator, skipping author {tmdb_id}.")
+                continue
+            bio = person_details.get("biography", "") or ""
+            author_rows.append(
+                Author(
+                    user=user,
+                    tmdb_id=tmdb_id,
+                    source="TMDB",
+                    date_of_birth=self._parse_birthday(person_details.get("birthday")),
+                    bio=bio[:1000],  # Limit bio length
+                )
+            )
+        if not author_rows:
+            return {}
+        Author.objects.bulk_create(
+            author_rows,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["tmdb_id", "source", "date_of_birth", "bio", "updated_at"],
+        )
+        saved = Author.objects.filter(user__in=[author.user for author in author_rows]).select_related("user")
+        # Every saved row was given a tmdb_id above
+        return {cast(int, author.tmdb_id): author for author in saved}
 
-        return film
+    @staticmethod
+    def _parse_birthday(value: str | None) -> date | None:
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except (ValueError, TypeError):
+            return None
 
-    def _fetch_and_import_director(self, tmdb_id: int) -> Author | None:  # type: ignore[misc]
+    def _get_director_data(self, tmdb_id: int) -> tuple[dict[str, Any], dict[str, Any] | None] | None:
+        """
+        Memoized _fetch_director_data: credits are requested at most once per movie and run.
         """
-        Fetch credits and import the first director found.
+        with self._lookup_lock:
+            if tmdb_id in self._director_data:
+                return self._director_data[tmdb_id]
+        director_data = self._fetch_director_data(tmdb_id)
+        with self._lookup_lock:
+            self._director_data[tmdb_id] = director_data
+        return director_data
+
+    def _fetch_director_data(self, tmdb_id: int) -> tuple[dict[str, Any], dict[str, Any] | None] | None:
+        """
+        Fetch the first director credited on a movie and their person details (network only).
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/movie/{tmdb_id}/credits",
                 params={"api_key": self.api_key},
-                timeout=10,
+                timeout=self.REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             crew = response.json().get("crew", [])
-
-            directors = [member for member in crew if member["job"] == "Director"]
-            if directors:
-                return self._import_author(directors[0])
-            return None
-
         except requests.RequestException as e:
             logger.error(f"Error fetching credits for tmdb_id {tmdb_id}: {e}")
             return None
 
-    def _import_author(self, person_data: dict[str, Any]) -> Author | None:
-        """
-        Import an author (director) from TMDb person data.
-        Fetches additional details (birthday, bio) from the person endpoint.
-        """
-        tmdb_id = person_data.get("id")
-        name = person_data.get("name")
-
-        if not tmdb_id or not name:
+        director = next((member for member in crew if member["job"] == "Director"), None)
+        if director is None:
             return None
-
-        # Fetch full person details for birthday and biography
-        person_details = self._fetch_person_details(tmdb_id)
-
-        # Create User
-        username = f"tmdb_{tmdb_id}"
-        email = f"{username}@example.com"
-
-        # Split name into first_name and last_name
-        name_parts = name.split(maxsplit=1)
-        first_name = name_parts[0] if name_parts else ""
-        last_name = name_parts[1] if len(name_parts) > 1 else ""
-
-        user, created = User.objects.get_or_create(
-            username=username,
-            defaults={
-                "email": email,
-                "first_name": first_name,
-                "last_name": last_name,
-                "role": "author",
-            },
-        )
-        if created:
-            user.set_unusable_password()
-            user.save()
-
-        # Extract birthday from person details
-        birthday = None
-        if person_details and person_details.get("birthday"):
-            try:
-                from datetime import datetime
-
-                birthday = datetime.strptime(person_details["birthday"], "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                birthday = None
-
-        # Extract biography
-        bio = ""
-        if person_details:
-            bio = person_details.get("biography", "") or ""
-
-        # Create Author
-        author, _ = Author.objects.update_or_create(
-            user=user,
-            defaults={
-                "tmdb_id": tmdb_id,
-                "source": "TMDB",
-                "date_of_birth": birthday,
-                "bio": bio[:1000] if bio else "",  # Limit bio length
-            },
-        )
-
-        # Handle Photo - use profile_path from person_details if available
-        profile_path = (person_details.get("profile_path") if person_details else None) or person_data.get(
-            "profile_path"
-        )
-        if profile_path:
-            self._download_and_save_author_photo(author, profile_path, tmdb_id)
-
-        return author
+        person_details = (self._fetch_person_details(director["id"]) if director.get("id") else None) or {}
+        return director, person_details
 
     def _fetch_person_details(self, person_id: int) -> dict[str, Any] | None:
         """
         Fetch detailed person information from TMDb API.
         Returns birthday, biography, profile_path, etc.
+        Successful lookups are memoized for the lifetime of the service (one import run).
         """
+        with self._lookup_lock:
+            cached = self._person_details.get(person_id)
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/person/{person_id}",
                 params={"api_key": self.api_key, "language": "fr-FR"},
-                timeout=10,
+                timeout=self.REQUEST_TIMEOUT,
             )
             response.raise_for_status()
-            return response.json()
+            person_details = response.json()
         except requests.RequestException as e:
             logger.warning(f"Could not fetch person details for {person_id}: {e}")
             return None
+        with self._lookup_lock:
+            self._person_details[person_id] = person_details
+        return person_details
 
     def _download_and_save_poster(self, film, poster_path: str, tmdb_id: int) -> None:
         """
         Download and save poster for a film, removing old file first.
         Uses film title for readable filename.
+        Skipped when the stored file already comes from the same TMDb path (TMDb gives a new path to a new image).
         """
+        if film.poster and film.tmdb_poster_path == poster_path:
+            return
         try:
-            from django.utils.text import slugify
-
-            url = f"{self.IMAGE_BASE_URL}{poster_path}"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                # Delete old poster file if it exists
-                if film.poster:
-                    film.poster.delete(save=False)
-
-                # Create clean filename from title
-                clean_title = slugify(film.title)
-                filename = f"poster_{clean_title}.jpg"
-
-                # Save new poster with readable filename
-                film.poster.save(filename, ContentFile(response.content), save=True)
+            filename = f"poster_{slugify(film.title)}.jpg"
+            if self._stream_image_to_field(f"{self.IMAGE_BASE_URL}{poster_path}", film.poster, filename, save=False):
+                film.tmdb_poster_path = poster_path
+                film.save(update_fields=["poster", "tmdb_poster_path", "updated_at"] if film.pk else None)
         except Exception as e:
             logger.error(f"Failed to download poster for film {tmdb_id}: {e}")
 
@@ -227,45 +317,48 @@ class TMDBService:
         """
         Download and save author photo, removing old file first.
         Uses author's first and last name for readable filename.
+        Skipped when the stored file already comes from the same TMDb path.
         """
+        if author.photo and author.tmdb_profile_path == profile_path:
+            return
         try:
-            from django.utils.text import slugify
-
-            url = f"{self.IMAGE_BASE_URL}{profile_path}"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                # Delete old photo file if it exists
-                if author.photo:
-                    author.photo.delete(save=False)
-
-                # Create clean filename from first and last name
-                first_name = slugify(author.user.first_name) if author.user.first_name else ""
-                last_name = slugify(author.user.last_name) if author.user.last_name else ""
-
-                if first_name and last_name:
-                    filename = f"author_{first_name}_{last_name}.jpg"
-                elif first_name or last_name:
-                    filename = f"author_{first_name or last_name}.jpg"
-                else:
-                    # Fallback to username if no name available
-                    filename = f"author_{slugify(author.user.username)}.jpg"
-
-                # Save new photo with readable filename
-                author.photo.save(filename, ContentFile(response.content), save=True)
+            first_name = slugify(author.user.first_name) if author.user.first_name else ""
+            last_name = slugify(author.user.last_name) if author.user.last_name else ""
+
+            if first_name and last_name:
+                filename = f"author_{first_name}_{last_name}.jpg"
+            elif first_name or last_name:
+                filename = f"author_{first_name or last_name}.jpg"
+            else:
+                # Fallback to username if no name available
+                filename = f"author_{slugify(author.user.username)}.jpg"
+
+            if self._stream_image_to_field(f"{self.IMAGE_BASE_URL}{profile_path}", author.photo, filename, save=False):
+                author.tmdb_profile_path = profile_path
+                author.save(
+                    update_fields=["photo", "tmdb_profile_path", "updated_at"] if author.pk else None, skip_clean=True
+                )
         except Exception as e:
             logger.error(f"Failed to download photo for author {tmdb_id}: {e}")
 
-    def _download_and_save_image(self, url: str, model_field, filename: str) -> None:
+    def _stream_image_to_field(self, url: str, model_field, filename: str, save: bool = True) -> bool:
         """
-        Helper to download an image and save it to a model field.
-        Deletes the old file first to prevent duplicates.
+        Stream an image into a temporary file chunk by chunk, then save it to a model field,
+        so only one chunk of the body is held in memory at a time.
+        Nothing is changed unless the download answers 200; returns whether the file was replaced.
         """
+        response = self.session.get(url, stream=True, timeout=self.REQUEST_TIMEOUT)
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
+            if response.status_code != 200:
+                return False
+            with tempfile.TemporaryFile() as tmp:
+                for chunk in response.iter_content(chunk_size=self.IMAGE_CHUNK_SIZE):
+                    tmp.write(chunk)
+                tmp.seek(0)
                 # Delete old file if it exists to prevent duplicates
                 if model_field and model_field.name:
                     model_field.delete(save=False)
-                model_field.save(filename, ContentFile(response.content), save=True)
-        except Exception as e:
-            logger.error(f"Failed to download image {url}: {e}")
+                model_field.save(filename, File(tmp, name=filename), save=save)
+        finally:
+            response.close()
+        return True
@@ -0,0 +1,53 @@
+from collections.abc import Iterable
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Avg, OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Film, FilmReview
+
+
+def update_average_ratings(film_ids: Iterable[int]) -> None:
+    """
+    Recompute Film.average_rating in a single UPDATE ... SET average_rating = (SELECT AVG(...)).
+    NULL when the film has no reviews. Goes through QuerySet.update() rather than Film.save(), so only
+    this column is written and updated_at is not bumped by a rating change.
+    """
+    average = FilmReview.objects.filter(film=OuterRef("pk")).values("film").annotate(avg=Avg("rating")).values("avg")
+    Film.objects.filter(pk__in=film_ids).update(average_rating=Subquery(average))
+
+
+def update_average_rating(film_id: int) -> None:
+    update_average_ratings([film_id])
+
+
+def _schedule_update(film_id: int) -> None:
+    # Once the review write is committed, so the average never includes rolled-back ratings
+    transaction.on_commit(partial(update_average_rating, film_id))
+
+
+@receiver(pre_save, sender=FilmReview, dispatch_uid="films_review_track_film")
+def track_previous_film(sender, instance, update_fields=None, **kwargs):
+    """Remember the film a review is moved away from, so its average is refreshed too."""
+    instance._previous_film_id = None
+    if instance._state.adding or (update_fields is not None and "film" not in update_fields):
+        return
+    previous_film_id = FilmReview.objects.filter(pk=instance.pk).values_list("film_id", flat=True).first()
+    if previous_film_id != instance.film_id:
+        instance._previous_film_id = previous_film_id
+
+
+@receiver(post_save, sender=FilmReview, dispatch_uid="films_review_saved")
+def review_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {"rating", "film"} & set(update_fields):
+        return
+    _schedule_update(instance.film_id)
+    if getattr(instance, "_previous_film_id", None):
+        _schedule_update(instance._previous_film_id)
+
+
+@receiver(post_delete, sender=FilmReview, dispatch_uid="films_review_deleted")
+def review_deleted(sender, instance, **kwargs):
+    _schedule_update(instance.film_id)
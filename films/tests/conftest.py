@@ -0,0 +1,118 @@
+"""Fixtures for the TMDb integration tests."""
+
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from django.contrib.auth import get_user_model
+
+from films.services import TMDBService
+from spectators.factories import SpectatorFactory
+
+User = get_user_model()
+
+API_PREFIX = urlsplit("https://api.themoviedb.org/3").path
+IMAGE_PREFIX = urlsplit("https://image.tmdb.org/t/p/w500").path
+
+
+def tmdb_response(status_code=200, payload=None, chunks=()):
+    """Canned TMDb HTTP response exposing only what TMDBService reads."""
+    payload = payload if payload is not None else {}
+
+    def raise_for_status():
+        if status_code >= 400:
+            raise requests.HTTPError(f"{status_code} Error")
+
+    def close():
+        response.closed = True
+
+    response = SimpleNamespace(
+        status_code=status_code,
+        closed=False,
+        json=lambda: payload,
+        raise_for_status=raise_for_status,
+        iter_content=lambda **_kwargs: iter(chunks),
+        close=close,
+    )
+    return response
+
+
+class FakeTMDB:
+    """
+    Stands in for requests.Session.get in TMDBService.
+    Responses are registered per URL path and looked up with a single dict access; anything
+    unregistered gets `fallback` (a 404 by default, or an exception instance to raise).
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+        self.fallback = tmdb_response(404)
+
+    def add(self, path, status_code=200, payload=None, chunks=()):
+        response = self.routes[path] = tmdb_response(status_code, payload, chunks)
+        return response
+
+    def add_popular(self, results):
+        return self.add(f"{API_PREFIX}/movie/popular", payload={"results": results})
+
+    def add_credits(self, movie_id, crew):
+        return self.add(f"{API_PREFIX}/movie/{movie_id}/credits", payload={"crew": crew})
+
+    def add_person(self, person_id, details):
+        return self.add(f"{API_PREFIX}/person/{person_id}", payload=details)
+
+    def add_image(self, image_path, chunks=(b"image_data",), status_code=200):
+        return self.add(f"{IMAGE_PREFIX}{image_path}", status_code, chunks=chunks)
+
+    def count(self, path_fragment):
+        return sum(path_fragment in url for url, _ in self.calls)
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        response = self.routes.get(urlsplit(url).path, self.fallback)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def tmdb(monkeypatch):
+    """Route every TMDBService HTTP call to a FakeTMDB."""
+    fake = FakeTMDB()
+    # A bound method stored on the class is not re-bound, so session.get(url, ...) calls fake.get(url, ...)
+    monkeypatch.setattr(requests.Session, "get", fake.get)
+    return fake
+
+
+@pytest.fixture
+def in_memory_storage(settings):
+    """Keep downloaded posters and photos in memory instead of writing them under MEDIA_ROOT."""
+    settings.STORAGES = {**settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+
+
+@pytest.fixture
+def tmdb_service():
+    """
+    TMDBService with a dummy API key.
+    Function-scoped on purpose: the service memoizes credits and person lookups for its lifetime,
+    so sharing one instance would leak canned responses between tests.
+    """
+    service = TMDBService()
+    service.api_key = "fake_key"
+    return service
+
+
+@pytest.fixture(scope="class")
+def shared_spectators(django_db_setup, django_db_blocker):
+    """
+    Two spectators created once per test class.
+    They live outside the per-test transaction, so tests may attach rows to them (rolled back as usual)
+    but must not modify or delete the spectators themselves.
+    """
+    with django_db_blocker.unblock():
+        spectators = SpectatorFactory.create_batch_bulk(2)
+    yield spectators
+    with django_db_blocker.unblock():
+        User.objects.filter(pk__in=[spectator.user_id for spectator in spectators]).delete()
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, patch
+from io import StringIO
+from unittest.mock import MagicMock
 
 import pytest
 from django.core.management import call_command
@@ -6,41 +7,55 @@ from django.core.management import call_command
 from films.models import Film
 
 
-@pytest.mark.django_db
+@pytest.fixture
+def mock_tmdb_service(monkeypatch):
+    """The TMDBService instance the import command will create."""
+    service_class = MagicMock()
+    monkeypatch.setattr("films.management.commands.import_tmdb.TMDBService", service_class)
+    return service_class.return_value
+
+
 class TestImportTMDBCommand:
 
-    @patch("films.management.commands.import_tmdb.TMDBService")
-    def test_import_tmdb_command_success(self, MockTMDBService):
+    def test_import_tmdb_command_success(self, mock_tmdb_service):
         # Setup mock
-        mock_service = MockTMDBService.return_value
-        mock_service.get_popular_movies.return_value = [
+        mock_tmdb_service.get_popular_movies.return_value = [
             {"id": 1, "title": "Movie 1"},
             {"id": 2, "title": "Movie 2"},
         ]
 
-        # Mock import_movie to return a Film object or None
+        # Mock import_movies to return only the first film (simulating a failure for the second)
         film1 = MagicMock(spec=Film)
         film1.title = "Movie 1"
-
-        # First call returns film1, second call returns None (simulating failure)
-        mock_service.import_movie.side_effect = [film1, None]
+        mock_tmdb_service.import_movies.return_value = {1: film1}
 
         # Run command
-        call_command("import_tmdb", limit=2)
+        out = StringIO()
+        call_command("import_tmdb", limit=2, stdout=out)
 
         # Assertions
-        mock_service.get_popular_movies.assert_called_once_with(limit=2)
-        assert mock_service.import_movie.call_count == 2
+        mock_tmdb_service.get_popular_movies.assert_called_once_with(limit=2)
+        mock_tmdb_service.import_movies.assert_called_once()
+        assert "Successfully imported Movie 1" in out.getvalue()
+        assert "Failed to import Movie 2" in out.getvalue()
+        assert "Imported 1 movies" in out.getvalue()
 
-    @patch("films.management.commands.import_tmdb.TMDBService")
-    def test_import_tmdb_command_no_movies(self, MockTMDBService):
+    def test_import_tmdb_command_no_movies(self, mock_tmdb_service):
         # Setup mock
-        mock_service = MockTMDBService.return_value
-        mock_service.get_popular_movies.return_value = []
+        mock_tmdb_service.get_popular_movies.return_value = []
 
         # Run command
         call_command("import_tmdb")
 
         # Assertions
-        mock_service.get_popular_movies.assert_called_once()
-        mock_service.import_movie.assert_not_called()
+        mock_tmdb_service.get_popular_movies.assert_called_once()
+        mock_tmdb_service.import_movies.assert_not_called()
+
+    def test_import_tmdb_command_batches(self, mock_tmdb_service):
+        mock_tmdb_service.get_popular_movies.return_value = [{"id": i, "title": f"Movie {i}"} for i in range(5)]
+        mock_tmdb_service.import_movies.return_value = {}
+
+        call_command("import_tmdb", limit=5, batch_size=2, stdout=StringIO())
+
+        # 5 movies in batches of 2 -> 3 bulk imports
+        assert [len(c.args[0]) for c in mock_tmdb_service.import_movies.call_args_list] == [2, 2, 1]
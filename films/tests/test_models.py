@@ -2,25 +2,46 @@
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 from authors.factories import AuthorFactory
-from authors.models import Author
+from authors.models import Author, full_name_expression
 from films.factories import FilmFactory
 from films.models import Film, FilmReview
 from spectators.factories import SpectatorFactory
 from users.factories import UserFactory
 
 
-@pytest.mark.django_db
-class TestFilmModel:
-    """Tests for the Film model"""
+class TestModelStrRepresentation:
+    """String representations, built in memory without touching the database"""
 
     def test_film_str_representation(self):
         """Test the string representation of the film"""
-        film = FilmFactory(title="Test Movie")
+        film = FilmFactory.build(title="Test Movie")
         assert str(film) == "Test Movie"
 
+    def test_filmreview_str_representation(self):
+        """Test the string representation of the review"""
+        review = FilmReview(
+            film=FilmFactory.build(title="Great Movie"), user=SpectatorFactory.build(), rating=5, comment="Excellent!"
+        )
+
+        review_str = str(review)
+        assert "Great Movie" in review_str
+        assert "(5/5)" in review_str
+
+    def test_author_str_representation(self):
+        """Test the string representation of the author"""
+        author = Author(user=UserFactory.build(first_name="John", last_name="Doe", role="author"))
+
+        author_str = str(author)
+        assert "John" in author_str and "Doe" in author_str
+
+
+@pytest.mark.django_db
+class TestFilmModel:
+    """Tests for the Film model"""
+
     def test_film_ordering(self):
         """Test that films are ordered by descending release date"""
         FilmFactory(title="Old Movie", release_date="2020-01-01")
@@ -35,27 +56,53 @@ class TestFilmModel:
 class TestFilmReviewModel:
     """Tests for the FilmReview model"""
 
-    def test_filmreview_str_representation(self):
-        """Test the string representation of the review"""
-        film = FilmFactory(title="Great Movie")
-        spectator = SpectatorFactory()
-        review = FilmReview.objects.create(film=film, user=spectator, rating=5, comment="Excellent!")
-
-        review_str = str(review)
-        assert "Great Movie" in review_str
-        assert "(5/5)" in review_str
-
-    def test_filmreview_unique_together(self):
+    def test_filmreview_unique_together(self, shared_spectators):
         """Test that the same spectator cannot create 2 reviews for the same film"""
         film = FilmFactory()
-        spectator = SpectatorFactory()
-
-        # First review
-        FilmReview.objects.create(film=film, user=spectator, rating=5, comment="Great!")
-
-        # Second review should fail
-        with pytest.raises(IntegrityError):
-            FilmReview.objects.create(film=film, user=spectator, rating=3, comment="Changed my mind")
+        spectator = shared_spectators[0]
+
+        # The second review violates the database constraint even without model validation
+        with pytest.raises(IntegrityError), transaction.atomic():
+            FilmReview.objects.bulk_create(
+                [
+                    FilmReview(film=film, user=spectator, rating=5, comment="Great!"),
+                    FilmReview(film=film, user=spectator, rating=3, comment="Changed my mind"),
+                ]
+            )
+        # The savepoint rolled back only the failed INSERT; the test transaction is still usable
+        assert not FilmReview.objects.filter(film=film).exists()
+
+    def test_filmreview_rating_range_enforced_by_database(self, shared_spectators):
+        """Test that the rating CHECK constraint also covers writes that skip validation"""
+        with pytest.raises(IntegrityError), transaction.atomic():
+            FilmReview.objects.bulk_create([FilmReview(film=FilmFactory(), user=shared_spectators[0], rating=6)])
+
+    def test_filmreview_maintains_average_rating(self, shared_spectators, django_capture_on_commit_callbacks):
+        """Test that Film.average_rating follows review creation, update, move and deletion"""
+        film, other_film = FilmFactory.create_batch(2)
+        assert film.average_rating is None
+        updated_at = film.updated_at
+
+        with django_capture_on_commit_callbacks(execute=True):
+            review = FilmReview.objects.create(film=film, user=shared_spectators[0], rating=5)
+            FilmReview.objects.create(film=film, user=shared_spectators[1], rating=2)
+        film.refresh_from_db()
+        assert film.average_rating == 3.5
+        # Rating recomputes only write average_rating
+        assert film.updated_at == updated_at
+
+        with django_capture_on_commit_callbacks(execute=True):
+            review.film = other_film
+            review.save()
+        film.refresh_from_db()
+        other_film.refresh_from_db()
+        assert film.average_rating == 2
+        assert other_film.average_rating == 5
+
+        with django_capture_on_commit_callbacks(execute=True):
+            review.delete()
+        other_film.refresh_from_db()
+        assert other_film.average_rating is None
 
 
 @pytest.mark.django_db
@@ -80,6 +127,21 @@ class TestAuthorModel:
         with pytest.raises(ValidationError):
             author.save()
 
+    def test_author_clean_without_loaded_user(self, django_assert_num_queries):
+        """Test that clean() checks the role without loading the user row"""
+        spectator_user = UserFactory(role="spectator")
+        author = Author(user_id=spectator_user.pk, tmdb_id=999)
+
+        with django_assert_num_queries(1), pytest.raises(ValidationError):
+            author.clean()
+
+    def test_author_save_skip_clean(self):
+        """Test that save(skip_clean=True) bypasses the role validation"""
+        spectator_user = UserFactory(role="spectator")
+        author = Author(user=spectator_user, tmdb_id=999)
+        author.save(skip_clean=True)
+        assert author.pk is not None
+
     def test_author_with_valid_role(self):
         """Test that an Author can be created with an author or admin role"""
         author_user = UserFactory(role="author")
@@ -88,10 +150,11 @@ class TestAuthorModel:
         author.save()
         assert author.user.role == "author"
 
-    def test_author_str_representation(self):
-        """Test the string representation of the author"""
-        user = UserFactory(first_name="John", last_name="Doe", role="author")
-        author = AuthorFactory(user=user)
+    def test_author_full_name_annotation_matches_property(self):
+        """Test that the SQL full name matches the Python property, including the username fallback"""
+        named = AuthorFactory(user=UserFactory(first_name="John", last_name="Doe", role="author"))
+        unnamed = AuthorFactory(user=UserFactory(first_name="", last_name="", role="author"))
 
-        author_str = str(author)
-        assert "John" in author_str and "Doe" in author_str
+        annotated = {a.pk: a for a in Author.objects.annotate(full_name_db=full_name_expression())}
+        assert annotated[named.pk].full_name == "John Doe"
+        assert annotated[unnamed.pk].full_name == unnamed.user.username
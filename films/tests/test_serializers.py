@@ -1,11 +1,16 @@
 """Tests pour améliorer la couverture des serializers"""
 
 import pytest
+from django.core.files.base import ContentFile
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
 
+from authors.factories import AuthorFactory
+from authors.models import Author
 from authors.serializers import AuthorSerializer
 from films.factories import FilmFactory
-from films.serializers import FilmReviewSerializer, FilmSerializer
-from spectators.factories import SpectatorFactory
+from films.models import Film, FilmReview
+from films.serializers import AuthorNestedSerializer, FilmListSerializer, FilmReviewSerializer, FilmSerializer
 from users.factories import AuthorUserFactory
 
 
@@ -13,12 +18,10 @@ from users.factories import AuthorUserFactory
 class TestFilmReviewSerializerExtended:
     """Extended tests for FilmReviewSerializer"""
 
-    def test_film_title_source_field(self):
+    def test_film_title_source_field(self, shared_spectators):
         """Test that film_title uses source='film.title'"""
         film = FilmFactory(title="Amazing Movie")
-        spectator = SpectatorFactory()
-
-        from films.models import FilmReview
+        spectator = shared_spectators[0]
 
         review = FilmReview.objects.create(film=film, user=spectator, rating=5, comment="Great!")
 
@@ -34,34 +37,35 @@ class TestFilmReviewSerializerExtended:
 class TestFilmSerializerExtended:
     """Extended tests for FilmSerializer"""
 
-    def test_film_serializer_with_reviews(self):
+    def test_film_serializer_with_reviews(self, shared_spectators, django_assert_num_queries):
         """Test that the serializer includes the reviews"""
         film = FilmFactory(title="Movie with Reviews")
-        spectator1 = SpectatorFactory()
-        spectator2 = SpectatorFactory()
-
-        from films.models import FilmReview
+        spectator1, spectator2 = shared_spectators
 
-        FilmReview.objects.create(film=film, user=spectator1, rating=5, comment="Great!")
-        FilmReview.objects.create(film=film, user=spectator2, rating=4, comment="Good")
+        FilmReview.objects.bulk_create(
+            [
+                FilmReview(film=film, user=spectator1, rating=5, comment="Great!"),
+                FilmReview(film=film, user=spectator2, rating=4, comment="Good"),
+            ]
+        )
 
-        serializer = FilmSerializer(film)
-        data = serializer.data
+        film = FilmSerializer.setup_eager_loading(Film.objects.filter(pk=film.pk)).get()
+        with django_assert_num_queries(0):
+            data = FilmSerializer(film).data
 
         assert "reviews" in data
         assert len(data["reviews"]) == 2
 
-    def test_film_serializer_author_nested(self):
+    def test_film_serializer_author_nested(self, django_assert_num_queries):
         """Test that the author is included with their details"""
         user = AuthorUserFactory(first_name="Steven", last_name="Spielberg", email="steven@example.com")
-        from authors.models import Author
-
         author = Author.objects.create(user=user, tmdb_id=123)
 
         film = FilmFactory(title="E.T.", authors=[author])
 
-        serializer = FilmSerializer(film)
-        data = serializer.data
+        film = FilmSerializer.setup_eager_loading(Film.objects.filter(pk=film.pk)).get()
+        with django_assert_num_queries(0):
+            data = FilmSerializer(film).data
 
         assert "authors" in data
         assert len(data["authors"]) == 1
@@ -69,6 +73,31 @@ class TestFilmSerializerExtended:
         assert data["authors"][0]["first_name"] == "Steven"
         assert data["authors"][0]["last_name"] == "Spielberg"
 
+    @pytest.mark.usefixtures("in_memory_storage")
+    def test_author_nested_matches_declared_fields(self):
+        """Test that the hand-built author dict matches what the declared fields would render"""
+        author = AuthorFactory(bio="Bio")
+        author.photo.save("nested.jpg", ContentFile(b"img"), save=True)
+        request = APIRequestFactory().get("/api/films/")
+        serializer = AuthorNestedSerializer(author, context={"request": request})
+
+        assert serializer.data == serializers.Serializer.to_representation(serializer, author)
+        assert serializer.data["photo"].startswith("http://testserver/")
+
+    @pytest.mark.usefixtures("in_memory_storage")
+    def test_film_list_serializer_matches_film_serializer(self, shared_spectators):
+        """Test that the hand-built list dicts match FilmSerializer, with and without optional values"""
+        rated = FilmFactory(authors=[AuthorFactory()])
+        rated.poster.save("poster.jpg", ContentFile(b"img"), save=True)
+        FilmReview.objects.create(film=rated, user=shared_spectators[0], rating=4, comment="Good")
+        FilmFactory()
+        films = list(FilmSerializer.setup_eager_loading(Film.objects.all()))
+        context = {"request": APIRequestFactory().get("/api/films/")}
+
+        assert FilmListSerializer(films, many=True, context=context).data == (
+            FilmSerializer(films, many=True, context=context).data
+        )
+
 
 @pytest.mark.django_db
 class TestAuthorSerializerExtended:
@@ -77,8 +106,6 @@ class TestAuthorSerializerExtended:
     def test_author_serializer_read_only(self):
         """Test that the Author serializer returns data correctly"""
         user = AuthorUserFactory(first_name="Test", last_name="Author")
-        from authors.models import Author
-
         author = Author.objects.create(user=user, date_of_birth="1980-01-01", bio="Test bio")
 
         serializer = AuthorSerializer(author)
@@ -91,8 +118,6 @@ class TestAuthorSerializerExtended:
     def test_author_serializer_with_null_bio(self):
         """Test serializer with empty bio"""
         user = AuthorUserFactory(first_name="Test", last_name="Author")
-        from authors.models import Author
-
         author = Author.objects.create(user=user, date_of_birth="1980-01-01", bio="")  # Empty bio
         serializer = AuthorSerializer(author)
         data = serializer.data
@@ -1,49 +1,76 @@
 """Tests for TMDB service integration."""
 
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 import requests
+from django.core.files.base import ContentFile
 
 from authors.models import Author
+from films.factories import FilmFactory
 from films.models import Film
 from films.services import TMDBService
 from users.models import CustomUser
 
+pytestmark = pytest.mark.usefixtures("in_memory_storage")
+
+# Read-only payloads shared across tests; TMDBService only reads movie dicts
+_LONG_BIO = "A" * 2000
+_MOVIE_DATA_FULL = MappingProxyType(
+    {
+        "id": 100,
+        "title": "Imported Movie",
+        "overview": "Overview",
+        "release_date": "2023-01-01",
+        "poster_path": "/poster.jpg",
+    }
+)
+_MOVIE_DATA_NO_ID = MappingProxyType(
+    {"id": None, "title": "Movie Without ID", "overview": "Test", "release_date": "2023-01-01"}
+)
+_MOVIE_DATA_NO_DIRECTOR = MappingProxyType(
+    {
+        "id": 200,
+        "title": "Movie Without Director",
+        "overview": "Test",
+        "release_date": "2023-01-01",
+        "poster_path": "/poster.jpg",
+    }
+)
+_MOVIE_DATA_BAD_POSTER = MappingProxyType(
+    {
+        "id": 300,
+        "title": "Movie With Bad Poster",
+        "overview": "Test",
+        "release_date": "2023-01-01",
+        "poster_path": "/bad_poster.jpg",
+    }
+)
+
 
-@pytest.mark.django_db
 class TestTMDBServicePopularMovies:
     """Tests for get_popular_movies method."""
 
-    @patch("films.services.requests.get")
-    def test_get_popular_movies_success(self, mock_get):
+    def test_get_popular_movies_success(self, tmdb_service, tmdb):
         """Test successful retrieval of popular movies."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"results": [{"id": 1, "title": "Test Movie"}]}
-        mock_get.return_value = mock_response
+        tmdb.add_popular([{"id": 1, "title": "Test Movie"}])
 
-        service = TMDBService()
-        service.api_key = "fake_key"
-        movies = service.get_popular_movies(limit=1)
+        movies = tmdb_service.get_popular_movies(limit=1)
 
         assert len(movies) == 1
         assert movies[0]["title"] == "Test Movie"
 
-    @patch("films.services.requests.get")
-    def test_get_popular_movies_api_error(self, mock_get):
+    def test_get_popular_movies_api_error(self, tmdb_service, tmdb):
         """Test handling of API errors."""
-        mock_get.side_effect = requests.RequestException("API Error")
-        service = TMDBService()
-        service.api_key = "fake_key"
-        movies = service.get_popular_movies()
+        tmdb.fallback = requests.RequestException("API Error")
+        movies = tmdb_service.get_popular_movies()
         assert movies == []
 
-    def test_get_popular_movies_no_api_key(self):
+    def test_get_popular_movies_no_api_key(self, tmdb_service):
         """Test that empty list is returned when no API key is set."""
-        service = TMDBService()
-        service.api_key = ""
-        movies = service.get_popular_movies()
+        tmdb_service.api_key = ""
+        movies = tmdb_service.get_popular_movies()
         assert movies == []
 
 
@@ -51,52 +78,23 @@ class TestTMDBServicePopularMovies:
 class TestTMDBServiceImportMovie:
     """Tests for import_movie method."""
 
-    @patch("films.services.requests.get")
-    def test_import_movie_full_flow(self, mock_get):
+    def test_import_movie_full_flow(self, tmdb_service, tmdb):
         """Test complete movie import flow with director."""
-        mock_poster_resp = MagicMock()
-        mock_poster_resp.status_code = 200
-        mock_poster_resp.content = b"fake_image_data"
-
-        mock_credits_resp = MagicMock()
-        mock_credits_resp.status_code = 200
-        mock_credits_resp.json.return_value = {
-            "crew": [{"job": "Director", "id": 999, "name": "Director Name", "profile_path": "/path.jpg"}]
-        }
-
-        mock_person_resp = MagicMock()
-        mock_person_resp.status_code = 200
-        mock_person_resp.json.return_value = {
-            "id": 999,
-            "name": "Director Name",
-            "birthday": "1970-01-15",
-            "biography": "Famous director",
-            "profile_path": "/path.jpg",
-        }
-
-        def side_effect(url, **kwargs):
-            if "credits" in url:
-                return mock_credits_resp
-            if "/person/999" in url:
-                return mock_person_resp
-            if "image.tmdb.org" in url:
-                return mock_poster_resp
-            return MagicMock(status_code=404)
-
-        mock_get.side_effect = side_effect
-
-        service = TMDBService()
-        service.api_key = "fake_key"
-
-        movie_data = {
-            "id": 100,
-            "title": "Imported Movie",
-            "overview": "Overview",
-            "release_date": "2023-01-01",
-            "poster_path": "/poster.jpg",
-        }
-
-        film = service.import_movie(movie_data)
+        tmdb.add_credits(100, [{"job": "Director", "id": 999, "name": "Director Name", "profile_path": "/path.jpg"}])
+        tmdb.add_person(
+            999,
+            {
+                "id": 999,
+                "name": "Director Name",
+                "birthday": "1970-01-15",
+                "biography": "Famous director",
+                "profile_path": "/path.jpg",
+            },
+        )
+        tmdb.add_image("/poster.jpg", [b"fake_image_data"])
+        tmdb.add_image("/path.jpg", [b"fake_image_data"])
+
+        film = tmdb_service.import_movie(_MOVIE_DATA_FULL)
 
         assert film is not None
         assert film.title == "Imported Movie"
@@ -107,145 +105,124 @@ class TestTMDBServiceImportMovie:
         assert author.user.first_name == "Director"
         assert author.user.last_name == "Name"
 
-    def test_import_movie_missing_data(self):
+    def test_import_movie_missing_data(self, tmdb_service):
         """Test import with missing required data."""
-        service = TMDBService()
         movie_data = {"id": 1}  # Missing title and release_date
-        film = service.import_movie(movie_data)
+        film = tmdb_service.import_movie(movie_data)
         assert film is None
 
-    def test_import_movie_missing_tmdb_id(self):
+    def test_import_movie_missing_tmdb_id(self, tmdb_service):
         """Test import_movie when tmdb_id is None."""
-        service = TMDBService()
-        service.api_key = "fake_key"
-
-        movie_data = {
-            "id": None,
-            "title": "Movie Without ID",
-            "overview": "Test",
-            "release_date": "2023-01-01",
-        }
-
-        film = service.import_movie(movie_data)
+        film = tmdb_service.import_movie(_MOVIE_DATA_NO_ID)
         assert film is None
 
-    @patch("films.services.requests.get")
-    def test_import_movie_without_author(self, mock_get):
+    def test_import_movie_without_author(self, tmdb_service, tmdb):
         """Test import when director fetch fails."""
-        mock_get.side_effect = requests.RequestException("API Error")
-
-        service = TMDBService()
-        service.api_key = "fake_key"
-
-        movie_data = {
-            "id": 200,
-            "title": "Movie Without Director",
-            "overview": "Test",
-            "release_date": "2023-01-01",
-            "poster_path": "/poster.jpg",
-        }
+        tmdb.fallback = requests.RequestException("API Error")
 
-        film = service.import_movie(movie_data)
+        film = tmdb_service.import_movie(_MOVIE_DATA_NO_DIRECTOR)
         assert film is None
 
-    @patch("films.services.requests.get")
-    def test_import_movie_with_poster_download_failure(self, mock_get):
+    def test_import_movie_with_poster_download_failure(self, tmdb_service, tmdb):
         """Test when poster download fails but movie still created."""
-        mock_credits = MagicMock()
-        mock_credits.status_code = 200
-        mock_credits.json.return_value = {"crew": [{"job": "Director", "id": 888, "name": "Test Director"}]}
-
-        mock_person = MagicMock()
-        mock_person.status_code = 200
-        mock_person.json.return_value = {"id": 888, "name": "Test Director", "birthday": None, "biography": None}
-
-        mock_poster = MagicMock()
-        mock_poster.status_code = 404
-
-        def side_effect(url, **kwargs):
-            if "credits" in url:
-                return mock_credits
-            if "/person/888" in url:
-                return mock_person
-            if "image.tmdb.org" in url:
-                return mock_poster
-            return MagicMock(status_code=404)
-
-        mock_get.side_effect = side_effect
-
-        service = TMDBService()
-        service.api_key = "fake_key"
-
-        movie_data = {
-            "id": 300,
-            "title": "Movie With Bad Poster",
-            "overview": "Test",
-            "release_date": "2023-01-01",
-            "poster_path": "/bad_poster.jpg",
-        }
-
-        film = service.import_movie(movie_data)
+        tmdb.add_credits(300, [{"job": "Director", "id": 888, "name": "Test Director"}])
+        tmdb.add_person(888, {"id": 888, "name": "Test Director", "birthday": None, "biography": None})
+        tmdb.add_image("/bad_poster.jpg", status_code=404)
+
+        film = tmdb_service.import_movie(_MOVIE_DATA_BAD_POSTER)
         assert film is not None
         assert film.title == "Movie With Bad Poster"
 
+    def test_import_movies_bulk_upsert(self, tmdb_service, tmdb):
+        """Test that a batch shares directors and re-importing updates films in place."""
+        for movie_id in (501, 502):
+            tmdb.add_credits(movie_id, [{"job": "Director", "id": 4242, "name": "Shared Director"}])
+        tmdb.add_person(4242, {"birthday": "1946-12-18", "biography": "Bio"})
+
+        movies = [
+            {"id": 501, "title": "First", "overview": "One", "release_date": "2020-01-01"},
+            {"id": 502, "title": "Second", "overview": "Two", "release_date": "2021-01-01"},
+            {"id": 503, "title": "Incomplete"},
+        ]
+
+        films = tmdb_service.import_movies(movies)
+
+        assert set(films) == {501, 502}
+        author = Author.objects.get(tmdb_id=4242)
+        assert author.user.username == "tmdb_4242"
+        assert not author.user.has_usable_password()
+        assert set(author.films.values_list("tmdb_id", flat=True)) == {501, 502}
+
+        movies[0]["title"] = "First (Renamed)"
+        films = tmdb_service.import_movies(movies[:1])
+
+        assert films[501].title == "First (Renamed)"
+        assert Film.objects.filter(tmdb_id=501).count() == 1
+        assert Author.objects.filter(tmdb_id=4242).count() == 1
+
 
 @pytest.mark.django_db
 class TestTMDBServiceDirector:
     """Tests for director fetch and import methods."""
 
-    @patch("films.services.requests.get")
-    def test_fetch_and_import_director_api_error(self, mock_get):
-        """Test that API error during director fetch returns None."""
-        mock_get.side_effect = requests.RequestException("API Error")
-
-        service = TMDBService()
-        service.api_key = "fake_key"
+    def test_import_movies_director_api_error(self, tmdb_service, tmdb):
+        """Test that an API error during the director fetch skips the movie."""
+        tmdb.fallback = requests.RequestException("API Error")
 
-        director = service._fetch_and_import_director(123)
-        assert director is None
+        assert tmdb_service.import_movies([_MOVIE_DATA_FULL]) == {}
+        assert not Author.objects.exists()
 
-    @patch("films.services.requests.get")
-    def test_fetch_and_import_director_no_directors(self, mock_get):
+    def test_import_movies_no_directors(self, tmdb_service, tmdb):
         """Test when no director found in credits."""
-        mock_credits = MagicMock()
-        mock_credits.status_code = 200
-        mock_credits.json.return_value = {
-            "crew": [
+        tmdb.add_credits(
+            999,
+            [
                 {"job": "Producer", "id": 111, "name": "Producer Name"},
                 {"job": "Writer", "id": 222, "name": "Writer Name"},
-            ]
-        }
-        mock_get.return_value = mock_credits
+            ],
+        )
 
-        service = TMDBService()
-        service.api_key = "fake_key"
+        assert tmdb_service.import_movies([{**_MOVIE_DATA_NO_DIRECTOR, "id": 999, "poster_path": None}]) == {}
+        assert not Author.objects.exists()
 
-        director = service._fetch_and_import_director(999)
-        assert director is None
+    def test_prefetch_directors_used_by_import(self, tmdb_service, tmdb):
+        """Test that prefetched director data is consumed without refetching credits."""
+        for movie_id in (10, 11):
+            tmdb.add_credits(movie_id, [{"job": "Director", "id": 321, "name": "Prefetched Director"}])
+        tmdb.add_person(321, {"birthday": "1960-02-01", "biography": "Bio"})
 
-    @patch("films.services.requests.get")
-    def test_fetch_person_details_failure(self, mock_get):
-        """Test _fetch_person_details with API error."""
-        mock_get.side_effect = requests.RequestException("API Error")
+        tmdb_service.prefetch_directors([10, 11], max_workers=1)
+        # Two credits lookups, one person lookup (same director)
+        assert len(tmdb.calls) == 3
 
-        service = TMDBService()
-        service.api_key = "fake_key"
+        films = tmdb_service.import_movies([{**_MOVIE_DATA_FULL, "id": 10, "poster_path": None}])
+        director = films[10].authors.get()
+        assert director.tmdb_id == 321
+        assert director.bio == "Bio"
+        assert len(tmdb.calls) == 3
 
-        result = service._fetch_person_details(999)
-        assert result is None
+    def test_person_details_memoized_across_movies(self, tmdb_service, tmdb):
+        """Test that a director shared by several movies is looked up once per run."""
+        for movie_id in (20, 21, 22):
+            tmdb.add_credits(movie_id, [{"job": "Director", "id": 654, "name": "Busy Director"}])
+        tmdb.add_person(654, {"birthday": None, "biography": ""})
 
-    @patch("films.services.requests.get")
-    def test_fetch_person_details_404(self, mock_get):
-        """Test _fetch_person_details with 404."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
-        mock_resp.json.return_value = {}
-        mock_get.return_value = mock_resp
+        tmdb_service.prefetch_directors([20, 21, 22], max_workers=1)
+        tmdb_service.prefetch_directors([20])
 
-        service = TMDBService()
-        service.api_key = "fake_key"
+        assert tmdb.count("/person/654") == 1
+        assert len(tmdb.calls) == 4
+
+    def test_fetch_person_details_failure(self, tmdb_service, tmdb):
+        """Test _fetch_person_details with API error."""
+        tmdb.fallback = requests.RequestException("API Error")
+
+        result = tmdb_service._fetch_person_details(999)
+        assert result is None
 
-        result = service._fetch_person_details(999)
+    def test_fetch_person_details_404(self, tmdb_service, tmdb):
+        """Test _fetch_person_details with 404."""
+        result = tmdb_service._fetch_person_details(999)
         assert result == {} or result is None
 
 
@@ -253,86 +230,34 @@ class TestTMDBServiceDirector:
 class TestTMDBServiceAuthorImport:
     """Tests for author import functionality."""
 
-    @patch("films.services.requests.get")
-    def test_import_author_with_biography(self, mock_get):
+    def test_save_authors_with_biography(self, tmdb_service):
         """Test author import with full biography (truncation)."""
-        mock_person = MagicMock()
-        mock_person.status_code = 200
-        mock_person.json.return_value = {"birthday": "1980-05-20", "biography": "A" * 2000}
-
-        mock_photo = MagicMock()
-        mock_photo.status_code = 200
-        mock_photo.content = b"photo_data"
-
-        def side_effect(url, **kwargs):
-            if "/person/" in url and "image.tmdb.org" not in url:
-                return mock_person
-            if "image.tmdb.org" in url:
-                return mock_photo
-            return MagicMock(status_code=404)
-
-        mock_get.side_effect = side_effect
+        person_data = {"id": 777, "name": "Test Author Name"}
+        person_details = {"birthday": "1980-05-20", "biography": _LONG_BIO}
 
-        service = TMDBService()
-        service.api_key = "fake_key"
-
-        person_data = {"id": 777, "name": "Test Author Name", "profile_path": "/profile.jpg"}
-
-        author = service._import_author(person_data)
-        assert author is not None
+        author = tmdb_service._save_authors([(person_data, person_details)])[777]
         assert len(author.bio) <= 1000
 
-    @patch("films.services.requests.get")
-    def test_import_author_with_single_name(self, mock_get):
+    def test_save_authors_with_single_name(self, tmdb_service):
         """Test author import with single name (no last name)."""
-        mock_person = MagicMock()
-        mock_person.status_code = 200
-        mock_person.json.return_value = {"birthday": None, "biography": ""}
-
-        mock_get.return_value = mock_person
-
-        service = TMDBService()
-        service.api_key = "fake_key"
-
         person_data = {"id": 666, "name": "Madonna"}
 
-        author = service._import_author(person_data)
-        assert author is not None
+        author = tmdb_service._save_authors([(person_data, None)])[666]
         assert author.user.first_name == "Madonna"
         assert author.user.last_name == ""
 
-    def test_import_author_missing_tmdb_id(self):
-        """Test author import without tmdb_id."""
-        service = TMDBService()
-        person_data = {"name": "Test"}
-
-        author = service._import_author(person_data)
-        assert author is None
-
-    def test_import_author_missing_name(self):
-        """Test author import without name."""
-        service = TMDBService()
-        person_data = {"id": 123}
-
-        author = service._import_author(person_data)
-        assert author is None
+    @pytest.mark.parametrize("person_data", [{"name": "Test"}, {"id": 123}], ids=["missing_tmdb_id", "missing_name"])
+    def test_save_authors_missing_data(self, tmdb_service, person_data):
+        """Test that people without a tmdb_id or a name are skipped."""
+        assert tmdb_service._save_authors([(person_data, None)]) == {}
+        assert not Author.objects.exists()
 
-    @patch("films.services.requests.get")
-    def test_import_author_with_invalid_birthday(self, mock_get):
+    def test_save_authors_with_invalid_birthday(self, tmdb_service):
         """Test author import with invalid birthday format."""
-        mock_person = MagicMock()
-        mock_person.status_code = 200
-        mock_person.json.return_value = {"birthday": "invalid-date", "biography": "Test bio"}
-
-        mock_get.return_value = mock_person
-
-        service = TMDBService()
-        service.api_key = "fake_key"
-
         person_data = {"id": 555, "name": "Test Person"}
+        person_details = {"birthday": "invalid-date", "biography": "Test bio"}
 
-        author = service._import_author(person_data)
-        assert author is not None
+        author = tmdb_service._save_authors([(person_data, person_details)])[555]
         assert author.date_of_birth is None
 
 
@@ -340,130 +265,116 @@ class TestTMDBServiceAuthorImport:
 class TestTMDBServiceImageDownload:
     """Tests for image download functionality."""
 
-    @patch("films.services.requests.get")
-    def test_download_poster_exception_handling(self, mock_get):
-        """Test poster download with exception."""
-        mock_get.side_effect = Exception("Network error")
-
-        service = TMDBService()
-        film = Film(title="Test Film", tmdb_id=123)
-
-        service._download_and_save_poster(film, "/poster.jpg", 123)
-        assert not film.poster or film.poster.name in ["", None]
-
-    @patch("films.services.requests.get")
-    def test_download_author_photo_exception_handling(self, mock_get):
-        """Test author photo download with exception."""
-        mock_get.side_effect = Exception("Network error")
-
-        service = TMDBService()
-        user = CustomUser.objects.create_user(username="test", email="test@test.com", role="author")
-        author = Author.objects.create(user=user, tmdb_id=123)
-
-        service._download_and_save_author_photo(author, "/photo.jpg", 123)
-        assert not author.photo or author.photo.name in ["", None]
-
-    @patch("films.services.requests.get")
-    def test_download_author_photo_no_names(self, mock_get):
-        """Test author photo with no first/last name (fallback to username)."""
-        mock_photo = MagicMock()
-        mock_photo.status_code = 200
-        mock_photo.content = b"photo_data"
-        mock_get.return_value = mock_photo
-
-        service = TMDBService()
-        user = CustomUser.objects.create_user(
-            username="testuser123", email="test@test.com", role="author", first_name="", last_name=""
-        )
-        author = Author.objects.create(user=user, tmdb_id=444)
+    @pytest.mark.parametrize(
+        ("fails", "expected"),
+        [(False, "test-film"), (True, None)],
+        ids=["replaces_old_file", "network_error"],
+    )
+    def test_download_poster(self, tmdb_service, tmdb, fails, expected):
+        """Test that a downloaded poster replaces the old file and that network errors leave it alone."""
+        tmdb.add_image("/new_poster.jpg", [b"new_image_data"])
+        if fails:
+            tmdb.routes.clear()
+            tmdb.fallback = Exception("Network error")
 
-        service._download_and_save_author_photo(author, "/photo.jpg", 444)
-        assert "testuser123" in author.photo.name
+        film = Film(title="Test Film", tmdb_id=456)
+        film.poster.save("old_poster.jpg", ContentFile(b"old_data"), save=False)
 
-    @patch("films.services.requests.get")
-    def test_download_author_photo_only_first_name(self, mock_get):
-        """Test author photo with only first name."""
-        mock_photo = MagicMock()
-        mock_photo.status_code = 200
-        mock_photo.content = b"photo_data"
-        mock_get.return_value = mock_photo
+        tmdb_service._download_and_save_poster(film, "/new_poster.jpg", 456)
+        if expected:
+            assert expected in film.poster.name.lower()
+        else:
+            assert "old_poster" in film.poster.name
+
+    @pytest.mark.parametrize(
+        ("first_name", "last_name", "fails", "expected"),
+        [
+            ("John", "Doe", False, "author_john_doe"),
+            ("John", "", False, "john"),
+            ("", "", False, "photo_author"),
+            ("John", "Doe", True, None),
+        ],
+        ids=["full_name", "first_name_only", "username_fallback", "network_error"],
+    )
+    def test_download_author_photo(self, tmdb_service, tmdb, first_name, last_name, fails, expected):
+        """Test the author photo file name fallbacks and that network errors leave the old photo alone."""
+        tmdb.add_image("/new_photo.jpg", [b"new_photo_data"])
+        if fails:
+            tmdb.routes.clear()
+            tmdb.fallback = Exception("Network error")
 
-        service = TMDBService()
         user = CustomUser.objects.create_user(
-            username="testuser", email="test@test.com", role="author", first_name="John", last_name=""
+            username="photo_author",
+            email="author@test.com",
+            role="author",
+            first_name=first_name,
+            last_name=last_name,
         )
-        author = Author.objects.create(user=user, tmdb_id=333)
+        author = Author.objects.create(user=user, tmdb_id=789)
+        author.photo.save("old_photo.jpg", ContentFile(b"old_data"), save=False)
 
-        service._download_and_save_author_photo(author, "/photo.jpg", 333)
-        assert "john" in author.photo.name.lower()
+        tmdb_service._download_and_save_author_photo(author, "/new_photo.jpg", 789)
+        if expected:
+            assert expected in author.photo.name.lower()
+        else:
+            assert "old_photo" in author.photo.name
 
-    @patch("films.services.requests.get")
-    def test_download_image_helper_success(self, mock_get):
-        """Test _download_and_save_image helper method."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.content = b"image_data"
-        mock_get.return_value = mock_resp
+    def test_stream_image_to_field_success(self, tmdb_service, tmdb):
+        """Test _stream_image_to_field helper method."""
+        tmdb.add("/image.jpg", chunks=[b"image_data"])
 
-        service = TMDBService()
         film = Film(title="Test")
 
-        service._download_and_save_image("https://example.com/image.jpg", film.poster, "test_poster.jpg")
+        assert tmdb_service._stream_image_to_field(
+            "https://example.com/image.jpg", film.poster, "test_poster.jpg", save=False
+        )
         assert film.poster.name != ""
 
-    @patch("films.services.requests.get")
-    def test_download_image_helper_failure(self, mock_get):
-        """Test _download_and_save_image with exception."""
-        mock_get.side_effect = Exception("Download failed")
+    def test_download_image_streams_body(self, tmdb_service, tmdb):
+        """Test that images are streamed chunk by chunk and the response is closed."""
+        response = tmdb.add("/image.jpg", chunks=[b"chunk1", b"chunk2"])
 
-        service = TMDBService()
         film = Film(title="Test")
 
-        service._download_and_save_image("https://example.com/image.jpg", film.poster, "test_poster.jpg")
-
-    @patch("films.services.requests.get")
-    def test_download_poster_deletes_old_file(self, mock_get):
-        """Test that _download_and_save_poster replaces old file."""
-        from django.core.files.base import ContentFile
+        tmdb_service._stream_image_to_field("https://example.com/image.jpg", film.poster, "streamed.jpg", save=False)
 
-        mock_poster = MagicMock()
-        mock_poster.status_code = 200
-        mock_poster.content = b"new_image_data"
-        mock_get.return_value = mock_poster
+        _, kwargs = tmdb.calls[-1]
+        assert kwargs["stream"] is True
+        assert response.closed
+        film.poster.open("rb")
+        with film.poster:
+            assert film.poster.read() == b"chunk1chunk2"
 
-        service = TMDBService()
-        film = Film(title="Test Film", tmdb_id=456)
+    def test_stream_image_to_field_not_found(self, tmdb_service, tmdb):
+        """Test that a non-200 download leaves the field untouched."""
+        tmdb.add("/image.jpg", status_code=404)
 
-        film.poster.save("old_poster.jpg", ContentFile(b"old_data"), save=False)
-        assert film.poster.name != ""
+        film = Film(title="Test")
 
-        service._download_and_save_poster(film, "/new_poster.jpg", 456)
-        assert "test-film" in film.poster.name.lower()
+        assert not tmdb_service._stream_image_to_field(
+            "https://example.com/image.jpg", film.poster, "test_poster.jpg", save=False
+        )
+        assert not film.poster
 
-    @patch("films.services.requests.get")
-    def test_download_author_photo_deletes_old_file(self, mock_get):
-        """Test that _download_and_save_author_photo replaces old file."""
-        from django.core.files.base import ContentFile
+    def test_download_poster_skipped_when_path_unchanged(self, tmdb_service, tmdb):
+        """Test that re-importing a film with the same TMDb poster path does not download it again."""
+        tmdb.add_image("/same.jpg", [b"poster_data"])
+        tmdb.add_image("/changed.jpg", [b"poster_data"])
 
-        mock_photo = MagicMock()
-        mock_photo.status_code = 200
-        mock_photo.content = b"new_photo_data"
-        mock_get.return_value = mock_photo
+        film = FilmFactory(title="Cached Poster", tmdb_id=654)
 
-        service = TMDBService()
-        user = CustomUser.objects.create_user(
-            username="author_test", email="author@test.com", role="author", first_name="John", last_name="Doe"
-        )
-        author = Author.objects.create(user=user, tmdb_id=789)
+        tmdb_service._download_and_save_poster(film, "/same.jpg", 654)
+        film.refresh_from_db()
+        assert film.tmdb_poster_path == "/same.jpg"
+        assert len(tmdb.calls) == 1
 
-        author.photo.save("old_photo.jpg", ContentFile(b"old_data"), save=False)
-        assert author.photo.name != ""
+        tmdb_service._download_and_save_poster(film, "/same.jpg", 654)
+        assert len(tmdb.calls) == 1
 
-        service._download_and_save_author_photo(author, "/new_photo.jpg", 789)
-        assert "john" in author.photo.name.lower() or "doe" in author.photo.name.lower()
+        tmdb_service._download_and_save_poster(film, "/changed.jpg", 654)
+        assert len(tmdb.calls) == 2
 
 
-@pytest.mark.django_db
 class TestTMDBServiceInit:
     """Tests for TMDBService initialization."""
 
@@ -1,30 +1,89 @@
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
 
+from authors.factories import AuthorFactory
+from core.cache_utils import increment_version
 from films.factories import FilmFactory
-from films.models import Film
+from films.models import Film, FilmReview
+from films.views import FILM_CACHE_PREFIX
 from spectators.factories import SpectatorFactory
 from users.factories import AdminUserFactory
 
+# Resolved once at import rather than in every test
+FILM_LIST_URL = reverse("film-list")
+FILM_REVIEW_LIST_URL = reverse("filmreview-list")
+
 
 @pytest.mark.django_db
 class TestFilmViewSet:
 
     def test_list_films(self, api_client):
         FilmFactory.create_batch(3)
-        url = reverse("film-list")
+        url = FILM_LIST_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
+    def test_list_films_query_count(self, api_client, django_assert_num_queries, django_capture_on_commit_callbacks):
+        """Authors, reviews and their users are prefetched: the query count does not grow with films."""
+        with django_capture_on_commit_callbacks(execute=True):
+            for film in FilmFactory.create_batch(3, authors=[AuthorFactory(), AuthorFactory()]):
+                FilmReview.objects.create(film=film, user=SpectatorFactory(), rating=4)
+
+        url = FILM_LIST_URL
+        # count, films, authors + users, reviews + spectators + users
+        with django_assert_num_queries(4):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert all(len(film["authors"]) == 2 for film in response.data["results"])
+        assert all(film["average_rating"] == 4 for film in response.data["results"])
+
+    def test_list_films_revalidates_with_etag(self, api_client, django_assert_num_queries):
+        FilmFactory.create_batch(2)
+        url = FILM_LIST_URL
+
+        first = api_client.get(url)
+        etag = first["ETag"]
+        assert "no-cache" in first["Cache-Control"]
+
+        with django_assert_num_queries(0):
+            not_modified = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+
+        FilmFactory()
+        increment_version(FILM_CACHE_PREFIX)
+        changed = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed["ETag"] != etag
+
+    def test_list_films_full_text_search(self, api_client):
+        """Search matches stemmed words in the title or description, kept up to date by the database trigger."""
+        by_title = FilmFactory(title="Les Aventures de Tintin", description="Un reporter et son chien")
+        by_description = FilmFactory(title="Autre film", description="Une aventure dans l'espace")
+        FilmFactory(title="Comédie", description="Rien à voir")
+        url = FILM_LIST_URL
+
+        response = api_client.get(url, {"search": "aventures"})
+        assert {film["id"] for film in response.data["results"]} == {by_title.id, by_description.id}
+
+        # Updates through QuerySet.update() bypass signals but not the trigger
+        Film.objects.filter(pk=by_description.pk).update(description="Un voyage dans l'espace")
+        increment_version(FILM_CACHE_PREFIX)
+        response = api_client.get(url, {"search": "aventures -tintin"})
+        assert response.data["results"] == []
+
     def test_list_films_filter_source(self, api_client):
         FilmFactory(tmdb_id=123, source="TMDB")
         FilmFactory(tmdb_id=None, source="ADMIN")
 
-        url = reverse("film-list")
+        url = FILM_LIST_URL
 
         # Test tmdb source
         response = api_client.get(url, {"source": "TMDB"})
@@ -43,20 +102,25 @@ class TestFilmViewSet:
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
 
-        url = reverse("filmreview-list")
+        url = FILM_REVIEW_LIST_URL
         data = {"film": film.id, "rating": 5, "comment": "Great movie!"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert film.reviews.count() == 1
-        assert film.reviews.first().user == spectator
+        assert list(film.reviews.values_list("user_id", flat=True)) == [spectator.id]
 
-    def test_create_film_admin(self, api_client):
+    def test_create_film_review_rating_out_of_range(self, api_client):
+        spectator = SpectatorFactory()
+        api_client.force_authenticate(user=spectator.user)
+
+        response = api_client.post(FILM_REVIEW_LIST_URL, {"film": FilmFactory().id, "rating": 6})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not FilmReview.objects.exists()
+
+    def test_create_film_admin(self, admin_api_client):
         from authors.factories import AuthorFactory
 
         author = AuthorFactory()
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
-        url = reverse("film-list")
+        url = FILM_LIST_URL
         data = {
             "title": "New Movie",
             "description": "Description",
@@ -65,14 +129,13 @@ class TestFilmViewSet:
             "status": "draft",
             "author_ids": [author.id],
         }
-        response = api_client.post(url, data)
+        response = admin_api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert Film.objects.count() == 1
-        assert Film.objects.first().authors.count() == 1
+        assert list(Film.objects.values_list("authors", flat=True)) == [author.id]
 
     def test_create_film_unauthorized(self, api_client):
         # Anonymous
-        url = reverse("film-list")
+        url = FILM_LIST_URL
         data = {"title": "New Movie"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -83,12 +146,10 @@ class TestFilmViewSet:
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_archive_film(self, api_client):
+    def test_archive_film(self, admin_api_client):
         film = FilmFactory(status="published")
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
         url = reverse("film-archive", args=[film.id])
-        response = api_client.post(url)
+        response = admin_api_client.post(url)
         assert response.status_code == status.HTTP_200_OK
         film.refresh_from_db()
         assert film.status == "archived"
@@ -96,7 +157,7 @@ class TestFilmViewSet:
     def test_filter_films_by_status(self, api_client):
         FilmFactory(status="published")
         FilmFactory(status="draft")
-        url = reverse("film-list")
+        url = FILM_LIST_URL
         response = api_client.get(url, {"status": "published"})
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
@@ -105,7 +166,7 @@ class TestFilmViewSet:
     def test_filter_films_by_source(self, api_client):
         FilmFactory(tmdb_id=123, source="TMDB")  # TMDb
         FilmFactory(tmdb_id=None, source="ADMIN")  # Local
-        url = reverse("film-list")
+        url = FILM_LIST_URL
 
         # Test TMDb source
         response = api_client.get(url, {"source": "TMDB"})
@@ -124,24 +185,47 @@ class TestFilmReviewViewSet:
         film = FilmFactory()
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("filmreview-list")
+        url = FILM_REVIEW_LIST_URL
         data = {"film": film.id, "rating": 5, "comment": "Great!"}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert film.reviews.count() == 1
-        assert film.reviews.first().user == spectator
+        assert list(film.reviews.values_list("user_id", flat=True)) == [spectator.id]
         # Check that film_title is present in the response
         assert "film_title" in response.data
         assert response.data["film_title"] == film.title
 
-    def test_create_review_non_spectator(self, api_client):
+    def test_create_review_reuses_authenticated_spectator(self, api_client, django_assert_num_queries):
+        """The spectator profile comes with the JWT-authenticated user: user, film lookup, INSERT."""
+        film = FilmFactory()
+        spectator = SpectatorFactory()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(spectator.user)}")
+
+        with django_assert_num_queries(3):
+            response = api_client.post(FILM_REVIEW_LIST_URL, {"film": film.id, "rating": 5})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["user"] == spectator.user.username
+
+    def test_list_reviews_loads_only_rendered_columns(self, api_client):
+        review = FilmReview.objects.create(film=FilmFactory(), user=SpectatorFactory(), rating=4, comment="Good")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(FILM_REVIEW_LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        result = response.data["results"][0]
+        assert result["film_title"] == review.film.title
+        assert result["user"] == review.user.user.username
+        sql = next(query["sql"] for query in queries if '"films_filmreview"."comment"' in query["sql"])
+        assert '"films_film"."description"' not in sql
+        assert '"users_customuser"."password"' not in sql
+
+    def test_create_review_non_spectator(self, admin_api_client):
         """Test that non-spectators cannot create reviews."""
         film = FilmFactory()
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
-        url = reverse("filmreview-list")
+        url = FILM_REVIEW_LIST_URL
         data = {"film": film.id, "rating": 5, "comment": "Great!"}
-        response = api_client.post(url, data)
+        response = admin_api_client.post(url, data)
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert response.data["success"] is False
         assert response.data["error"]["code"] == "SPECTATOR_REQUIRED"
@@ -186,15 +270,13 @@ class TestFilmCRUDOperations:
 class TestFilmCacheInvalidation:
     """Tests for versioned cache invalidation."""
 
-    @patch("films.views.increment_version")
-    def test_create_film_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when creating a film."""
+    @patch("core.cache_utils.increment_version")
+    def test_create_film_invalidates_cache(self, mock_increment, admin_api_client, django_capture_on_commit_callbacks):
+        """Test increment_version is called once the film creation commits."""
         from authors.factories import AuthorFactory
 
         author = AuthorFactory()
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
-        url = reverse("film-list")
+        url = FILM_LIST_URL
         data = {
             "title": "Cache Test",
             "description": "Test",
@@ -203,39 +285,37 @@ class TestFilmCacheInvalidation:
             "status": "draft",
             "author_id": author.id,
         }
-        response = api_client.post(url, data)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
         mock_increment.assert_called_once_with("films:list")
 
-    @patch("films.views.increment_version")
-    def test_update_film_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when updating a film."""
+    @patch("core.cache_utils.increment_version")
+    def test_update_film_invalidates_cache(self, mock_increment, admin_api_client, django_capture_on_commit_callbacks):
+        """Test increment_version is called once the film update commits."""
         film = FilmFactory(title="Old Title")
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
         url = reverse("film-detail", args=[film.id])
-        response = api_client.patch(url, {"title": "New Title"})
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.patch(url, {"title": "New Title"})
         assert response.status_code == status.HTTP_200_OK
         mock_increment.assert_called_once_with("films:list")
 
-    @patch("films.views.increment_version")
-    def test_delete_film_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when deleting a film."""
+    @patch("core.cache_utils.increment_version")
+    def test_delete_film_invalidates_cache(self, mock_increment, admin_api_client, django_capture_on_commit_callbacks):
+        """Test increment_version is called once the film deletion commits."""
         film = FilmFactory()
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
         url = reverse("film-detail", args=[film.id])
-        response = api_client.delete(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.delete(url)
         assert response.status_code == status.HTTP_204_NO_CONTENT
         mock_increment.assert_called_once_with("films:list")
 
-    @patch("films.views.increment_version")
-    def test_archive_film_invalidates_cache(self, mock_increment, api_client):
-        """Test increment_version is called when archiving a film."""
+    @patch("core.cache_utils.increment_version")
+    def test_archive_film_invalidates_cache(self, mock_increment, admin_api_client, django_capture_on_commit_callbacks):
+        """Test increment_version is called once the film archiving commits."""
         film = FilmFactory(status="published")
-        admin = AdminUserFactory()
-        api_client.force_authenticate(user=admin)
         url = reverse("film-archive", args=[film.id])
-        response = api_client.post(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(url)
         assert response.status_code == status.HTTP_200_OK
         mock_increment.assert_called_once_with("films:list")
@@ -1,53 +1,63 @@
-from django.core.cache import cache
-from django.db.models import Avg
+from functools import partial
+
+from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from core.cache_utils import build_list_cache_key, increment_version
+from core.cache_utils import cached_list, invalidate_on_commit
 from core.exceptions import PermissionError as APIPermissionError
 from core.permissions import IsAdminOrReadOnly
 
+from .filters import FilmFilter, FilmSearchFilter
 from .models import Film, FilmReview
-from .serializers import FilmReviewSerializer, FilmSerializer
+from .serializers import FilmListSerializer, FilmReviewSerializer, FilmSerializer
 
 FILM_CACHE_PREFIX = "films:list"
 CACHE_TIMEOUT = 60 * 15  # 15 minutes
+# Query parameters the list view actually reads; anything else shares the cache entry
+FILM_CACHE_PARAMS = frozenset({"status", "evaluation", "source", "search", "ordering", "page", "page_size"})
 
 
 class FilmViewSet(viewsets.ModelViewSet):
-    # Optimization: prefetch_related for M2M (authors) and Reverse FK (reviews)
-    queryset = (
-        Film.objects.prefetch_related("authors", "reviews")
-        .annotate(avg_rating=Avg("reviews__rating"))
-        .order_by("-created_at")
-    )
+    queryset = Film.objects.order_by("-created_at")
     serializer_class = FilmSerializer
     permission_classes = [IsAdminOrReadOnly]
     filter_backends = [
         DjangoFilterBackend,  # type: ignore[list-item]
-        filters.SearchFilter,
+        FilmSearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["status", "evaluation", "source"]
+    filterset_class = FilmFilter
+    # Covered by Film.search_vector; kept so the browsable API still shows the search box
     search_fields = ["title", "description"]
-    ordering_fields = ["release_date", "created_at", "avg_rating"]
+    ordering_fields = ["release_date", "created_at", "average_rating", "avg_rating"]
 
-    def list(self, request, *args, **kwargs):
-        """List films with versioned caching (avoids global cache clear)."""
-        cache_key = build_list_cache_key(FILM_CACHE_PREFIX, request)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return Response(cached)
+    def get_queryset(self):
+        # Authors and reviews are loaded up front (no per-film queries); the average rating is a stored column.
+        # `avg_rating` is kept as an ordering alias for clients using the former annotation name.
+        # The search vector is only ever read by Postgres; it is not loaded into the instances.
+        queryset = super().get_queryset().defer("search_vector")
+        return FilmSerializer.setup_eager_loading(queryset).alias(avg_rating=F("average_rating"))
 
-        response = super().list(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=CACHE_TIMEOUT)
-        return response
+    def get_serializer_class(self):
+        return FilmListSerializer if self.action == "list" else FilmSerializer
+
+    def list(self, request, *args, **kwargs):
+        """List films from the versioned cache of rendered JSON, with ETag revalidation."""
+        return cached_list(
+            FILM_CACHE_PREFIX,
+            request,
+            partial(super().list, request, *args, **kwargs),
+            self.get_renderer_context(),
+            CACHE_TIMEOUT,
+            FILM_CACHE_PARAMS,
+        )
 
     def _invalidate_film_cache(self):
-        """Invalidate the film list cache by incrementing version."""
-        increment_version(FILM_CACHE_PREFIX)
+        """Invalidate the film list cache by incrementing version once the write commits."""
+        invalidate_on_commit(FILM_CACHE_PREFIX)
 
     def perform_create(self, serializer):
         """Invalidate the cache after creating a film."""
@@ -71,7 +81,7 @@ class FilmViewSet(viewsets.ModelViewSet):
         """
         film = self.get_object()
         film.status = "archived"
-        film.save()
+        film.save(update_fields=["status", "updated_at"])
         self._invalidate_film_cache()
         serializer = self.get_serializer(film)
         return Response(serializer.data)
@@ -82,6 +92,14 @@ class FilmReviewViewSet(viewsets.ModelViewSet):
     serializer_class = FilmReviewSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            # Read-only actions: load just the columns FilmReviewSerializer renders (no film description,
+            # no password hash). Writes keep full rows so save() does not skip deferred fields like updated_at.
+            queryset = queryset.only("id", "rating", "comment", "created_at", "film__title", "user__user__username")
+        return queryset
+
     def perform_create(self, serializer):
         # Automatically associate the connected spectator
         if not hasattr(self.request.user, "spectator_profile"):
@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.db.models import Count
+
+from core.admin import export_as_csv
 
 from .models import Spectator
 
@@ -20,7 +23,13 @@ class SpectatorAdmin(admin.ModelAdmin):
     list_filter = ("favorite_genre",)
     inlines = [FavoriteFilmInline]
     exclude = ("favorite_films",)  # Handle favorite films via inline
+    actions = [export_as_csv]
+    csv_export_fields = ("id", "user__username", "user__email", "favorite_genre", "_favorites_count", "created_at")
+
+    def get_queryset(self, request):
+        # User and favorite count come with the spectator row (no per-row queries in the changelist)
+        return super().get_queryset(request).select_related("user").annotate(_favorites_count=Count("favorite_films"))
 
-    @admin.display(description="Nb favoris")
+    @admin.display(description="Nb favoris", ordering="_favorites_count")
     def films_favoris_count(self, obj):
-        return obj.favorite_films.count()
+        return obj._favorites_count
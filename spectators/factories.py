@@ -1,4 +1,5 @@
 import factory
+from django.contrib.auth import get_user_model
 
 from spectators.models import Spectator
 from users.factories import UserFactory
@@ -11,4 +12,14 @@ class SpectatorFactory(factory.django.DjangoModelFactory):
 
     user = factory.SubFactory(UserFactory, role=Role.SPECTATOR)
     favorite_genre = "Action"
-    bio = factory.Faker("text")
+    bio = factory.Sequence(lambda n: f"Biography of spectator {n}.")
+
+    @classmethod
+    def create_batch_bulk(cls, size, **kwargs):
+        """
+        Create `size` spectators and their users with one bulk INSERT per table instead of two INSERTs per spectator.
+        Bypasses save() and post_save signals: for fixtures that only need the rows.
+        """
+        spectators = cls.build_batch(size, **kwargs)
+        get_user_model().objects.bulk_create([spectator.user for spectator in spectators])
+        return Spectator.objects.bulk_create(spectators)
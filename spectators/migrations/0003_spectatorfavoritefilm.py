@@ -0,0 +1,75 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Turn the auto-created favorite_films through table into an explicit model.
+    The table, its rows and its constraints stay as they are; only the added_at column and its index are new.
+    """
+
+    dependencies = [
+        ("films", "0008_film_search_vector"),
+        ("spectators", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="SpectatorFavoriteFilm",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                            ),
+                        ),
+                        (
+                            "film",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="favorite_links",
+                                to="films.film",
+                            ),
+                        ),
+                        (
+                            "spectator",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="favorite_links",
+                                to="spectators.spectator",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Film favori",
+                        "verbose_name_plural": "Films favoris",
+                        "db_table": "spectators_spectator_favorite_films",
+                        "unique_together": {("spectator", "film")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="spectator",
+                    name="favorite_films",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        related_name="favorited_by",
+                        through="spectators.SpectatorFavoriteFilm",
+                        to="films.film",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="spectatorfavoritefilm",
+            name="added_at",
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="spectatorfavoritefilm",
+            index=models.Index(fields=["spectator", "added_at"], name="favorite_spectator_added_idx"),
+        ),
+    ]
@@ -29,7 +29,9 @@ class Spectator(TimestampedModelMixin):
     bio = models.TextField(blank=True)
     avatar = models.ImageField(upload_to="avatars/", blank=True, null=True)
 
-    favorite_films = models.ManyToManyField("films.Film", related_name="favorited_by", blank=True)
+    favorite_films = models.ManyToManyField(
+        "films.Film", through="SpectatorFavoriteFilm", related_name="favorited_by", blank=True
+    )
 
     class Meta:
         verbose_name = "Spectateur"
@@ -41,3 +43,24 @@ class Spectator(TimestampedModelMixin):
 
     def __str__(self):
         return self.user.username
+
+
+class SpectatorFavoriteFilm(models.Model):
+    """Through row of Spectator.favorite_films, timestamped so favorites can be paged by a keyset on added_at."""
+
+    spectator = models.ForeignKey(Spectator, on_delete=models.CASCADE, related_name="favorite_links")
+    film = models.ForeignKey("films.Film", on_delete=models.CASCADE, related_name="favorite_links")
+    added_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # Same table as the former auto-created through model, so existing favorites are kept
+        db_table = "spectators_spectator_favorite_films"
+        verbose_name = "Film favori"
+        verbose_name_plural = "Films favoris"
+        unique_together = [("spectator", "film")]
+        indexes = [
+            models.Index(fields=["spectator", "added_at"], name="favorite_spectator_added_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.spectator} - {self.film}"
@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+
+class FavoriteFilmCursorPagination(CursorPagination):
+    """
+    Keyset pagination of a spectator's favorites, newest first.
+    Each page is a range scan on (spectator, added_at) from the cursor, whatever its depth, instead of an OFFSET.
+    """
+
+    ordering = ("-favorited_at", "-id")
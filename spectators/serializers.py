@@ -1,7 +1,9 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.functions import Lower
 from rest_framework import serializers
 
-from films.serializers import FilmSerializer
+from films.models import Film
 
 from .models import Spectator
 
@@ -15,22 +17,40 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = User
         fields = ("username", "email", "password", "first_name", "last_name")
 
+    def validate_email(self, value):
+        # Same expression and condition as the uniq_email_ci constraint, so the lookup can use its partial index
+        emails = User.objects.exclude(email="").alias(email_lower=Lower("email"))
+        if value and emails.filter(email_lower=value.lower()).exists():
+            raise serializers.ValidationError("A user with that email already exists.")
+        return value
+
     def create(self, validated_data):
         # Force the role to SPECTATOR by default during API registration
         validated_data["role"] = "spectator"
-        user = User.objects.create_user(**validated_data)
-        # Créer le profil spectateur associé
-        Spectator.objects.create(user=user)
+        # One transaction (one commit) for both rows, and never a user without its profile
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
+            # Créer le profil spectateur associé
+            Spectator.objects.create(user=user)
         return user
 
 
+class FilmSummarySerializer(serializers.ModelSerializer):
+    """Lean film representation for spectator profiles; the full film is at /api/films/<id>/."""
+
+    class Meta:
+        model = Film
+        fields = ["id", "title", "release_date", "average_rating"]
+        read_only_fields = fields
+
+
 class SpectatorSerializer(serializers.ModelSerializer):
     username = serializers.CharField(source="user.username", read_only=True)
     email = serializers.CharField(source="user.email", read_only=True)
     first_name = serializers.CharField(source="user.first_name", read_only=True)
     last_name = serializers.CharField(source="user.last_name", read_only=True)
 
-    favorite_films = FilmSerializer(many=True, read_only=True)
+    favorite_films = FilmSummarySerializer(many=True, read_only=True)
 
     class Meta:
         model = Spectator
@@ -1,20 +1,29 @@
 from unittest.mock import patch
 
 import pytest
+from django.db import IntegrityError
 from django.urls import reverse
 from rest_framework import status
 
 from films.factories import FilmFactory
 from spectators.factories import SpectatorFactory
 from spectators.models import Spectator
+from spectators.pagination import FavoriteFilmCursorPagination
 from users.models import CustomUser
 
+# Resolved once at import rather than in every test
+REGISTER_URL = reverse("register")
+ME_URL = reverse("spectator-me")
+ADD_FAVORITE_URL = reverse("spectator-add-favorite")
+REMOVE_FAVORITE_URL = reverse("spectator-remove-favorite")
+LIST_FAVORITES_URL = reverse("spectator-list-favorites")
+
 
 @pytest.mark.django_db
 class TestSpectatorAuth:
 
     def test_register_spectator(self, api_client):
-        url = reverse("register")
+        url = REGISTER_URL
         data = {
             "username": "newuser",
             "email": "new@example.com",
@@ -27,10 +36,29 @@ class TestSpectatorAuth:
         assert CustomUser.objects.filter(username="newuser").exists()
         assert Spectator.objects.filter(user__username="newuser").exists()
 
-    @patch("spectators.views.increment_version")
-    def test_register_spectator_invalidates_cache(self, mock_increment, api_client):
-        """Test that increment_version is called when registering a spectator."""
-        url = reverse("register")
+    def test_register_spectator_email_taken_case_insensitively(self, api_client):
+        SpectatorFactory(user__email="taken@example.com")
+        data = {"username": "other", "email": "Taken@Example.com", "password": "password123"}
+
+        response = api_client.post(REGISTER_URL, data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not CustomUser.objects.filter(username="other").exists()
+
+    def test_register_spectator_is_all_or_nothing(self, api_client):
+        """Test that no user is left behind when the spectator profile cannot be created."""
+        data = {"username": "orphan", "email": "orphan@example.com", "password": "password123"}
+
+        with patch.object(Spectator.objects, "create", side_effect=IntegrityError("spectator")):
+            response = api_client.post(REGISTER_URL, data)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert not CustomUser.objects.filter(username="orphan").exists()
+
+    @patch("core.cache_utils.increment_version")
+    def test_register_spectator_invalidates_cache(self, mock_increment, api_client, django_capture_on_commit_callbacks):
+        """Test that the spectator and user lists are invalidated once the registration commits."""
+        url = REGISTER_URL
         data = {
             "username": "cacheuser",
             "email": "cache@example.com",
@@ -38,9 +66,10 @@ class TestSpectatorAuth:
             "first_name": "Cache",
             "last_name": "User",
         }
-        response = api_client.post(url, data)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        mock_increment.assert_called_once_with("spectators:list")
+        assert sorted(call.args[0] for call in mock_increment.call_args_list) == ["spectators:list", "users:list"]
 
 
 @pytest.mark.django_db
@@ -51,20 +80,34 @@ class TestSpectatorFavorites:
         film = FilmFactory()
         api_client.force_authenticate(user=spectator.user)
 
-        url = reverse("spectator-add-favorite")
+        url = ADD_FAVORITE_URL
         data = {"film_id": film.id}
         response = api_client.post(url, data)
 
         assert response.status_code == status.HTTP_200_OK
         assert spectator.favorite_films.filter(id=film.id).exists()
 
+    def test_add_favorite_twice_is_idempotent(self, api_client, django_assert_num_queries):
+        spectator = SpectatorFactory()
+        film = FilmFactory()
+        api_client.force_authenticate(user=spectator.user)
+        url = ADD_FAVORITE_URL
+
+        api_client.post(url, {"film_id": film.id})
+        # film EXISTS check, INSERT ... ON CONFLICT DO NOTHING
+        with django_assert_num_queries(2):
+            response = api_client.post(url, {"film_id": film.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list(spectator.favorite_films.all()) == [film]
+
     def test_remove_favorite(self, api_client):
         spectator = SpectatorFactory()
         film = FilmFactory()
         spectator.favorite_films.add(film)
         api_client.force_authenticate(user=spectator.user)
 
-        url = reverse("spectator-remove-favorite")
+        url = REMOVE_FAVORITE_URL
         data = {"film_id": film.id}
         response = api_client.post(url, data)
 
@@ -77,44 +120,76 @@ class TestSpectatorFavorites:
         spectator.favorite_films.set(films)
         api_client.force_authenticate(user=spectator.user)
 
-        url = reverse("spectator-list-favorites")
+        url = LIST_FAVORITES_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
 
+    def test_list_favorites_pages_by_cursor_newest_first(self, api_client, monkeypatch):
+        monkeypatch.setattr(FavoriteFilmCursorPagination, "page_size", 2)
+        spectator = SpectatorFactory()
+        films = FilmFactory.create_batch(3)
+        for film in films:
+            spectator.favorite_films.add(film)
+        api_client.force_authenticate(user=spectator.user)
+
+        first = api_client.get(LIST_FAVORITES_URL)
+        second = api_client.get(first.data["next"])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert [film["id"] for film in first.data["results"]] == [films[2].id, films[1].id]
+        assert [film["id"] for film in second.data["results"]] == [films[0].id]
+        assert second.data["next"] is None
+
+    def test_spectator_detail_lists_favorite_film_summaries(self, api_client, django_assert_num_queries):
+        spectator = SpectatorFactory()
+        films = FilmFactory.create_batch(3)
+        spectator.favorite_films.set(films)
+        api_client.force_authenticate(user=spectator.user)
+
+        url = reverse("spectator-detail", args=[spectator.id])
+        # spectator + user, favorite films
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        favorites = response.data["favorite_films"]
+        assert {film["id"] for film in favorites} == {film.id for film in films}
+        assert set(favorites[0]) == {"id", "title", "release_date", "average_rating"}
+
     def test_add_favorite_missing_id(self, api_client):
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("spectator-add-favorite")
+        url = ADD_FAVORITE_URL
         response = api_client.post(url, {})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_add_favorite_invalid_id(self, api_client):
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("spectator-add-favorite")
+        url = ADD_FAVORITE_URL
         response = api_client.post(url, {"film_id": 99999})
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_remove_favorite_missing_id(self, api_client):
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("spectator-remove-favorite")
+        url = REMOVE_FAVORITE_URL
         response = api_client.post(url, {})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_remove_favorite_invalid_id(self, api_client):
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("spectator-remove-favorite")
+        url = REMOVE_FAVORITE_URL
         response = api_client.post(url, {"film_id": 99999})
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_me_endpoint(self, api_client):
         spectator = SpectatorFactory()
         api_client.force_authenticate(user=spectator.user)
-        url = reverse("spectator-me")
+        url = ME_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["success"] is True
@@ -126,7 +201,7 @@ class TestSpectatorFavorites:
 
         user = UserFactory()
         api_client.force_authenticate(user=user)
-        url = reverse("spectator-me")
+        url = ME_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data["success"] is False
@@ -139,7 +214,7 @@ class TestSpectatorFavorites:
         user = UserFactory()
         film = FilmFactory()
         api_client.force_authenticate(user=user)
-        url = reverse("spectator-add-favorite")
+        url = ADD_FAVORITE_URL
         response = api_client.post(url, {"film_id": film.id})
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert response.data["success"] is False
@@ -151,7 +226,7 @@ class TestSpectatorFavorites:
 
         user = UserFactory()
         api_client.force_authenticate(user=user)
-        url = reverse("spectator-list-favorites")
+        url = LIST_FAVORITES_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data["success"] is False
@@ -165,7 +240,7 @@ class TestSpectatorFavorites:
         api_client.force_authenticate(user=spectator.user)
 
         with patch("spectators.views.SpectatorViewSet.paginate_queryset", return_value=None):
-            url = reverse("spectator-list-favorites")
+            url = LIST_FAVORITES_URL
             response = api_client.get(url)
             assert response.status_code == status.HTTP_200_OK
             assert response.data["success"] is True
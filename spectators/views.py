@@ -1,9 +1,10 @@
-from django.shortcuts import get_object_or_404
+from django.db.models import F
+from django.http import Http404
 from rest_framework import generics, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 
-from core.cache_utils import increment_version
+from core.cache_utils import invalidate_on_commit
 from core.exceptions import (
     NotFoundError,
     build_success_response,
@@ -17,12 +18,19 @@ from core.exceptions import (
 from films.models import Film
 from films.serializers import FilmSerializer
 
-from .models import Spectator
+from .models import Spectator, SpectatorFavoriteFilm
+from .pagination import FavoriteFilmCursorPagination
 from .serializers import SpectatorSerializer, UserRegistrationSerializer
 
 SPECTATOR_CACHE_PREFIX = "spectators:list"
 
 
+def _ensure_film_exists(film_id) -> None:
+    """Same 404 as get_object_or_404, from an EXISTS query instead of loading the film."""
+    if not Film.objects.filter(id=film_id).exists():
+        raise Http404("No Film matches the given query.")
+
+
 class SpectatorRegistrationView(generics.CreateAPIView):
     serializer_class = UserRegistrationSerializer
     permission_classes = [permissions.AllowAny]
@@ -30,7 +38,7 @@ class SpectatorRegistrationView(generics.CreateAPIView):
     def perform_create(self, serializer):
         """Invalidate the cache after creating a spectator."""
         serializer.save()
-        increment_version(SPECTATOR_CACHE_PREFIX)
+        invalidate_on_commit(SPECTATOR_CACHE_PREFIX)
 
 
 class SpectatorViewSet(viewsets.ReadOnlyModelViewSet):
@@ -39,11 +47,7 @@ class SpectatorViewSet(viewsets.ReadOnlyModelViewSet):
     ReadOnly because spectators are created via registration.
     """
 
-    queryset = (
-        Spectator.objects.select_related("user")
-        .prefetch_related("favorite_films__authors", "favorite_films__reviews")
-        .all()
-    )
+    queryset = Spectator.objects.select_related("user").prefetch_related("favorite_films").all()
     serializer_class = SpectatorSerializer
     permission_classes = [IsAuthenticated]
 
@@ -79,7 +83,7 @@ class SpectatorViewSet(viewsets.ReadOnlyModelViewSet):
                 code="MISSING_FILM_ID",
             )
 
-        film = get_object_or_404(Film, id=film_id)
+        _ensure_film_exists(film_id)
 
         if not hasattr(request.user, "spectator_profile"):
             raise APIPermissionError(
@@ -87,7 +91,11 @@ class SpectatorViewSet(viewsets.ReadOnlyModelViewSet):
                 code="SPECTATOR_REQUIRED",
             )
 
-        request.user.spectator_profile.favorite_films.add(film)
+        # One INSERT ... ON CONFLICT DO NOTHING instead of favorite_films.add() (SELECT existing ids, then INSERT)
+        SpectatorFavoriteFilm.objects.bulk_create(
+            [SpectatorFavoriteFilm(spectator_id=request.user.spectator_profile.pk, film_id=film_id)],
+            ignore_conflicts=True,
+        )
         return build_success_response(message="Film added to favorites.")
 
     @action(
@@ -108,10 +116,14 @@ class SpectatorViewSet(viewsets.ReadOnlyModelViewSet):
                 code="MISSING_FILM_ID",
             )
 
-        film = get_object_or_404(Film, id=film_id)
-
+        deleted = 0
         if hasattr(request.user, "spectator_profile"):
-            request.user.spectator_profile.favorite_films.remove(film)
+            deleted, _ = SpectatorFavoriteFilm.objects.filter(
+                spectator_id=request.user.spectator_profile.pk, film_id=film_id
+            ).delete()
+        # A deleted row proves the film exists; otherwise check, so unknown films still get a 404
+        if not deleted:
+            _ensure_film_exists(film_id)
 
         return build_success_response(message="Film removed from favorites.")
 
@@ -120,17 +132,22 @@ class SpectatorViewSet(viewsets.ReadOnlyModelViewSet):
         methods=["get"],
         url_path="favorites",
         permission_classes=[IsAuthenticated],
+        pagination_class=FavoriteFilmCursorPagination,
     )
     def list_favorites(self, request):
         """
-        List own favorite films.
+        List own favorite films, most recently added first.
         """
         if not hasattr(request.user, "spectator_profile"):
             raise NotFoundError(
                 detail="Spectator profile not found.",
                 code="SPECTATOR_PROFILE_NOT_FOUND",
             )
-        favorites = request.user.spectator_profile.favorite_films.all()
+        favorites = FilmSerializer.setup_eager_loading(
+            Film.objects.filter(favorite_links__spectator=request.user.spectator_profile).annotate(
+                favorited_at=F("favorite_links__added_at")
+            )
+        )
 
         page = self.paginate_queryset(favorites)
         if page is not None:
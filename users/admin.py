@@ -7,7 +7,7 @@ from .models import CustomUser
 @admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
     model = CustomUser
-    fieldsets = list(UserAdmin.fieldsets or []) + [
-        ("Extra", {"fields": ("role",)}),
-    ]
-    list_display = ["username", "email", "first_name", "last_name", "role", "is_staff"]
+    fieldsets = (*(UserAdmin.fieldsets or ()), ("Extra", {"fields": ("role",)}))
+    list_display = ("username", "email", "first_name", "last_name", "role", "is_staff")
+    # Skip the unfiltered SELECT COUNT(*) the changelist runs on top of the filtered count
+    show_full_result_count = False
@@ -1,10 +1,8 @@
 import factory
-from django.contrib.auth import get_user_model
 
+from users.models import CustomUser as User
 from users.models import Role
 
-User = get_user_model()
-
 
 class UserFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -12,8 +10,8 @@ class UserFactory(factory.django.DjangoModelFactory):
 
     username = factory.Sequence(lambda n: f"user_{n}")
     email = factory.LazyAttribute(lambda o: f"{o.username}@example.com")
-    first_name = factory.Faker("first_name")
-    last_name = factory.Faker("last_name")
+    first_name = factory.Sequence(lambda n: f"First{n}")
+    last_name = factory.Sequence(lambda n: f"Last{n}")
     role = Role.SPECTATOR
 
 
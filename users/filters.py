@@ -0,0 +1,14 @@
+import django_filters
+
+from .models import CustomUser
+
+
+class UserFilter(django_filters.FilterSet):
+    """
+    Exact-match `?role=` filter, declared once rather than rebuilt per request from `filterset_fields`.
+    `?role=admin` pages are served by the user_admin_partial_idx index in cursor order.
+    """
+
+    class Meta:
+        model = CustomUser
+        fields = ["role"]
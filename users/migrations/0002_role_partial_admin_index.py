@@ -0,0 +1,26 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="role",
+            field=models.CharField(
+                choices=[("author", "Auteur"), ("spectator", "Spectateur"), ("admin", "Administrateur")],
+                default="spectator",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(condition=models.Q(("role", "admin")), fields=["id"], name="user_admin_partial_idx"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:56
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_role_partial_admin_index"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="customuser",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                condition=models.Q(("email", ""), _negated=True),
+                name="uniq_email_ci",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.5 on 2026-10-15 07:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_email_case_insensitive_unique"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="customuser",
+            constraint=models.CheckConstraint(
+                check=models.Q(("role__in", ["author", "spectator", "admin"])), name="user_role_valid"
+            ),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 
 from core.models import TimestampedModelMixin
 
@@ -21,7 +23,21 @@ class CustomUserManager(UserManager):
 class CustomUser(TimestampedModelMixin, AbstractUser):
     objects: CustomUserManager = CustomUserManager()  # type: ignore[misc]
 
-    role = models.CharField(max_length=20, choices=Role.choices, default=Role.SPECTATOR, db_index=True)
+    # No plain index on role: three values, nearly every row is a spectator, so the planner would not use it
+    role = models.CharField(max_length=20, choices=Role.choices, default=Role.SPECTATOR)
+
+    class Meta:
+        indexes = [
+            # Admins are a handful of rows: only they enter this index, spectator writes do not maintain it
+            models.Index(fields=["id"], condition=Q(role=Role.ADMIN), name="user_admin_partial_idx"),
+        ]
+        constraints = [
+            # Case-insensitive uniqueness; its unique index on lower(email) also serves exact email lookups.
+            # Email stays optional (AbstractUser), so blank addresses are left out.
+            models.UniqueConstraint(Lower("email"), condition=~Q(email=""), name="uniq_email_ci"),
+            # Choices are only checked by forms and serializers; raw writes and bulk_create go through here
+            models.CheckConstraint(check=Q(role__in=Role.values), name="user_role_valid"),
+        ]
 
     def __str__(self):
         return self.username
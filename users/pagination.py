@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Keyset pagination of users, newest first.
+    Pages are read from the primary key index after the cursor: no COUNT(*) over the table and no OFFSET scan.
+    """
+
+    ordering = "-id"
@@ -1,7 +1,9 @@
-from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-User = get_user_model()
+from .models import CustomUser as User
+
+# Shared formatter; kept at module level so it is not collected as a serializer field
+_DATETIME_FIELD = serializers.DateTimeField()
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -18,3 +20,13 @@ class UserSerializer(serializers.ModelSerializer):
             "date_joined",
         ]
         read_only_fields = ["role", "date_joined"]
+
+
+class UserListSerializer(UserSerializer):
+    """
+    UserSerializer for the list action, fed with `.values(*UserSerializer.Meta.fields)` rows.
+    Same output, without model instances or the per-field dispatch: only date_joined needs formatting.
+    """
+
+    def to_representation(self, instance):
+        return {**instance, "date_joined": _DATETIME_FIELD.to_representation(instance["date_joined"])}
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache_utils import invalidate_on_commit
+
+from .models import CustomUser as User
+from .views import USER_CACHE_PREFIX
+
+# Written by every login (update_last_login) and not rendered in the user list
+_UNLISTED_FIELDS = frozenset({"last_login"})
+
+
+@receiver(post_save, sender=User, dispatch_uid="users_user_saved")
+def user_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= _UNLISTED_FIELDS:
+        return
+    invalidate_on_commit(USER_CACHE_PREFIX)
+
+
+@receiver(post_delete, sender=User, dispatch_uid="users_user_deleted")
+def user_deleted(sender, instance, **kwargs):
+    invalidate_on_commit(USER_CACHE_PREFIX)
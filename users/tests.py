@@ -1,13 +1,21 @@
+from unittest.mock import patch
+
 import pytest
-from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from rest_framework import status
 
 from spectators.factories import SpectatorFactory
 from users.factories import AdminUserFactory
+from users.models import CustomUser as User
 from users.models import Role
+from users.pagination import UserCursorPagination
+from users.serializers import UserListSerializer, UserSerializer
+from users.views import USER_CACHE_PREFIX
 
-User = get_user_model()
+# Resolved once at import rather than in every test
+USER_LIST_URL = reverse("customuser-list")
 
 
 @pytest.mark.django_db
@@ -22,30 +30,92 @@ class TestUsersManagers:
         assert admin_user.role == Role.ADMIN
         assert str(admin_user) == "superadmin"
 
+    def test_role_restricted_to_choices_in_database(self):
+        user = User.objects.create_user(username="someone")
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            User.objects.filter(pk=user.pk).update(role="superhero")
+
+    def test_email_unique_case_insensitively_when_set(self):
+        User.objects.create_user(username="first", email="same@example.com")
+        User.objects.create_user(username="blank_1")
+        User.objects.create_user(username="blank_2")
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            User.objects.create_user(username="second", email="SAME@example.com")
+
 
 @pytest.mark.django_db
 class TestUserViewSet:
 
-    def test_list_users_admin(self, api_client):
-        admin = AdminUserFactory()
+    def test_list_users_admin(self, admin_api_client):
         SpectatorFactory()
-        url = reverse("customuser-list")
+        url = USER_LIST_URL
 
-        api_client.force_authenticate(user=admin)
-        response = api_client.get(url)
+        response = admin_api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         # Admin + Spectator = 2 users
         assert len(response.data["results"]) >= 2
 
-    def test_list_users_spectator(self, api_client):
+    def test_list_users_pages_by_cursor_without_count(self, api_client, monkeypatch, django_assert_num_queries):
+        monkeypatch.setattr(UserCursorPagination, "page_size", 2)
+        admin = AdminUserFactory()
+        spectators = SpectatorFactory.create_batch_bulk(2)
+        api_client.force_authenticate(user=admin)
+
+        with django_assert_num_queries(1):
+            first = api_client.get(USER_LIST_URL)
+        second = api_client.get(first.data["next"])
+
+        assert "count" not in first.data
+        assert set(first.data["results"][0]) == set(UserSerializer.Meta.fields)
+        assert [user["id"] for user in first.data["results"]] == [spectators[1].user_id, spectators[0].user_id]
+        assert [user["id"] for user in second.data["results"]] == [admin.id]
+        assert second.data["next"] is None
+
+    def test_list_users_filter_by_role(self, api_client):
+        admin = AdminUserFactory()
+        SpectatorFactory()
+        api_client.force_authenticate(user=admin)
+
+        admins = api_client.get(USER_LIST_URL, {"role": Role.ADMIN})
+        invalid = api_client.get(USER_LIST_URL, {"role": "superhero"})
+
+        assert [user["id"] for user in admins.data["results"]] == [admin.id]
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_user_list_serializer_matches_user_serializer(self):
+        AdminUserFactory()
+        SpectatorFactory()
+        users = User.objects.order_by("pk")
+
+        rows = UserListSerializer(users.values(*UserSerializer.Meta.fields), many=True).data
+        assert rows == UserSerializer(users, many=True).data
+
+    @patch("users.signals.invalidate_on_commit")
+    def test_user_writes_invalidate_list(self, mock_invalidate):
+        user = AdminUserFactory()
+        mock_invalidate.assert_called_once_with(USER_CACHE_PREFIX)
+
+        mock_invalidate.reset_mock()
+        update_last_login(None, user)
+        mock_invalidate.assert_not_called()
+
+        user.save(update_fields=["email"])
+        user.delete()
+        assert mock_invalidate.call_count == 2
+
+    def test_list_users_spectator(self, api_client, django_assert_num_queries):
         spectator = SpectatorFactory()
-        url = reverse("customuser-list")
+        url = USER_LIST_URL
 
         api_client.force_authenticate(user=spectator.user)
-        response = api_client.get(url)
+        # Permissions are checked in initial(), before the list touches the database
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_list_users_anonymous(self, api_client):
-        url = reverse("customuser-list")
+        url = USER_LIST_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
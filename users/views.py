@@ -1,9 +1,19 @@
-from django.contrib.auth import get_user_model
+from functools import partial
+
 from rest_framework import permissions, viewsets
 
-from .serializers import UserSerializer
+from core.cache_utils import cached_list
+
+from .filters import UserFilter
+from .models import CustomUser as User
+from .pagination import UserCursorPagination
+from .serializers import UserListSerializer, UserSerializer
 
-User = get_user_model()
+# Invalidated by users.signals on every user write, whatever the code path
+USER_CACHE_PREFIX = "users:list"
+CACHE_TIMEOUT = 60 * 15  # 15 minutes
+# Query parameters the list view actually reads; anything else shares the cache entry
+USER_CACHE_PARAMS = frozenset({"cursor", "role"})
 
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
@@ -12,6 +22,32 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     ReadOnly because user creation is done via spectator registration.
     """
 
-    queryset = User.objects.all()
+    # Read-only: load just the columns UserSerializer renders (no password hash, permissions flags or timestamps)
+    queryset = User.objects.only(
+        "id", "username", "email", "first_name", "last_name", "role", "is_active", "date_joined"
+    )
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = UserCursorPagination
+    filterset_class = UserFilter
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # Plain rows for UserListSerializer; the cursor paginator reads "id" from dicts as well
+            return queryset.values(*UserSerializer.Meta.fields)
+        return queryset
+
+    def get_serializer_class(self):
+        return UserListSerializer if self.action == "list" else UserSerializer
+
+    def list(self, request, *args, **kwargs):
+        """List users from the versioned cache of rendered JSON, with ETag revalidation."""
+        return cached_list(
+            USER_CACHE_PREFIX,
+            request,
+            partial(super().list, request, *args, **kwargs),
+            self.get_renderer_context(),
+            CACHE_TIMEOUT,
+            USER_CACHE_PARAMS,
+        )